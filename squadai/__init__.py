@@ -1,11 +1,40 @@
+import importlib
 import warnings
+from typing import TYPE_CHECKING, Any, List
+
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic._internal._config")
 
-from squadai.agent import Agent
-from squadai.squad import Squad
-from squadai.pipeline import Pipeline
-from squadai.process import Process
-from squadai.task import Task
+if TYPE_CHECKING:
+    from squadai.agent import Agent
+    from squadai.llm_pool import LLMPool, LLMPoolEntry
+    from squadai.pipeline import Pipeline
+    from squadai.process import Process
+    from squadai.squad import Squad
+    from squadai.task import Task
+
+# Public names are imported on first access (PEP 562) so `import squadai` stays
+# cheap and langchain and the LLM backends only load when they are used.
+_LAZY_IMPORTS = {
+    "Agent": "squadai.agent",
+    "LLMPool": "squadai.llm_pool",
+    "LLMPoolEntry": "squadai.llm_pool",
+    "Squad": "squadai.squad",
+    "Pipeline": "squadai.pipeline",
+    "Process": "squadai.process",
+    "Task": "squadai.task",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
 
 
-__all__ = ["Agent", "Squad", "Process", "Task", "Pipeline"]
+__all__ = ["Agent", "Squad", "Process", "Task", "Pipeline", "LLMPool", "LLMPoolEntry"]
@@ -1,22 +1,46 @@
-import os
-from inspect import signature
-from typing import Any, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Set, Tuple
 
 from langchain.agents.agent import RunnableAgent
 from langchain.agents.tools import BaseTool
 from langchain.agents.tools import tool as LangChainTool
 from langchain_core.agents import AgentAction
 from langchain_core.callbacks import BaseCallbackHandler
-from langchain_groq import ChatGroq
 from pydantic import Field, InstanceOf, PrivateAttr, model_validator
 from dotenv import load_dotenv
 
-from squadai.agents import CacheHandler, SquadAgentExecutor, SquadAgentParser
+from squadai.agents import (
+    CacheHandler,
+    SquadAgentExecutor,
+    SquadAgentParser,
+    ToolsHandler,
+)
 from squadai.agents.agent_builder.base_agent import BaseAgent
+from squadai.agents.context_window import (
+    ContextWindowManager,
+    ContextWindowPolicy,
+    approximate_token_count,
+)
+from squadai.agents.cache.llm_response_cache import (
+    CachedLLM,
+    LLMResponseCache,
+    default_llm_response_cache,
+)
+from squadai.agents.rate_limit_retry import RateLimitRetryLLM, is_rate_limit_error
+from squadai.llm_pool import default_llm
 from squadai.memory.contextual.contextual_memory import ContextualMemory
+from squadai.squads.squad_stream import SquadStreamTokenHandler
 from squadai.tools.agent_tools import AgentTools
+from squadai.tools.tool_descriptor import tool_descriptor
 from squadai.utilities import Converter, Prompts
-from squadai.utilities.constants import TRAINED_AGENTS_DATA_FILE, TRAINING_DATA_FILE
+from squadai.utilities.constants import (
+    MAX_CACHED_AGENT_EXECUTORS,
+    TRAINED_AGENTS_DATA_FILE,
+    TRAINING_DATA_FILE,
+)
 from squadai.utilities.token_counter_callback import TokenCalcHandler
 from squadai.utilities.training_handler import SquadTrainingHandler
 
@@ -59,9 +83,20 @@ class Agent(BaseAgent):
             tools: Tools at agents disposal
             step_callback: Callback to be executed after each step of the agent execution.
             callbacks: A list of callback functions from the langchain library that are triggered during the agent's execution process
+            context_window_policy: How the scratchpad is made to fit the context window: truncate, summarize or drop the oldest observations.
+            max_context_tokens: Token budget of the prompt, defaults to the model context window minus the completion tokens.
+            max_parallel_tools: Maximum number of tool actions of one step run at the same time.
+            tool_timeout: Seconds a tool has to answer before the agent moves on, unless the tool sets its own timeout.
     """
 
     _times_executed: int = PrivateAttr(default=0)
+    # Executors by key, each with the objects its key holds the ids of
+    _agent_executors: "OrderedDict[Tuple[Any, ...], Tuple[Tuple[Any, ...], SquadAgentExecutor]]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    # Ids of the executors running a task, a concurrent task of the agent gets its own
+    _running_agent_executors: Set[int] = PrivateAttr(default_factory=set)
+    _agent_executors_lock: ClassVar[threading.Lock] = threading.Lock()
     max_execution_time: Optional[int] = Field(
         default=None,
         description="Maximum execution time for an agent to execute a task",
@@ -76,9 +111,7 @@ class Agent(BaseAgent):
         description="Callback to be executed after each step of the agent execution.",
     )
     llm: Any = Field(
-        default_factory=lambda: ChatGroq(
-            model=os.environ.get("GROQ_MODEL_NAME")
-        ),
+        default_factory=default_llm,
         description="Language model that will run the agent.",
     )
     function_calling_llm: Optional[Any] = Field(
@@ -106,17 +139,28 @@ class Agent(BaseAgent):
         default=2,
         description="Maximum number of retries for an agent to execute a task when an error occurs.",
     )
+    context_window_policy: Optional[ContextWindowPolicy] = Field(
+        default=None,
+        description="How the scratchpad is made to fit the context window, defaults to SQUADAI_CONTEXT_POLICY or truncate.",
+    )
+    max_context_tokens: Optional[int] = Field(
+        default=None,
+        description="Token budget of the prompt, defaults to the model context window minus the completion tokens.",
+    )
+    max_parallel_tools: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tool actions of one step run at the same time, defaults to SQUADAI_MAX_PARALLEL_TOOLS or 4.",
+    )
+    tool_timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds a tool has to answer before the agent moves on, defaults to SQUADAI_TOOL_TIMEOUT or no timeout.",
+    )
 
     @model_validator(mode="after")
     def post_init_setup(self):
         self.agent_ops_agent_name = self.role
 
-        # Different llms store the model name in different attributes
-        model_name = getattr(self.llm, "model_name", None) or getattr(
-            self.llm, "deployment_name", None
-        )
-
-        if model_name:
+        if model_name := self._llm_model_name():
             self._setup_llm_callbacks(model_name)
 
         if not self.agent_executor:
@@ -124,6 +168,28 @@ class Agent(BaseAgent):
 
         return self
 
+    def _llm_model_name(self) -> Optional[str]:
+        # Different llms store the model name in different attributes
+        return getattr(self.llm, "model_name", None) or getattr(
+            self.llm, "deployment_name", None
+        )
+
+    def _reset_run_state(self) -> None:
+        super()._reset_run_state()
+        self._times_executed = 0
+        self._agent_executors = OrderedDict()
+        self._running_agent_executors = set()
+        self.tools_results = []
+
+        if model_name := self._llm_model_name():
+            self._setup_llm_callbacks(model_name)
+
+        # The executor is built by the squad on kickoff, or on the first task execution
+        self.cache_handler = CacheHandler()
+        self.tools_handler = ToolsHandler()
+        if self.cache:
+            self.tools_handler.cache = self.cache_handler
+
     def _setup_llm_callbacks(self, model_name: str):
         token_handler = TokenCalcHandler(model_name, self._token_process)
 
@@ -157,6 +223,78 @@ class Agent(BaseAgent):
         Returns:
             Output of the agent
         """
+        task_prompt, agent_executor = self._prepare_task_execution(task, context, tools)
+
+        try:
+            with self._running_agent_executor(agent_executor):
+                result = agent_executor.invoke(
+                    {
+                        "input": task_prompt,
+                        "tool_names": agent_executor.tools_names,
+                        "tools": agent_executor.tools_description,
+                    },
+                    config=self._stream_config(task),
+                )["output"]
+        except Exception as e:
+            self._times_executed += 1
+            # Rate limits are already retried per LLM call, re-running the task
+            # would only throw its intermediate steps away
+            if is_rate_limit_error(e) or self._times_executed > self.max_retry_limit:
+                raise e
+            result = self.execute_task(task, context, tools)
+
+        return self._finalize_task_execution(result)
+
+    async def aexecute_task(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> str:
+        """Execute a task with the agent on the running event loop.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            Output of the agent
+        """
+        task_prompt, agent_executor = self._prepare_task_execution(task, context, tools)
+
+        try:
+            with self._running_agent_executor(agent_executor):
+                result = (
+                    await agent_executor.ainvoke(
+                        {
+                            "input": task_prompt,
+                            "tool_names": agent_executor.tools_names,
+                            "tools": agent_executor.tools_description,
+                        },
+                        config=self._stream_config(task),
+                    )
+                )["output"]
+        except Exception as e:
+            self._times_executed += 1
+            # Rate limits are already retried per LLM call, re-running the task
+            # would only throw its intermediate steps away
+            if is_rate_limit_error(e) or self._times_executed > self.max_retry_limit:
+                raise e
+            result = await self.aexecute_task(task, context, tools)
+
+        return self._finalize_task_execution(result)
+
+    def _prepare_task_execution(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> Tuple[str, SquadAgentExecutor]:
+        """Build the task prompt and set up the agent executor for the task.
+
+        The executor is claimed for the task, release it once the task is done.
+        """
         if self.tools_handler:
             self.tools_handler.last_used_tool = {}  # type: ignore # Incompatible types in assignment (expression has type "dict[Never, Never]", variable has type "ToolCalling")
 
@@ -177,37 +315,40 @@ class Agent(BaseAgent):
             if memory.strip() != "":
                 task_prompt += self.i18n.slice("memory").format(memory=memory)
 
-        tools = tools or self.tools or []
-        parsed_tools = self._parse_tools(tools)
-        self.create_agent_executor(tools=tools)
-        self.agent_executor.tools = parsed_tools
-        self.agent_executor.task = task
-
-        self.agent_executor.tools_description = self._render_text_description_and_args(
-            parsed_tools
-        )
-        self.agent_executor.tools_names = self.__tools_names(parsed_tools)
-
         if self.squad and self.squad._train:
             task_prompt = self._training_handler(task_prompt=task_prompt)
         else:
             task_prompt = self._use_trained_data(task_prompt=task_prompt)
 
+        tools = tools or self.tools or []
+        agent_executor = self._checkout_agent_executor(tools, claim=True)
         try:
-            result = self.agent_executor.invoke(
-                {
-                    "input": task_prompt,
-                    "tool_names": self.agent_executor.tools_names,
-                    "tools": self.agent_executor.tools_description,
-                }
-            )["output"]
-        except Exception as e:
-            self._times_executed += 1
-            if self._times_executed > self.max_retry_limit:
-                raise e
-            result = self.execute_task(task, context, tools)
+            parsed_tools = agent_executor.tools
+            agent_executor.task = task
+            agent_executor.tools_description = (
+                self._render_text_description_and_args(parsed_tools)
+            )
+            agent_executor.tools_names = self.__tools_names(parsed_tools)
+        except BaseException:
+            self._release_agent_executor(agent_executor)
+            raise
+        self.agent_executor = agent_executor
+
+        return task_prompt, agent_executor
+
+    def _stream_config(self, task: Any) -> Optional[Dict[str, Any]]:
+        """Run config forwarding the LLM tokens when the squad is kicked off in streaming mode."""
+        emit = getattr(self.squad, "_stream_emitter", None)
+        if emit is None:
+            return None
+        token_handler = SquadStreamTokenHandler(
+            emit, self.role, getattr(task, "description", None)
+        )
+        return {"callbacks": [token_handler]}
 
-        if self.max_rpm and self._rpm_controller:
+    def _finalize_task_execution(self, result: str) -> str:
+        """Apply the post-execution bookkeeping shared by sync and async execution."""
+        if self._rpm_controller:
             self._rpm_controller.stop_rpm_counter()
 
         # If there was any tool in self.tools_results that had result_as_answer
@@ -235,17 +376,122 @@ class Agent(BaseAgent):
     def create_agent_executor(self, tools=None) -> None:
         """Create an agent executor for the agent.
 
+        Executors are cached on the agent: the runnable chain only depends on the
+        agent settings and on whether it has tools, so a matching executor is
+        reused and only its per-task state is swapped.
+
         Returns:
             An instance of the SquadAgentExecutor class.
         """
-        tools = tools or self.tools or []
+        self.agent_executor = self._checkout_agent_executor(tools or self.tools or [])
+
+    def _checkout_agent_executor(
+        self, tools: List[Any], claim: bool = False
+    ) -> SquadAgentExecutor:
+        """Return the cached executor matching the agent settings, with its per-task state reset.
+
+        An executor holds the state of the task it runs, so while one is claimed
+        by a running task, concurrent tasks of the agent get a new one.
+
+        Args:
+            tools: Tools of the task.
+            claim: Claim the executor for a task, until `_release_agent_executor`.
+        """
+        keyed_objects = self._agent_executor_keyed_objects()
+        key = self._agent_executor_key(tools, keyed_objects)
+        with self._agent_executors_lock:
+            cached = self._agent_executors.get(key)
+            agent_executor = cached[1] if cached is not None else None
+            if agent_executor is not None:
+                self._agent_executors.move_to_end(key)
+                if id(agent_executor) in self._running_agent_executors:
+                    agent_executor = None
+                elif claim:
+                    self._running_agent_executors.add(id(agent_executor))
+
+        if agent_executor is None:
+            agent_executor = self._build_agent_executor(tools)
+            with self._agent_executors_lock:
+                self._agent_executors[key] = (keyed_objects, agent_executor)
+                if len(self._agent_executors) > MAX_CACHED_AGENT_EXECUTORS:
+                    self._agent_executors.popitem(last=False)
+                if claim:
+                    self._running_agent_executors.add(id(agent_executor))
+
+        agent_executor.tools = self._parse_tools(tools)
+        agent_executor.original_tools = tools
+        agent_executor.task = None
+        agent_executor.iterations = 0
+        agent_executor.have_forced_answer = False
+        agent_executor.should_ask_for_human_input = False
+        return agent_executor
+
+    @contextmanager
+    def _running_agent_executor(
+        self, agent_executor: SquadAgentExecutor
+    ) -> Iterator[SquadAgentExecutor]:
+        """Release the executor claimed for a task once the task is done."""
+        try:
+            yield agent_executor
+        finally:
+            self._release_agent_executor(agent_executor)
+
+    def _release_agent_executor(self, agent_executor: SquadAgentExecutor) -> None:
+        with self._agent_executors_lock:
+            self._running_agent_executors.discard(id(agent_executor))
+
+    def _agent_executor_keyed_objects(self) -> Tuple[Any, ...]:
+        """Objects the executor is keyed by identity on."""
+        return (
+            self.llm,
+            self.i18n,
+            self.squad,
+            self.tools_handler,
+            self._rpm_controller,
+            self.step_callback,
+            self.function_calling_llm,
+            self._llm_response_cache(),
+            *(self.callbacks or []),
+        )
 
+    def _agent_executor_key(
+        self, tools: List[Any], keyed_objects: Tuple[Any, ...]
+    ) -> Tuple[Any, ...]:
+        # The cache entry holds the keyed objects, so their ids are not reused while it lives
+        return (
+            bool(tools),
+            self.role,
+            self.goal,
+            self.backstory,
+            self.system_template,
+            self.prompt_template,
+            self.response_template,
+            self.verbose,
+            self.max_iter,
+            self.max_execution_time,
+            self.max_tokens,
+            self.context_window_policy,
+            self.max_context_tokens,
+            self.max_parallel_tools,
+            self.tool_timeout,
+            tuple(id(keyed_object) for keyed_object in keyed_objects),
+        )
+
+    def _llm_response_cache(self) -> Optional[LLMResponseCache]:
+        llm_cache = getattr(self.squad, "llm_cache", None)
+        if llm_cache is True:
+            return default_llm_response_cache()
+        return llm_cache or None
+
+    def _build_agent_executor(self, tools: List[Any]) -> SquadAgentExecutor:
         agent_args = {
             "input": lambda x: x["input"],
             "tools": lambda x: x["tools"],
             "tool_names": lambda x: x["tool_names"],
-            "agent_scratchpad": lambda x: self.format_log_to_str(
-                x["intermediate_steps"]
+            "agent_scratchpad": lambda x: (
+                x["scratchpad"].render(x["intermediate_steps"])
+                if "scratchpad" in x
+                else self.format_log_to_str(x["intermediate_steps"])
             ),
         }
 
@@ -260,17 +506,33 @@ class Agent(BaseAgent):
             "handle_parsing_errors": True,
             "max_iterations": self.max_iter,
             "max_execution_time": self.max_execution_time,
+            "max_parallel_tools": self.max_parallel_tools,
+            "tool_timeout": self.tool_timeout,
             "step_callback": self.step_callback,
             "tools_handler": self.tools_handler,
             "function_calling_llm": self.function_calling_llm,
             "callbacks": self.callbacks,
             "max_tokens": self.max_tokens,
+            "context_window": ContextWindowManager(
+                llm=self.llm,
+                model_name=self._llm_model_name(),
+                max_tokens=self.max_context_tokens,
+                policy=self.context_window_policy,
+                reserved_tokens=(self.max_tokens or 1024)
+                + approximate_token_count(self.role + self.goal + self.backstory),
+            ),
         }
 
         if self._rpm_controller:
-            executor_args["request_within_rpm_limit"] = (
-                self._rpm_controller.check_or_wait
+            executor_args["request_within_rpm_limit"] = partial(
+                self._rpm_controller.check_or_wait,
+                on_throttled=self._token_process.sum_throttled,
+            )
+            executor_args["arequest_within_rpm_limit"] = partial(
+                self._rpm_controller.acheck_or_wait,
+                on_throttled=self._token_process.sum_throttled,
             )
+            executor_args["record_rpm_tokens"] = self._rpm_controller.record_tokens
 
         prompt = Prompts(
             i18n=self.i18n,
@@ -293,10 +555,24 @@ class Agent(BaseAgent):
                 self.response_template.split("{{ .Response }}")[1].strip()
             )
 
-        bind = self.llm.bind(stop=stop_words)
+        bind = RateLimitRetryLLM(
+            self.llm.bind(stop=stop_words),
+            rate_limiter=self._rpm_controller,
+            logger=self._logger,
+            on_throttled=self._token_process.sum_throttled,
+        )
+        if llm_cache := self._llm_response_cache():
+            bind = CachedLLM(
+                bind,
+                llm_cache,
+                model=self._llm_model_name() or type(self.llm).__name__,
+                stop=stop_words,
+                temperature=getattr(self.llm, "temperature", None),
+                token_process=self._token_process,
+            )
 
         inner_agent = agent_args | execution_prompt | bind | SquadAgentParser(agent=self)
-        self.agent_executor = SquadAgentExecutor(
+        return SquadAgentExecutor(
             agent=RunnableAgent(runnable=inner_agent), **executor_args
         )
 
@@ -391,21 +667,7 @@ class Agent(BaseAgent):
             calculator: This tool is used for math, \
     args: {"expression": {"type": "string"}}
         """
-        tool_strings = []
-        for tool in tools:
-            args_schema = str(tool.args)
-            if hasattr(tool, "func") and tool.func:
-                sig = signature(tool.func)
-                description = (
-                    f"Tool Name: {tool.name}{sig}\nTool Description: {tool.description}"
-                )
-            else:
-                description = (
-                    f"Tool Name: {tool.name}\nTool Description: {tool.description}"
-                )
-            tool_strings.append(f"{description}\nTool Arguments: {args_schema}")
-
-        return "\n".join(tool_strings)
+        return "\n".join(tool_descriptor(tool).text for tool in tools)
 
     @staticmethod
     def __tools_names(tools) -> str:
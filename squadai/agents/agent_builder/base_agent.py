@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from copy import copy as shallow_copy
@@ -36,6 +37,7 @@ class BaseAgent(ABC, BaseModel):
         config (Optional[Dict[str, Any]]): Configuration for the agent.
         verbose (bool): Verbose mode for the Agent Execution.
         max_rpm (Optional[int]): Maximum number of requests per minute for the agent execution.
+        max_tpm (Optional[int]): Maximum number of LLM tokens per minute for the agent execution.
         allow_delegation (bool): Allow delegation of tasks to agents.
         tools (Optional[List[Any]]): Tools at the agent's disposal.
         max_iter (Optional[int]): Maximum iterations for an agent to execute a task.
@@ -51,6 +53,8 @@ class BaseAgent(ABC, BaseModel):
     Methods:
         execute_task(task: Any, context: Optional[str] = None, tools: Optional[List[Any]] = None) -> str:
             Abstract method to execute a task.
+        aexecute_task(task: Any, context: Optional[str] = None, tools: Optional[List[Any]] = None) -> str:
+            Execute a task asynchronously, runs execute_task in a thread unless overridden.
         create_agent_executor(tools=None) -> None:
             Abstract method to create an agent executor.
         _parse_tools(tools: List[Any]) -> List[Any]:
@@ -101,6 +105,10 @@ class BaseAgent(ABC, BaseModel):
         default=None,
         description="Maximum number of requests per minute for the agent execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of LLM tokens per minute for the agent execution to be respected.",
+    )
     allow_delegation: bool = Field(
         default=True, description="Allow delegation of tasks to agents"
     )
@@ -144,9 +152,9 @@ class BaseAgent(ABC, BaseModel):
 
         # Set private attributes
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
             )
         if not self._token_process:
             self._token_process = TokenProcess()
@@ -165,9 +173,9 @@ class BaseAgent(ABC, BaseModel):
     def set_private_attrs(self):
         """Set private attributes."""
         self._logger = Logger(verbose=self.verbose)
-        if self.max_rpm and not self._rpm_controller:
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
             )
         if not self._token_process:
             self._token_process = TokenProcess()
@@ -187,6 +195,14 @@ class BaseAgent(ABC, BaseModel):
     ) -> str:
         pass
 
+    async def aexecute_task(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> str:
+        return await asyncio.to_thread(self.execute_task, task, context, tools)
+
     @abstractmethod
     def create_agent_executor(self, tools=None) -> None:
         pass
@@ -208,30 +224,43 @@ class BaseAgent(ABC, BaseModel):
         pass
 
     def copy(self: T) -> T:  # type: ignore # Signature of "copy" incompatible with supertype "BaseModel"
-        """Create a deep copy of the Agent."""
-        exclude = {
-            "id",
-            "_logger",
-            "_rpm_controller",
-            "_request_within_rpm_limit",
-            "_token_process",
-            "agent_executor",
-            "tools",
-            "tools_handler",
-            "cache_handler",
-            "llm",
-        }
+        """Create a copy of the Agent for a new run.
 
+        The copy shares the agent configuration with the original and only
+        recreates the state a run mutates, without running the validators again.
+        """
         # Copy llm and clear callbacks
         existing_llm = shallow_copy(self.llm)
         existing_llm.callbacks = []
-        copied_data = self.model_dump(exclude=exclude)
-        copied_data = {k: v for k, v in copied_data.items() if v is not None}
 
-        copied_agent = type(self)(**copied_data, llm=existing_llm, tools=self.tools)
+        copied_agent = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "llm": existing_llm,
+                "tools": list(self.tools) if self.tools is not None else None,
+                "agent_executor": None,
+                "tools_handler": None,
+                "cache_handler": None,
+                "formatting_errors": 0,
+            }
+        )
+        copied_agent._reset_run_state()
 
         return copied_agent
 
+    def _reset_run_state(self) -> None:
+        """Recreate the state of a copied agent that must not be shared with the original."""
+        self._logger = Logger(verbose=self.verbose)
+        self._rpm_controller = (
+            RPMController(
+                max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
+            )
+            if self.max_rpm or self.max_tpm
+            else None
+        )
+        self._request_within_rpm_limit = None
+        self._token_process = TokenProcess()
+
     def interpolate_inputs(self, inputs: Dict[str, Any]) -> None:
         """Interpolate inputs into the agent description and backstory."""
         if self._original_role is None:
@@ -1,8 +1,10 @@
 import time
-from typing import TYPE_CHECKING, Optional
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional
 
 from squadai.memory.entity.entity_memory_item import EntityMemoryItem
 from squadai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from squadai.memory.memory_worker import default_memory_worker
 from squadai.utilities.converter import ConverterError
 from squadai.utilities.evaluators.task_evaluator import TaskEvaluator
 from squadai.utilities import I18N
@@ -14,6 +16,15 @@ if TYPE_CHECKING:
     from squadai.agents.agent_builder.base_agent import BaseAgent
 
 
+class LongTermMemoryJob(NamedTuple):
+    """A finished task waiting for its long-term memory to be created."""
+
+    squad: Any
+    agent: Any
+    task: Any
+    output: str
+
+
 class SquadAgentExecutorMixin:
     squad: Optional["Squad"]
     squad_agent: Optional["BaseAgent"]
@@ -31,11 +42,17 @@ class SquadAgentExecutorMixin:
 
     def _create_short_term_memory(self, output) -> None:
         """Create and save a short-term memory item if conditions are met."""
+        # A step giving several actions saves them as one item
+        log = (
+            "\n".join(action.log for action in output)
+            if isinstance(output, list)
+            else output.log
+        )
         if (
             self.squad
             and self.squad_agent
             and self.task
-            and "Action: Delegate work to coworker" not in output.log
+            and "Action: Delegate work to coworker" not in log
         ):
             try:
                 if (
@@ -43,7 +60,7 @@ class SquadAgentExecutorMixin:
                     and self.squad._short_term_memory
                 ):
                     self.squad._short_term_memory.save(
-                        value=output.log,
+                        value=log,
                         metadata={
                             "observation": self.task.description,
                         },
@@ -53,52 +70,93 @@ class SquadAgentExecutorMixin:
                 print(f"Failed to add to short term memory: {e}")
                 pass
 
-    def _create_long_term_memory(self, output) -> None:
-        """Create and save long-term and entity memory items based on evaluation."""
-        if (
-            self.squad
-            and self.squad.memory
-            and self.squad._long_term_memory
-            and self.squad._entity_memory
-            and self.task
-            and self.squad_agent
-        ):
+    def _schedule_long_term_memory(self, output) -> None:
+        """Queue the long-term memory creation on the background memory worker."""
+        if not (self.squad and self.squad.memory):
+            return
+        jobs = self.squad._memory_jobs
+        job = default_memory_worker().submit_batched(
+            self._create_long_term_memories,
+            LongTermMemoryJob(self.squad, self.squad_agent, self.task, output.log),
+        )
+        jobs.append(job)
+        # Finished jobs drop out on their own so squads that never flush don't keep them.
+        job.add_done_callback(lambda done: self._discard_memory_job(jobs, done))
+
+    @staticmethod
+    def _discard_memory_job(jobs: List[Future], job: Future) -> None:
+        try:
+            jobs.remove(job)
+        except ValueError:
+            pass
+
+    @staticmethod
+    def _create_long_term_memories(jobs: List[LongTermMemoryJob]) -> List[None]:
+        """Create and save the long-term and entity memory items of a batch of tasks.
+
+        The tasks evaluated by a same LLM are evaluated with one call, and the
+        long-term memory items of a same squad are saved in one transaction.
+        """
+        by_llm: Dict[int, List[LongTermMemoryJob]] = {}
+        for job in jobs:
+            if (
+                job.squad
+                and job.squad.memory
+                and job.squad._long_term_memory
+                and job.squad._entity_memory
+                and job.task
+                and job.agent
+            ):
+                by_llm.setdefault(id(job.agent.llm), []).append(job)
+
+        by_memory: Dict[int, List[LongTermMemoryItem]] = {}
+        memories: Dict[int, Any] = {}
+        for group in by_llm.values():
             try:
-                ltm_agent = TaskEvaluator(self.squad_agent)
-                evaluation = ltm_agent.evaluate(self.task, output.log)
-
-                if isinstance(evaluation, ConverterError):
-                    return
-
-                long_term_memory = LongTermMemoryItem(
-                    task=self.task.description,
-                    agent=self.squad_agent.role,
-                    quality=evaluation.quality,
-                    datetime=str(time.time()),
-                    expected_output=self.task.expected_output,
-                    metadata={
-                        "suggestions": evaluation.suggestions,
-                        "quality": evaluation.quality,
-                    },
+                evaluations = TaskEvaluator(group[0].agent).evaluate_many(
+                    [(job.task, job.output) for job in group]
                 )
-                self.squad._long_term_memory.save(long_term_memory)
-
-                for entity in evaluation.entities:
-                    entity_memory = EntityMemoryItem(
-                        name=entity.name,
-                        type=entity.type,
-                        description=entity.description,
-                        relationships="\n".join(
-                            [f"- {r}" for r in entity.relationships]
-                        ),
+                for job, evaluation in zip(group, evaluations):
+                    if isinstance(evaluation, ConverterError):
+                        continue
+
+                    long_term_memory = job.squad._long_term_memory
+                    memories[id(long_term_memory)] = long_term_memory
+                    by_memory.setdefault(id(long_term_memory), []).append(
+                        LongTermMemoryItem(
+                            task=job.task.description,
+                            agent=job.agent.role,
+                            quality=evaluation.quality,
+                            datetime=str(time.time()),
+                            expected_output=job.task.expected_output,
+                            metadata={
+                                "suggestions": evaluation.suggestions,
+                                "quality": evaluation.quality,
+                            },
+                        )
                     )
-                    self.squad._entity_memory.save(entity_memory)
+
+                    for entity in evaluation.entities:
+                        entity_memory = EntityMemoryItem(
+                            name=entity.name,
+                            type=entity.type,
+                            description=entity.description,
+                            relationships="\n".join(
+                                [f"- {r}" for r in entity.relationships]
+                            ),
+                        )
+                        job.squad._entity_memory.save(entity_memory)
             except AttributeError as e:
                 print(f"Missing attributes for long term memory: {e}")
-                pass
             except Exception as e:
                 print(f"Failed to add to long term memory: {e}")
-                pass
+
+        for key, items in by_memory.items():
+            try:
+                memories[key].save_many(items)
+            except Exception as e:
+                print(f"Failed to add to long term memory: {e}")
+        return [None] * len(jobs)
 
     def _ask_human_input(self, final_answer: dict) -> str:
         """Prompt human input for final decision making."""
@@ -41,10 +41,42 @@ class BaseAgentTools(BaseModel, ABC):
         coworker = self._get_coworker(coworker, **kwargs)
         return self._execute(coworker, question, context)
 
+    async def adelegate_work(
+        self, task: str, context: str, coworker: Optional[str] = None, **kwargs
+    ):
+        """Useful to delegate a specific task to a coworker passing all necessary context and names."""
+        coworker = self._get_coworker(coworker, **kwargs)
+        return await self._aexecute(coworker, task, context)
+
+    async def aask_question(
+        self, question: str, context: str, coworker: Optional[str] = None, **kwargs
+    ):
+        """Useful to ask a question, opinion or take from a coworker passing all necessary context and names."""
+        coworker = self._get_coworker(coworker, **kwargs)
+        return await self._aexecute(coworker, question, context)
+
     def _execute(
         self, agent_name: Union[str, None], task: str, context: Union[str, None]
     ):
         """Execute the command."""
+        coworker_task = self._create_coworker_task(agent_name, task)
+        if isinstance(coworker_task, str):
+            return coworker_task
+        return coworker_task.agent.execute_task(coworker_task, context)
+
+    async def _aexecute(
+        self, agent_name: Union[str, None], task: str, context: Union[str, None]
+    ):
+        """Execute the command on the running event loop."""
+        coworker_task = self._create_coworker_task(agent_name, task)
+        if isinstance(coworker_task, str):
+            return coworker_task
+        return await coworker_task.agent.aexecute_task(coworker_task, context)
+
+    def _create_coworker_task(
+        self, agent_name: Union[str, None], task: str
+    ) -> Union[Task, str]:
+        """Build the task for the named coworker, or the error to return when it doesn't exist."""
         try:
             if agent_name is None:
                 agent_name = ""
@@ -78,9 +110,8 @@ class BaseAgentTools(BaseModel, ABC):
             )
 
         agent = agent[0]
-        task_with_assigned_agent = Task(  # type: ignore # Incompatible types in assignment (expression has type "Task", variable has type "str")
+        return Task(
             description=task,
             agent=agent,
             expected_output="Your best answer to your coworker asking you this, accounting for the context shared.",
         )
-        return agent.execute_task(task_with_assigned_agent, context)
@@ -6,6 +6,11 @@ class TokenProcess:
     prompt_tokens: int = 0
     completion_tokens: int = 0
     successful_requests: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    total_latency: float = 0.0
+    throttled_seconds: float = 0.0
+    throttled_requests: int = 0
 
     def sum_prompt_tokens(self, tokens: int):
         self.prompt_tokens = self.prompt_tokens + tokens
@@ -18,10 +23,30 @@ class TokenProcess:
     def sum_successful_requests(self, requests: int):
         self.successful_requests = self.successful_requests + requests
 
+    def sum_cache_hits(self, hits: int):
+        self.cache_hits = self.cache_hits + hits
+
+    def sum_cache_misses(self, misses: int):
+        self.cache_misses = self.cache_misses + misses
+
+    def sum_latency(self, seconds: float):
+        self.total_latency = self.total_latency + seconds
+
+    def sum_throttled(self, seconds: float):
+        self.throttled_seconds = self.throttled_seconds + seconds
+        self.throttled_requests = self.throttled_requests + 1
+
     def get_summary(self) -> UsageMetrics:
-        return UsageMetrics(
+        usage_metrics = UsageMetrics(
             total_tokens=self.total_tokens,
             prompt_tokens=self.prompt_tokens,
             completion_tokens=self.completion_tokens,
             successful_requests=self.successful_requests,
+            cache_hits=self.cache_hits,
+            cache_misses=self.cache_misses,
+            total_latency=self.total_latency,
+            throttled_seconds=self.throttled_seconds,
+            throttled_requests=self.throttled_requests,
         )
+        usage_metrics.compute_rates()
+        return usage_metrics
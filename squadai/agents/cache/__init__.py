@@ -1,3 +1,4 @@
 from .cache_handler import CacheHandler
+from .llm_response_cache import LLMResponseCache
 
-__all__ = ["CacheHandler"]
+__all__ = ["CacheHandler", "LLMResponseCache"]
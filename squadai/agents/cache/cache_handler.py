@@ -1,15 +1,261 @@
-from typing import Any, Dict, Optional
+import ast
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from squadai.memory.storage.tool_cache_storage import ToolCacheSQLiteStorage
+
+
+class _CacheShard:
+    """LRU segment of the cache, guarded by its own lock."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> (output, expires_at, size)
+        self.entries: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = (
+            OrderedDict()
+        )
+        self.nbytes = 0
+
+    def pop(self, key: str) -> None:
+        _, _, size = self.entries.pop(key)
+        self.nbytes -= size
+
+    def copy(self) -> "_CacheShard":
+        copied = _CacheShard()
+        with self.lock:
+            copied.entries = self.entries.copy()
+            copied.nbytes = self.nbytes
+        return copied
 
 
 class CacheHandler(BaseModel):
-    """Callback handler for tool usage."""
+    """Cache of tool results shared by the agents of a squad.
+
+    Keys are hashed from the tool name and its arguments serialized as sorted
+    JSON, so the order of the arguments does not matter. Entries are spread
+    over shards, each an LRU with its own lock, and the least recently used
+    ones are evicted once a shard goes over its share of the entry or byte
+    budget. The size of an entry is the length of its output. Entries expire
+    after the TTL of their tool, when there is one.
+
+    A persistent cache also keeps the results in SQLite under
+    `db_storage_path()`, so later runs and other processes reuse them. Results
+    found there are loaded into memory on first read. Results stored on disk
+    always expire, after persistent_ttl when their tool has no TTL.
+    """
+
+    EVICTION_INTERVAL: ClassVar[int] = 100
+
+    ttl: Optional[float] = Field(
+        default_factory=lambda: (
+            float(os.environ["SQUADAI_TOOL_CACHE_TTL"])
+            if os.environ.get("SQUADAI_TOOL_CACHE_TTL")
+            else None
+        ),
+        description="Seconds a result stays valid, defaults to SQUADAI_TOOL_CACHE_TTL or no expiry.",
+    )
+    tool_ttls: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds the results of a tool stay valid, by tool name, overriding ttl.",
+    )
+    max_entries: int = Field(
+        default_factory=lambda: int(
+            os.environ.get("SQUADAI_TOOL_CACHE_MAX_ENTRIES", 10000)
+        ),
+        description="Number of results kept, defaults to SQUADAI_TOOL_CACHE_MAX_ENTRIES or 10000.",
+    )
+    max_bytes: int = Field(
+        default_factory=lambda: int(
+            os.environ.get("SQUADAI_TOOL_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+        ),
+        description="Total size of the results kept, defaults to SQUADAI_TOOL_CACHE_MAX_BYTES or 64MB.",
+    )
+    shards: int = Field(default=16, description="Number of independently locked segments.")
+    persistent: bool = Field(
+        default_factory=lambda: os.environ.get(
+            "SQUADAI_TOOL_CACHE_PERSISTENT", ""
+        ).lower()
+        in ("1", "true", "yes"),
+        description="Also keep the results on disk, defaults to SQUADAI_TOOL_CACHE_PERSISTENT.",
+    )
+    persistent_ttl: float = Field(
+        default_factory=lambda: float(
+            os.environ.get("SQUADAI_TOOL_CACHE_PERSISTENT_TTL", 24 * 60 * 60)
+        ),
+        description="Seconds a result stored on disk stays valid when its tool has no TTL, defaults to SQUADAI_TOOL_CACHE_PERSISTENT_TTL or one day.",
+    )
+    db_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file of the persistent cache, defaults to tool_cache.db under db_storage_path().",
+    )
+    _shards: List[_CacheShard] = PrivateAttr(default_factory=list)
+    _stats_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+    _evictions: int = PrivateAttr(default=0)
+    _storage: Optional[ToolCacheSQLiteStorage] = PrivateAttr(default=None)
+    _writes: int = PrivateAttr(default=0)
+
+    @model_validator(mode="after")
+    def create_shards(self):
+        # Also runs when the instance is passed to another model, keep the entries then
+        if not self._shards:
+            self._shards = [_CacheShard() for _ in range(max(self.shards, 1))]
+        if self.persistent and self._storage is None:
+            self._storage = ToolCacheSQLiteStorage(self.db_path)
+            self._storage.evict(max_entries=self.max_entries)
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "CacheHandler":
+        # Locks cannot be copied, the copy gets its own and the same entries
+        copied = CacheHandler(**self.model_dump())
+        copied._shards = [shard.copy() for shard in self._shards]
+        copied._storage = self._storage
+        return copied
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of results removed to stay within budget or because they expired."""
+        return self._evictions
+
+    @property
+    def size(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
 
-    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    @property
+    def nbytes(self) -> int:
+        return sum(shard.nbytes for shard in self._shards)
 
-    def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+    @staticmethod
+    def key(tool: str, input: Any) -> str:
+        payload = json.dumps([tool, _canonical_input(input)], ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def add(self, tool, input, output, ttl: Optional[float] = None):
+        """Store the output of a tool call.
+
+        Args:
+            ttl: Seconds the output stays valid, defaults to the TTL of the tool.
+        """
+        if ttl is None:
+            ttl = self.tool_ttls.get(tool, self.ttl)
+        key = self.key(tool, input)
+        self._add(key, output, time.monotonic() + ttl if ttl is not None else None)
+        if self._storage is not None:
+            self._persist(key, tool, output, ttl if ttl is not None else self.persistent_ttl)
+
+    def _add(self, key: str, output: Any, expires_at: Optional[float]) -> None:
+        size = _output_size(output)
+        shard = self._shard(key)
+        max_entries = max(self.max_entries // len(self._shards), 1)
+        max_bytes = self.max_bytes // len(self._shards)
+        evicted = 0
+        with shard.lock:
+            if key in shard.entries:
+                shard.pop(key)
+            shard.entries[key] = (output, expires_at, size)
+            shard.nbytes += size
+            while len(shard.entries) > max_entries or (
+                shard.nbytes > max_bytes and shard.entries
+            ):
+                shard.pop(next(iter(shard.entries)))
+                evicted += 1
+        if evicted:
+            with self._stats_lock:
+                self._evictions += evicted
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        key = self.key(tool, input)
+        shard = self._shard(key)
+        expired = False
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                shard.pop(key)
+                entry = None
+                expired = True
+            elif entry is not None:
+                shard.entries.move_to_end(key)
+
+        if entry is None and self._storage is not None:
+            entry = self._load(key)
+
+        with self._stats_lock:
+            self._evictions += expired
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return entry[0]
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.nbytes = 0
+        if self._storage is not None:
+            self._storage.delete_all()
+
+    def _persist(self, key: str, tool: str, output: Any, ttl: float) -> None:
+        try:
+            serialized = json.dumps(output, ensure_ascii=False)
+        except (TypeError, ValueError):
+            serialized = json.dumps(str(output), ensure_ascii=False)
+        self._storage.save(key, tool, serialized, time.time() + ttl)  # type: ignore[union-attr]
+
+        with self._stats_lock:
+            self._writes += 1
+            evict = self._writes % self.EVICTION_INTERVAL == 0
+        if evict:
+            self._storage.evict(max_entries=self.max_entries)  # type: ignore[union-attr]
+
+    def _load(self, key: str) -> Optional[Tuple[Any, Optional[float], int]]:
+        """Read a result from disk and keep it in memory for the next reads."""
+        stored = self._storage.load(key)  # type: ignore[union-attr]
+        if stored is None:
+            return None
+        output = json.loads(stored[0])
+        expires_at = (
+            time.monotonic() + stored[1] - time.time() if stored[1] is not None else None
+        )
+        self._add(key, output, expires_at)
+        return output, expires_at, _output_size(output)
+
+    def _shard(self, key: str) -> _CacheShard:
+        return self._shards[int(key[:8], 16) % len(self._shards)]
+
+
+def _canonical_input(input: Any) -> str:
+    """Serialize tool arguments so equal arguments give the same text.
+
+    Arguments given as text, as read back by the cache tool, are parsed first.
+    """
+    if isinstance(input, str):
+        try:
+            input = json.loads(input)
+        except ValueError:
+            try:
+                input = ast.literal_eval(input)
+            except Exception:
+                return input
+    return json.dumps(input, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _output_size(output: Any) -> int:
+    text = output if isinstance(output, str) else str(output)
+    return len(text.encode("utf-8", errors="ignore"))
@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from squadai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from squadai.memory.storage.llm_response_cache_storage import (
+    LLMResponseCacheSQLiteStorage,
+)
+
+
+class LLMResponseCache:
+    """Persistent cache of LLM responses, keyed by model, prompt, stop words and temperature.
+
+    Entries live in SQLite under `db_storage_path()`, so identical prompts sent by
+    retries, replays or test runs are answered without calling the provider.
+
+    Attributes:
+        ttl: Seconds an entry stays valid, defaults to SQUADAI_LLM_CACHE_TTL or no expiry.
+        max_entries: Number of entries kept, least recently used ones are evicted first. Defaults to SQUADAI_LLM_CACHE_MAX_ENTRIES or 10000.
+        hits: Number of lookups answered from the cache.
+        misses: Number of lookups that had to call the LLM.
+    """
+
+    EVICTION_INTERVAL = 100
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        db_path: Optional[str] = None,
+    ) -> None:
+        if ttl is None and os.environ.get("SQUADAI_LLM_CACHE_TTL"):
+            ttl = float(os.environ["SQUADAI_LLM_CACHE_TTL"])
+        if max_entries is None:
+            max_entries = int(os.environ.get("SQUADAI_LLM_CACHE_MAX_ENTRIES", 10000))
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._storage = LLMResponseCacheSQLiteStorage(db_path)
+        self._storage.evict(max_entries=self.max_entries, ttl=self.ttl)
+
+    @staticmethod
+    def key(
+        model: str, prompt: str, stop: Optional[List[str]], temperature: Any
+    ) -> str:
+        payload = json.dumps(
+            [model, prompt, stop or [], temperature], ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Any]:
+        """Return the cached response of a key, a message or a string."""
+        cached = self._storage.load(key, ttl=self.ttl)
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        entry = json.loads(cached)
+        if entry["type"] == "message":
+            return messages_from_dict([entry["value"]])[0]
+        return entry["value"]
+
+    def update(self, key: str, model: str, response: Any) -> None:
+        if isinstance(response, BaseMessage):
+            entry = {"type": "message", "value": message_to_dict(response)}
+        else:
+            entry = {"type": "text", "value": str(response)}
+        self._storage.save(key, model, json.dumps(entry))
+
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % self.EVICTION_INTERVAL == 0
+        if evict:
+            self._storage.evict(max_entries=self.max_entries, ttl=self.ttl)
+
+    def clear(self) -> None:
+        self._storage.delete_all()
+
+
+_default_llm_response_cache: Optional[LLMResponseCache] = None
+_default_llm_response_cache_lock = threading.Lock()
+
+
+def default_llm_response_cache() -> LLMResponseCache:
+    """Return the process-wide LLM response cache, creating it on first use."""
+    global _default_llm_response_cache
+    with _default_llm_response_cache_lock:
+        if _default_llm_response_cache is None:
+            _default_llm_response_cache = LLMResponseCache()
+        return _default_llm_response_cache
+
+
+class CachedLLM(Runnable):
+    """Runnable answering from an LLMResponseCache before calling the bound LLM.
+
+    Cache misses stream through unchanged and the complete response is stored
+    once the LLM is done. Hits and misses are counted on the agent token process.
+    """
+
+    def __init__(
+        self,
+        bound: Runnable,
+        cache: LLMResponseCache,
+        model: str,
+        stop: Optional[List[str]] = None,
+        temperature: Any = None,
+        token_process: Optional[TokenProcess] = None,
+    ) -> None:
+        self.bound = bound
+        self.cache = cache
+        self.model = model
+        self.stop = stop
+        self.temperature = temperature
+        self.token_process = token_process
+
+    def invoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        key = self._key(input)
+        if (cached := self._lookup(key)) is not None:
+            return cached
+        response = self.bound.invoke(input, config, **kwargs)
+        self.cache.update(key, self.model, response)
+        return response
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        key = self._key(input)
+        if (cached := self._lookup(key)) is not None:
+            return cached
+        response = await self.bound.ainvoke(input, config, **kwargs)
+        self.cache.update(key, self.model, response)
+        return response
+
+    def stream(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Iterator[Any]:
+        key = self._key(input)
+        if (cached := self._lookup(key)) is not None:
+            yield cached
+            return
+
+        response = None
+        for chunk in self.bound.stream(input, config, **kwargs):
+            response = chunk if response is None else response + chunk
+            yield chunk
+        if response is not None:
+            self.cache.update(key, self.model, response)
+
+    async def astream(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        key = self._key(input)
+        if (cached := self._lookup(key)) is not None:
+            yield cached
+            return
+
+        response = None
+        async for chunk in self.bound.astream(input, config, **kwargs):
+            response = chunk if response is None else response + chunk
+            yield chunk
+        if response is not None:
+            self.cache.update(key, self.model, response)
+
+    def _key(self, input: Any) -> str:
+        prompt = input.to_string() if hasattr(input, "to_string") else str(input)
+        return self.cache.key(self.model, prompt, self.stop, self.temperature)
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        cached = self.cache.lookup(key)
+        if self.token_process is not None:
+            if cached is None:
+                self.token_process.sum_cache_misses(1)
+            else:
+                self.token_process.sum_cache_hits(1)
+        return cached
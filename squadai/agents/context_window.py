@@ -0,0 +1,249 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.agents import AgentAction
+
+ContextWindowPolicy = Literal["truncate", "summarize", "drop"]
+
+# Context window sizes of the models served by Groq, in tokens
+LLM_CONTEXT_WINDOW_SIZES = {
+    "llama3-8b-8192": 8192,
+    "llama3-70b-8192": 8192,
+    "llama-3.1-8b-instant": 131072,
+    "llama-3.1-70b-versatile": 131072,
+    "llama-3.1-405b-reasoning": 131072,
+    "mixtral-8x7b-32768": 32768,
+    "gemma-7b-it": 8192,
+    "gemma2-9b-it": 8192,
+}
+DEFAULT_CONTEXT_WINDOW_SIZE = 8192
+CHARS_PER_TOKEN = 4
+TRUNCATION_MARKER = "\n[... truncated to fit the context window ...]"
+
+_Step = Tuple[AgentAction, Any]
+
+
+def approximate_token_count(text: str) -> int:
+    """Estimate the number of tokens of a text without loading a tokenizer."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def llm_context_window_size(llm: Any, model_name: Optional[str] = None) -> Optional[int]:
+    """Context window of an LLM in tokens, None when it is unknown.
+
+    It is taken from the LLM when it exposes one, from the known models otherwise.
+    """
+    for attribute in ("context_window", "num_ctx"):
+        size = getattr(llm, attribute, None)
+        if isinstance(size, int) and not isinstance(size, bool) and size > 0:
+            return size
+    return LLM_CONTEXT_WINDOW_SIZES.get(model_name or "")
+
+
+class ContextWindowManager:
+    """Keeps the prompt of an agent run within the token budget of its LLM.
+
+    Tokens are counted before every LLM call. When the task input, tool
+    descriptions and scratchpad go over the budget, the oldest observations
+    are made to fit according to the policy:
+
+    - truncate: cut the oldest observations down, keeping their beginning.
+    - summarize: replace the oldest observations with summaries, chunks are
+      summarized in parallel and summaries are cached by content.
+    - drop: remove the oldest steps from the scratchpad.
+
+    The newest step is only cut when it does not fit on its own.
+
+    Attributes:
+        max_tokens: Token budget of the prompt, defaults to the model context window minus reserved_tokens.
+        policy: How steps are made to fit, defaults to SQUADAI_CONTEXT_POLICY or "truncate".
+            Summarizing calls the LLM, so it is only done when asked for.
+        token_counter: Function counting the tokens of a text, defaults to a characters based estimate.
+    """
+
+    def __init__(
+        self,
+        llm: Any = None,
+        model_name: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        policy: Optional[ContextWindowPolicy] = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+        reserved_tokens: int = 1024,
+        max_summary_workers: int = 4,
+        chunk_size: int = 8000,
+        chunk_overlap: int = 500,
+        max_cached_summaries: int = 256,
+    ) -> None:
+        if policy is None:
+            policy = os.environ.get("SQUADAI_CONTEXT_POLICY", "truncate")  # type: ignore[assignment]
+        if policy not in ("truncate", "summarize", "drop"):
+            raise ValueError(f"Unknown context window policy: {policy}")
+        if max_tokens is None:
+            window = (
+                llm_context_window_size(llm, model_name) or DEFAULT_CONTEXT_WINDOW_SIZE
+            )
+            max_tokens = max(window - reserved_tokens, window // 2)
+
+        self.llm = llm
+        self.max_tokens = max_tokens
+        self._initial_max_tokens = max_tokens
+        self.policy = policy
+        self.token_counter = token_counter or approximate_token_count
+        self.max_summary_workers = max_summary_workers
+        self.max_cached_summaries = max_cached_summaries
+        self._text_splitter = RecursiveCharacterTextSplitter(
+            separators=["\n\n", "\n"],
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+        )
+        self._summarize_chain: Any = None
+        self._summaries: "OrderedDict[str, str]" = OrderedDict()
+        self._fitted: "OrderedDict[int, Tuple[_Step, _Step]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def within_budget(
+        self, intermediate_steps: Sequence[_Step], inputs: Dict[str, Any]
+    ) -> bool:
+        return self._overflow(intermediate_steps, inputs) <= 0
+
+    def fit(
+        self, intermediate_steps: Sequence[_Step], inputs: Dict[str, Any]
+    ) -> List[_Step]:
+        """Return the steps to send to the LLM, within the token budget."""
+        steps = list(intermediate_steps)
+        if self._overflow(steps, inputs) <= 0:
+            return steps
+
+        if self.policy == "drop":
+            while len(steps) > 1 and self._overflow(steps, inputs) > 0:
+                steps.pop(0)
+        elif self.policy == "summarize" and self.llm is not None:
+            steps = self._summarize_oldest(steps, inputs)
+
+        # Whatever is still over the budget is cut, oldest observations first
+        return self._truncate_oldest(steps, inputs)
+
+    def shrink(self, factor: float = 0.75) -> None:
+        """Lower the budget after the provider rejected a prompt as too long.
+
+        It holds for the current run only, see reset().
+        """
+        self.max_tokens = int(self.max_tokens * factor)
+
+    def reset(self) -> None:
+        """Restore the budget lowered by shrink(), at the start of a run."""
+        self.max_tokens = self._initial_max_tokens
+
+    def _overflow(self, steps: Sequence[_Step], inputs: Dict[str, Any]) -> int:
+        prompt_tokens = sum(
+            self.token_counter(value)
+            for value in inputs.values()
+            if isinstance(value, str)
+        )
+        return prompt_tokens + sum(map(self._step_tokens, steps)) - self.max_tokens
+
+    def _step_tokens(self, step: _Step) -> int:
+        return self.token_counter(f"{step[0].log}\nObservation: {step[1]}\n")
+
+    def _truncate_oldest(
+        self, steps: List[_Step], inputs: Dict[str, Any]
+    ) -> List[_Step]:
+        for index, step in enumerate(steps):
+            overflow = self._overflow(steps, inputs)
+            if overflow <= 0:
+                break
+            observation = str(step[1])
+            observation_tokens = self.token_counter(observation)
+            keep_tokens = max(
+                observation_tokens - overflow - self.token_counter(TRUNCATION_MARKER), 0
+            )
+            keep_chars = len(observation) * keep_tokens // max(observation_tokens, 1)
+            steps[index] = self._replace(
+                step, observation[:keep_chars] + TRUNCATION_MARKER
+            )
+        return steps
+
+    def _summarize_oldest(
+        self, steps: List[_Step], inputs: Dict[str, Any]
+    ) -> List[_Step]:
+        # Pick the oldest steps holding enough tokens to cover the overflow
+        overflow = self._overflow(steps, inputs)
+        selected: List[int] = []
+        for index, step in enumerate(steps):
+            if overflow <= 0:
+                break
+            selected.append(index)
+            overflow -= self._step_tokens(step)
+
+        chunks_by_step = {
+            index: self._text_splitter.split_text(str(steps[index][1]))
+            for index in selected
+        }
+        summaries = self._summarize_chunks(
+            [chunk for chunks in chunks_by_step.values() for chunk in chunks]
+        )
+        for index, chunks in chunks_by_step.items():
+            steps[index] = self._replace(
+                steps[index], "\n\n".join(summaries[chunk] for chunk in chunks)
+            )
+        return steps
+
+    def _summarize_chunks(self, chunks: List[str]) -> Dict[str, str]:
+        summaries: Dict[str, str] = {}
+        missing: List[str] = []
+        with self._lock:
+            for chunk in dict.fromkeys(chunks):
+                key = hashlib.sha256(chunk.encode()).hexdigest()
+                if key in self._summaries:
+                    self._summaries.move_to_end(key)
+                    summaries[chunk] = self._summaries[key]
+                else:
+                    missing.append(chunk)
+
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_summary_workers, len(missing)),
+                thread_name_prefix="squadai-summarize",
+            ) as pool:
+                for chunk, summary in zip(missing, pool.map(self._summarize, missing)):
+                    summaries[chunk] = summary
+
+            with self._lock:
+                for chunk in missing:
+                    key = hashlib.sha256(chunk.encode()).hexdigest()
+                    self._summaries[key] = summaries[chunk]
+                while len(self._summaries) > self.max_cached_summaries:
+                    self._summaries.popitem(last=False)
+        return summaries
+
+    def _summarize(self, chunk: str) -> str:
+        from langchain.chains.summarize import load_summarize_chain
+        from langchain_core.documents import Document
+
+        if self._summarize_chain is None:
+            self._summarize_chain = load_summarize_chain(self.llm, chain_type="stuff")
+        summary = self._summarize_chain.invoke(
+            {"input_documents": [Document(page_content=chunk)]},
+            return_only_outputs=True,
+        )
+        return summary["output_text"]
+
+    def _replace(self, step: _Step, observation: str) -> _Step:
+        """Return the step with a new observation, reusing the tuple made last time.
+
+        Reusing it keeps the incremental scratchpad from being rebuilt on every call.
+        """
+        with self._lock:
+            previous = self._fitted.get(id(step))
+            if previous and previous[0] is step and previous[1][1] == observation:
+                return previous[1]
+            fitted = (step[0], observation)
+            self._fitted[id(step)] = (step, fitted)
+            while len(self._fitted) > self.max_cached_summaries:
+                self._fitted.popitem(last=False)
+            return fitted
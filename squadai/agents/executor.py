@@ -1,13 +1,24 @@
-import threading
+import asyncio
+import os
 import time
-from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import click
 from langchain.agents import AgentExecutor
 from langchain.agents.agent import ExceptionTool
-from langchain.callbacks.manager import CallbackManagerForChainRun
-from langchain.chains.summarize import load_summarize_chain
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain.callbacks.manager import (
+    AsyncCallbackManagerForChainRun,
+    CallbackManagerForChainRun,
+)
 from langchain_core.agents import AgentAction, AgentFinish, AgentStep
 from langchain_core.exceptions import OutputParserException
 from langchain_core.tools import BaseTool
@@ -15,14 +26,25 @@ from langchain_core.utils.input import get_color_mapping
 from pydantic import InstanceOf
 
 from squadai.agents.agent_builder.base_agent_executor_mixin import SquadAgentExecutorMixin
+from squadai.agents.scratchpad import AgentScratchpad
 from squadai.agents.tools_handler import ToolsHandler
-from squadai.tools.tool_usage import ToolUsage, ToolUsageErrorException
+from squadai.squads.squad_stream import SquadStreamEvent, SquadStreamEventType
+from squadai.tools.tool_index import ToolIndex
+from squadai.tools.tool_usage import (
+    DELEGATION_TOOL_NAMES,
+    ToolUsage,
+    ToolUsageErrorException,
+)
 from squadai.utilities import I18N
 from squadai.utilities.constants import TRAINING_DATA_FILE
 from squadai.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededException,
 )
 from squadai.utilities.logger import Logger
+from squadai.utilities.task_executor import (
+    TaskExecutorSaturatedError,
+    default_action_executor,
+)
 from squadai.utilities.training_handler import SquadTrainingHandler
 
 
@@ -39,8 +61,14 @@ class SquadAgentExecutor(AgentExecutor, SquadAgentExecutorMixin):
     squad: Any = None
     function_calling_llm: Any = None
     request_within_rpm_limit: Any = None
+    context_window: Any = None
+    arequest_within_rpm_limit: Any = None
+    record_rpm_tokens: Any = None
     tools_handler: Optional[InstanceOf[ToolsHandler]] = None
+    tool_index: Any = None
     max_iterations: Optional[int] = 15
+    max_parallel_tools: Optional[int] = None
+    tool_timeout: Optional[float] = None
     have_forced_answer: bool = False
     force_answer_max_iterations: Optional[int] = None  # type: ignore # Incompatible types in assignment (expression has type "int | None", base class "SquadAgentExecutorMixin" defined the type as "int")
     step_callback: Optional[Any] = None
@@ -48,7 +76,6 @@ class SquadAgentExecutor(AgentExecutor, SquadAgentExecutorMixin):
     prompt_template: Optional[str] = None
     response_template: Optional[str] = None
     _logger: Logger = Logger()
-    _fit_context_window_strategy: Optional[Literal["summarize"]] = "summarize"
 
     def _call(
         self,
@@ -64,10 +91,16 @@ class SquadAgentExecutor(AgentExecutor, SquadAgentExecutorMixin):
             excluded_colors=["green", "red"],
         )
         intermediate_steps: List[Tuple[AgentAction, str]] = []
+        # The scratchpad grows with the steps instead of being rebuilt on every call
+        inputs = {**inputs, "scratchpad": AgentScratchpad()}
         # Allowing human input given task setting
         if self.task and self.task.human_input:
             self.should_ask_for_human_input = True
 
+        # A budget lowered by a context length error only holds for that run
+        if self.context_window:
+            self.context_window.reset()
+
         # Let's start tracking the number of iterations and time elapsed
         self.iterations = 0
         time_elapsed = 0.0
@@ -76,6 +109,7 @@ class SquadAgentExecutor(AgentExecutor, SquadAgentExecutorMixin):
         # We now enter the agent loop (until it returns something).
         while self._should_continue(self.iterations, time_elapsed):
             if not self.request_within_rpm_limit or self.request_within_rpm_limit():
+                tokens_used = self._llm_tokens_used()
                 next_step_output = self._take_next_step(
                     name_to_tool_map,
                     color_mapping,
@@ -83,16 +117,14 @@ class SquadAgentExecutor(AgentExecutor, SquadAgentExecutorMixin):
                     intermediate_steps,
                     run_manager=run_manager,
                 )
+                self._record_rpm_tokens(tokens_used)
 
                 if self.step_callback:
                     self.step_callback(next_step_output)
 
                 if isinstance(next_step_output, AgentFinish):
                     # Creating long term memory
-                    create_long_term_memory = threading.Thread(
-                        target=self._create_long_term_memory, args=(next_step_output,)
-                    )
-                    create_long_term_memory.start()
+                    self._schedule_long_term_memory(next_step_output)
 
                     return self._return(
                         next_step_output, intermediate_steps, run_manager=run_manager
@@ -117,6 +149,95 @@ class SquadAgentExecutor(AgentExecutor, SquadAgentExecutorMixin):
 
         return self._return(output, intermediate_steps, run_manager=run_manager)
 
+    async def _acall(
+        self,
+        inputs: Dict[str, str],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> Dict[str, Any]:
+        """Run text through and get agent response without blocking the event loop."""
+        # Construct a mapping of tool name to tool for easy lookup
+        name_to_tool_map = {tool.name: tool for tool in self.tools}
+        # We construct a mapping from each tool to a color, used for logging.
+        color_mapping = get_color_mapping(
+            [tool.name.casefold() for tool in self.tools],
+            excluded_colors=["green", "red"],
+        )
+        intermediate_steps: List[Tuple[AgentAction, str]] = []
+        # The scratchpad grows with the steps instead of being rebuilt on every call
+        inputs = {**inputs, "scratchpad": AgentScratchpad()}
+        # Allowing human input given task setting
+        if self.task and self.task.human_input:
+            self.should_ask_for_human_input = True
+
+        # A budget lowered by a context length error only holds for that run
+        if self.context_window:
+            self.context_window.reset()
+
+        # Let's start tracking the number of iterations and time elapsed
+        self.iterations = 0
+        time_elapsed = 0.0
+        start_time = time.time()
+
+        # We now enter the agent loop (until it returns something).
+        while self._should_continue(self.iterations, time_elapsed):
+            if (
+                not self.request_within_rpm_limit
+                or await self._arequest_within_rpm_limit()
+            ):
+                tokens_used = self._llm_tokens_used()
+                next_step_output = await self._atake_next_step(
+                    name_to_tool_map,
+                    color_mapping,
+                    inputs,
+                    intermediate_steps,
+                    run_manager=run_manager,
+                )
+                self._record_rpm_tokens(tokens_used)
+
+                if self.step_callback:
+                    self.step_callback(next_step_output)
+
+                if isinstance(next_step_output, AgentFinish):
+                    # Creating long term memory
+                    self._schedule_long_term_memory(next_step_output)
+
+                    return await self._areturn(
+                        next_step_output, intermediate_steps, run_manager=run_manager
+                    )
+
+                intermediate_steps.extend(next_step_output)
+
+                if len(next_step_output) == 1:
+                    next_step_action = next_step_output[0]
+                    # See if tool should return directly
+                    tool_return = self._get_tool_return(next_step_action)
+                    if tool_return is not None:
+                        return await self._areturn(
+                            tool_return, intermediate_steps, run_manager=run_manager
+                        )
+
+                self.iterations += 1
+                time_elapsed = time.time() - start_time
+        output = self.agent.return_stopped_response(
+            self.early_stopping_method, intermediate_steps, **inputs
+        )
+
+        return await self._areturn(output, intermediate_steps, run_manager=run_manager)
+
+    async def _arequest_within_rpm_limit(self) -> bool:
+        if self.arequest_within_rpm_limit:
+            return await self.arequest_within_rpm_limit()
+        return await asyncio.to_thread(self.request_within_rpm_limit)
+
+    def _llm_tokens_used(self) -> int:
+        token_process = getattr(self.squad_agent, "_token_process", None)
+        return token_process.total_tokens if token_process else 0
+
+    def _record_rpm_tokens(self, tokens_used_before: int) -> None:
+        """Report the tokens of the last LLM call to the rate limiter."""
+        if self.record_rpm_tokens:
+            self.record_rpm_tokens(self._llm_tokens_used() - tokens_used_before)
+
     def _iter_next_step(
         self,
         name_to_tool_map: Dict[str, BaseTool],
@@ -131,47 +252,18 @@ class SquadAgentExecutor(AgentExecutor, SquadAgentExecutorMixin):
         """
         try:
             if self._should_force_answer():
-                error = self._i18n.errors("force_final_answer")
-                output = AgentAction("_Exception", error, error)
-                self.have_forced_answer = True
-                yield AgentStep(action=output, observation=error)
+                yield self._forced_answer_step()
                 return
 
-            intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
+            intermediate_steps = self._fit_context_window(
+                self._prepare_intermediate_steps(intermediate_steps), inputs
+            )
 
             # Call the LLM to see what to do.
-            output = self.agent.plan(
-                intermediate_steps,
-                callbacks=run_manager.get_child() if run_manager else None,
-                **inputs,
-            )
+            output = self._plan(intermediate_steps, run_manager, inputs)
 
         except OutputParserException as e:
-            if isinstance(self.handle_parsing_errors, bool):
-                raise_error = not self.handle_parsing_errors
-            else:
-                raise_error = False
-            if raise_error:
-                raise ValueError(
-                    "An output parsing error occurred. "
-                    "In order to pass this error back to the agent and have it try "
-                    "again, pass `handle_parsing_errors=True` to the AgentExecutor. "
-                    f"This is the error: {str(e)}"
-                )
-            str(e)
-            if isinstance(self.handle_parsing_errors, bool):
-                if e.send_to_llm:
-                    observation = f"\n{str(e.observation)}"
-                    str(e.llm_output)
-                else:
-                    observation = ""
-            elif isinstance(self.handle_parsing_errors, str):
-                observation = f"\n{self.handle_parsing_errors}"
-            elif callable(self.handle_parsing_errors):
-                observation = f"\n{self.handle_parsing_errors(e)}"
-            else:
-                raise ValueError("Got unexpected type of `handle_parsing_errors`")
-            output = AgentAction("_Exception", observation, "")
+            output = AgentAction("_Exception", self._parsing_error_observation(e), "")
 
             if run_manager:
                 run_manager.on_agent_action(output, color="green")
@@ -186,99 +278,347 @@ class SquadAgentExecutor(AgentExecutor, SquadAgentExecutorMixin):
             )
 
             if self._should_force_answer():
-                error = self._i18n.errors("force_final_answer")
-                output = AgentAction("_Exception", error, error)
-                yield AgentStep(action=output, observation=error)
+                yield self._forced_answer_step(mark_forced=False)
                 return
 
             yield AgentStep(action=output, observation=observation)
             return
 
-        except Exception as e:
-            if LLMContextLengthExceededException(str(e))._is_context_limit_error(
-                str(e)
-            ):
-                output = self._handle_context_length_error(
-                    intermediate_steps, run_manager, inputs
-                )
+        # If the tool chosen is the finishing tool, then we end and return.
+        if isinstance(output, AgentFinish):
+            yield self._process_agent_finish(output)
+            return
 
-                if isinstance(output, AgentFinish):
-                    yield output
-                elif isinstance(output, list):
-                    for step in output:
-                        yield step
-                return
+        self._create_short_term_memory(output)
 
-            raise e
+        actions: List[AgentAction]
+        actions = [output] if isinstance(output, AgentAction) else output
+        yield from actions
 
-        # If the tool chosen is the finishing tool, then we end and return.
-        if isinstance(output, AgentFinish):
-            if self.should_ask_for_human_input:
-                human_feedback = self._ask_human_input(output.return_values["output"])
+        for agent_action in actions:
+            if run_manager:
+                run_manager.on_agent_action(agent_action, color="green")
+            self._stream_event(
+                SquadStreamEventType.action, agent_action.log, agent_action.tool
+            )
 
-                if self.squad and self.squad._train:
-                    self._handle_squad_training_output(output, human_feedback)
+        observations = self._run_actions(actions)
+        for agent_action, observation in zip(actions, observations):
+            self._stream_event(
+                SquadStreamEventType.observation, observation, agent_action.tool
+            )
+            yield AgentStep(action=agent_action, observation=observation)
 
-                # Making sure we only ask for it once, so disabling for the next thought loop
-                self.should_ask_for_human_input = False
-                action = AgentAction(
-                    tool="Human Input", tool_input=human_feedback, log=output.log
-                )
+    async def _aiter_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> AsyncIterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        """Take a single step in the thought-action-observation loop asynchronously."""
+        try:
+            if self._should_force_answer():
+                yield self._forced_answer_step()
+                return
 
-                yield AgentStep(
-                    action=action,
-                    observation=self._i18n.slice("human_feedback").format(
-                        human_feedback=human_feedback
-                    ),
+            intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
+            if self.context_window and not self.context_window.within_budget(
+                intermediate_steps, inputs
+            ):
+                intermediate_steps = await asyncio.to_thread(
+                    self.context_window.fit, intermediate_steps, inputs
                 )
-                return
 
-            else:
-                if self.squad and self.squad._train:
-                    self._handle_squad_training_output(output)
+            # Call the LLM to see what to do.
+            output = await self._aplan(intermediate_steps, run_manager, inputs)
 
-                yield output
+        except OutputParserException as e:
+            output = AgentAction("_Exception", self._parsing_error_observation(e), "")
+
+            if run_manager:
+                await run_manager.on_agent_action(output, color="green")
+
+            tool_run_kwargs = self.agent.tool_run_logging_kwargs()
+            observation = await ExceptionTool().arun(
+                output.tool_input,
+                verbose=False,
+                color=None,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **tool_run_kwargs,
+            )
+
+            if self._should_force_answer():
+                yield self._forced_answer_step(mark_forced=False)
                 return
 
-        self._create_short_term_memory(output)
+            yield AgentStep(action=output, observation=observation)
+            return
+
+        # If the tool chosen is the finishing tool, then we end and return.
+        if isinstance(output, AgentFinish):
+            if self.should_ask_for_human_input:
+                yield await asyncio.to_thread(self._process_agent_finish, output)
+            else:
+                yield self._process_agent_finish(output)
+            return
+
+        await asyncio.to_thread(self._create_short_term_memory, output)
 
         actions: List[AgentAction]
         actions = [output] if isinstance(output, AgentAction) else output
-        yield from actions
+        for agent_action in actions:
+            yield agent_action
 
         for agent_action in actions:
             if run_manager:
-                run_manager.on_agent_action(agent_action, color="green")
+                await run_manager.on_agent_action(agent_action, color="green")
+            self._stream_event(
+                SquadStreamEventType.action, agent_action.log, agent_action.tool
+            )
 
-            tool_usage = ToolUsage(
-                tools_handler=self.tools_handler,  # type: ignore # Argument "tools_handler" to "ToolUsage" has incompatible type "ToolsHandler | None"; expected "ToolsHandler"
-                tools=self.tools,  # type: ignore # Argument "tools" to "ToolUsage" has incompatible type "Sequence[BaseTool]"; expected "list[BaseTool]"
-                original_tools=self.original_tools,
-                tools_description=self.tools_description,
-                tools_names=self.tools_names,
-                function_calling_llm=self.function_calling_llm,
-                task=self.task,
-                agent=self.squad_agent,
-                action=agent_action,
+        observations = await self._arun_actions(actions)
+        for agent_action, observation in zip(actions, observations):
+            self._stream_event(
+                SquadStreamEventType.observation, observation, agent_action.tool
             )
+            yield AgentStep(action=agent_action, observation=observation)
 
-            tool_calling = tool_usage.parse(agent_action.log)
+    def _run_actions(self, actions: List[AgentAction]) -> List[str]:
+        """Run the tool actions of one step, returning their observations in order.
 
-            if isinstance(tool_calling, ToolUsageErrorException):
-                observation = tool_calling.message
+        Identical actions run once and share their observation. Independent
+        actions run concurrently, on the shared action pool and the calling
+        thread. Delegations run one at a time on the calling thread, a coworker
+        cannot work on two tasks at once.
+        """
+        distinct, sources = self._distinct_actions(actions)
+        observations = self._run_distinct_actions(distinct)
+        return [observations[source] for source in sources]
+
+    def _run_distinct_actions(self, actions: List[AgentAction]) -> List[str]:
+        concurrent = deque(
+            index
+            for index, agent_action in enumerate(actions)
+            if not self._is_delegation(agent_action)
+        )
+        max_parallel_tools = self._max_parallel_tools()
+        if len(concurrent) < 2 or max_parallel_tools < 2:
+            return [self._run_action(action) for action in actions]
+
+        observations: List[str] = [""] * len(actions)
+
+        def drain() -> None:
+            while True:
+                try:
+                    index = concurrent.popleft()
+                except IndexError:
+                    return
+                observations[index] = self._run_action(actions[index])
+
+        # The calling thread is one of the lanes, a busy pool only lowers the parallelism
+        futures = []
+        for _ in range(min(max_parallel_tools, len(concurrent)) - 1):
+            try:
+                futures.append(default_action_executor().submit(drain, block=False))
+            except TaskExecutorSaturatedError:
+                break
+        for index, agent_action in enumerate(actions):
+            if self._is_delegation(agent_action):
+                observations[index] = self._run_action(agent_action)
+        drain()
+        for future in futures:
+            future.result()
+        return observations
+
+    async def _arun_actions(self, actions: List[AgentAction]) -> List[str]:
+        """Run the tool actions of one step like _run_actions, on the event loop."""
+        distinct, sources = self._distinct_actions(actions)
+        observations = await self._arun_distinct_actions(distinct)
+        return [observations[source] for source in sources]
+
+    async def _arun_distinct_actions(self, actions: List[AgentAction]) -> List[str]:
+        semaphore = asyncio.Semaphore(self._max_parallel_tools())
+        delegation_lock = asyncio.Lock()
+
+        async def run(agent_action: AgentAction) -> str:
+            if self._is_delegation(agent_action):
+                async with delegation_lock:
+                    return await self._arun_action(agent_action)
+            async with semaphore:
+                return await self._arun_action(agent_action)
+
+        if len(actions) == 1:
+            return [await self._arun_action(actions[0])]
+        return list(await asyncio.gather(*(run(action) for action in actions)))
+
+    def _run_action(self, agent_action: AgentAction) -> str:
+        tool_usage = self._create_tool_usage(agent_action)
+        tool_calling = tool_usage.parse(agent_action.log)
+
+        if isinstance(tool_calling, ToolUsageErrorException):
+            return tool_calling.message
+        if tool_calling.tool_name in self._tool_index():
+            return tool_usage.use(tool_calling, agent_action.log)
+        return self._wrong_tool_name_error(tool_calling.tool_name)
+
+    async def _arun_action(self, agent_action: AgentAction) -> str:
+        tool_usage = self._create_tool_usage(agent_action)
+        tool_calling = tool_usage.parse(agent_action.log)
+
+        if isinstance(tool_calling, ToolUsageErrorException):
+            return tool_calling.message
+        if tool_calling.tool_name in self._tool_index():
+            return await tool_usage.ause(tool_calling, agent_action.log)
+        return self._wrong_tool_name_error(tool_calling.tool_name)
+
+    def _max_parallel_tools(self) -> int:
+        if self.max_parallel_tools is not None:
+            return max(self.max_parallel_tools, 1)
+        return max(int(os.environ.get("SQUADAI_MAX_PARALLEL_TOOLS", 4)), 1)
+
+    def _tool_timeout(self) -> Optional[float]:
+        if self.tool_timeout is not None:
+            return self.tool_timeout
+        if os.environ.get("SQUADAI_TOOL_TIMEOUT"):
+            return float(os.environ["SQUADAI_TOOL_TIMEOUT"])
+        return None
+
+    @staticmethod
+    def _distinct_actions(
+        actions: List[AgentAction],
+    ) -> Tuple[List[AgentAction], List[int]]:
+        """Drop the repeated actions of a step.
+
+        Identical calls running side by side would all get past the repeated
+        usage check of the tools handler, so only the first one runs.
+
+        Returns:
+            The distinct actions, and for each action the index of the distinct
+            action giving its observation.
+        """
+        distinct: List[AgentAction] = []
+        sources: List[int] = []
+        seen: Dict[Tuple[str, str], int] = {}
+        for agent_action in actions:
+            key = (agent_action.tool.casefold().strip(), str(agent_action.tool_input))
+            if key not in seen:
+                seen[key] = len(distinct)
+                distinct.append(agent_action)
+            sources.append(seen[key])
+        return distinct, sources
+
+    @staticmethod
+    def _is_delegation(agent_action: AgentAction) -> bool:
+        return agent_action.tool.casefold().strip() in DELEGATION_TOOL_NAMES
+
+    def _forced_answer_step(self, mark_forced: bool = True) -> AgentStep:
+        """Build the step telling the agent it must give its final answer now."""
+        error = self._i18n.errors("force_final_answer")
+        output = AgentAction("_Exception", error, error)
+        if mark_forced:
+            self.have_forced_answer = True
+        return AgentStep(action=output, observation=error)
+
+    def _parsing_error_observation(self, e: OutputParserException) -> str:
+        """Turn an output parsing error into the observation sent back to the agent."""
+        if isinstance(self.handle_parsing_errors, bool):
+            raise_error = not self.handle_parsing_errors
+        else:
+            raise_error = False
+        if raise_error:
+            raise ValueError(
+                "An output parsing error occurred. "
+                "In order to pass this error back to the agent and have it try "
+                "again, pass `handle_parsing_errors=True` to the AgentExecutor. "
+                f"This is the error: {str(e)}"
+            )
+        if isinstance(self.handle_parsing_errors, bool):
+            if e.send_to_llm:
+                observation = f"\n{str(e.observation)}"
             else:
-                if tool_calling.tool_name.casefold().strip() in [
-                    name.casefold().strip() for name in name_to_tool_map
-                ] or tool_calling.tool_name.casefold().replace("_", " ") in [
-                    name.casefold().strip() for name in name_to_tool_map
-                ]:
-                    observation = tool_usage.use(tool_calling, agent_action.log)
-                else:
-                    observation = self._i18n.errors("wrong_tool_name").format(
-                        tool=tool_calling.tool_name,
-                        tools=", ".join([tool.name.casefold() for tool in self.tools]),
-                    )
-            yield AgentStep(action=agent_action, observation=observation)
+                observation = ""
+        elif isinstance(self.handle_parsing_errors, str):
+            observation = f"\n{self.handle_parsing_errors}"
+        elif callable(self.handle_parsing_errors):
+            observation = f"\n{self.handle_parsing_errors(e)}"
+        else:
+            raise ValueError("Got unexpected type of `handle_parsing_errors`")
+        return observation
+
+    def _process_agent_finish(self, output: AgentFinish) -> Union[AgentFinish, AgentStep]:
+        """Return the final answer, or a human feedback step when input is requested."""
+        if self.should_ask_for_human_input:
+            human_feedback = self._ask_human_input(output.return_values["output"])
+
+            if self.squad and self.squad._train:
+                self._handle_squad_training_output(output, human_feedback)
+
+            # Making sure we only ask for it once, so disabling for the next thought loop
+            self.should_ask_for_human_input = False
+            action = AgentAction(
+                tool="Human Input", tool_input=human_feedback, log=output.log
+            )
+
+            return AgentStep(
+                action=action,
+                observation=self._i18n.slice("human_feedback").format(
+                    human_feedback=human_feedback
+                ),
+            )
+
+        if self.squad and self.squad._train:
+            self._handle_squad_training_output(output)
+
+        self._stream_event(
+            SquadStreamEventType.final_answer, output.return_values["output"]
+        )
+        return output
+
+    def _stream_event(
+        self, event_type: SquadStreamEventType, content: str, tool: Optional[str] = None
+    ) -> None:
+        """Send an event to the squad stream when the squad is kicked off in streaming mode."""
+        emit = getattr(self.squad, "_stream_emitter", None)
+        if emit is None:
+            return
+        emit(
+            SquadStreamEvent(
+                type=event_type,
+                content=str(content),
+                agent=self.squad_agent.role if self.squad_agent else None,
+                task=self.task.description if self.task else None,
+                tool=tool,
+            )
+        )
+
+    def _create_tool_usage(self, agent_action: AgentAction) -> ToolUsage:
+        return ToolUsage(
+            tools_handler=self.tools_handler,  # type: ignore # Argument "tools_handler" to "ToolUsage" has incompatible type "ToolsHandler | None"; expected "ToolsHandler"
+            tools=self.tools,  # type: ignore # Argument "tools" to "ToolUsage" has incompatible type "Sequence[BaseTool]"; expected "list[BaseTool]"
+            original_tools=self.original_tools,
+            tools_description=self.tools_description,
+            tools_names=self.tools_names,
+            function_calling_llm=self.function_calling_llm,
+            task=self.task,
+            agent=self.squad_agent,
+            action=agent_action,
+            tool_index=self._tool_index(),
+            timeout=self._tool_timeout(),
+        )
+
+    def _tool_index(self) -> ToolIndex:
+        """Index of the tools, rebuilt only when the agent hands the executor new tools."""
+        if self.tool_index is None or self.tool_index.tools is not self.tools:
+            self.tool_index = ToolIndex(self.tools)
+        return self.tool_index
+
+    def _wrong_tool_name_error(self, tool_name: str) -> str:
+        return self._i18n.errors("wrong_tool_name").format(
+            tool=tool_name,
+            tools=", ".join([tool.name.casefold() for tool in self.tools]),
+        )
 
     def _handle_squad_training_output(
         self, output: AgentFinish, human_feedback: str | None = None
@@ -308,90 +648,91 @@ class SquadAgentExecutor(AgentExecutor, SquadAgentExecutorMixin):
                 self.squad._train_iteration, agent_id, training_data
             )
 
-    def _handle_context_length(
-        self, intermediate_steps: List[Tuple[AgentAction, str]]
+    def _fit_context_window(
+        self,
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        inputs: Dict[str, Any],
     ) -> List[Tuple[AgentAction, str]]:
-        text = intermediate_steps[0][1]
-        original_action = intermediate_steps[0][0]
+        if not self.context_window:
+            return intermediate_steps
+        return self.context_window.fit(intermediate_steps, inputs)
 
-        text_splitter = RecursiveCharacterTextSplitter(
-            separators=["\n\n", "\n"],
-            chunk_size=8000,
-            chunk_overlap=500,
-        )
+    def _plan(
+        self,
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[CallbackManagerForChainRun],
+        inputs: Dict[str, Any],
+    ) -> Union[AgentAction, AgentFinish]:
+        """Call the LLM, fitting the steps into a smaller budget if the provider rejects the prompt."""
+        callbacks = run_manager.get_child() if run_manager else None
+        try:
+            return self.agent.plan(intermediate_steps, callbacks=callbacks, **inputs)
+        except OutputParserException:
+            raise
+        except Exception as e:
+            intermediate_steps = self._refit_context_window(e, intermediate_steps, inputs)
+
+        try:
+            return self.agent.plan(intermediate_steps, callbacks=callbacks, **inputs)
+        except OutputParserException:
+            raise
+        except Exception as e:
+            self._raise_context_length_error(e)
+            raise
 
-        if self._fit_context_window_strategy == "summarize":
-            docs = text_splitter.create_documents([text])
-            self._logger.log(
-                "debug",
-                "Summarizing Content, it is recommended to use a RAG tool",
-                color="bold_blue",
+    async def _aplan(
+        self,
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun],
+        inputs: Dict[str, Any],
+    ) -> Union[AgentAction, AgentFinish]:
+        callbacks = run_manager.get_child() if run_manager else None
+        try:
+            return await self.agent.aplan(
+                intermediate_steps, callbacks=callbacks, **inputs
             )
-            summarize_chain = load_summarize_chain(
-                self.llm, chain_type="map_reduce", verbose=True
+        except OutputParserException:
+            raise
+        except Exception as e:
+            intermediate_steps = await asyncio.to_thread(
+                self._refit_context_window, e, intermediate_steps, inputs
             )
-            summarized_docs = []
-            for doc in docs:
-                summary = summarize_chain.invoke(
-                    {"input_documents": [doc]}, return_only_outputs=True
-                )
-
-                summarized_docs.append(summary["output_text"])
 
-            formatted_results = "\n\n".join(summarized_docs)
-            summary_step = AgentStep(
-                action=AgentAction(
-                    tool=original_action.tool,
-                    tool_input=original_action.tool_input,
-                    log=original_action.log,
-                ),
-                observation=formatted_results,
+        try:
+            return await self.agent.aplan(
+                intermediate_steps, callbacks=callbacks, **inputs
             )
-            summary_tuple = (summary_step.action, summary_step.observation)
-            return [summary_tuple]
-
-        return intermediate_steps
+        except OutputParserException:
+            raise
+        except Exception as e:
+            self._raise_context_length_error(e)
+            raise
 
-    def _handle_context_length_error(
+    def _refit_context_window(
         self,
+        error: Exception,
         intermediate_steps: List[Tuple[AgentAction, str]],
-        run_manager: Optional[CallbackManagerForChainRun],
-        inputs: Dict[str, str],
-    ) -> Union[AgentFinish, List[AgentStep]]:
+        inputs: Dict[str, Any],
+    ) -> List[Tuple[AgentAction, str]]:
+        """Shrink the token budget after a context length error, re-raising any other error."""
+        if not self.context_window:
+            self._raise_context_length_error(error)
+            raise error
+        if not LLMContextLengthExceededException(str(error))._is_context_limit_error(
+            str(error)
+        ):
+            raise error
+
         self._logger.log(
             "debug",
-            "Context length exceeded. Asking user if they want to use summarize prompt to fit, this will reduce context length.",
+            "Context length exceeded. Shrinking the context window budget and retrying.",
             color="yellow",
         )
-        user_choice = click.confirm(
-            "Context length exceeded. Do you want to summarize the text to fit models context window?"
-        )
-        if user_choice:
-            self._logger.log(
-                "debug",
-                "Context length exceeded. Using summarize prompt to fit, this will reduce context length.",
-                color="bold_blue",
-            )
-            intermediate_steps = self._handle_context_length(intermediate_steps)
-
-            output = self.agent.plan(
-                intermediate_steps,
-                callbacks=run_manager.get_child() if run_manager else None,
-                **inputs,
-            )
+        self.context_window.shrink()
+        return self.context_window.fit(intermediate_steps, inputs)
 
-            if isinstance(output, AgentFinish):
-                return output
-            elif isinstance(output, AgentAction):
-                return [AgentStep(action=output, observation=None)]
-            else:
-                return [AgentStep(action=action, observation=None) for action in output]
-        else:
-            self._logger.log(
-                "debug",
-                "Context length exceeded. Consider using smaller text or RAG tools from squadai_tools.",
-                color="red",
-            )
-            raise SystemExit(
-                "Context length exceeded and user opted not to summarize. Consider using smaller text or RAG tools from squadai_tools."
-            )
+    def _raise_context_length_error(self, error: Exception) -> None:
+        if LLMContextLengthExceededException(str(error))._is_context_limit_error(
+            str(error)
+        ):
+            raise LLMContextLengthExceededException(str(error)) from error
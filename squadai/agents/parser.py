@@ -1,5 +1,5 @@
 import re
-from typing import Any, Union
+from typing import Any, List, Union
 
 from json_repair import repair_json
 from langchain.agents.output_parsers import ReActSingleInputOutputParser
@@ -12,6 +12,9 @@ FINAL_ANSWER_ACTION = "Final Answer:"
 MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action:' after 'Thought:'. I will do right next, and don't use a tool I have already used.\n"
 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action Input:' after 'Action:'. I will do right next, and don't use a tool I have already used.\n"
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = "I did it wrong. Tried to both perform Action and give a Final Answer at the same time, I must do one or the other"
+ACTION_REGEX = r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
+# An action starts on its own line, "Action Input:" lines do not match
+ACTION_START_REGEX = re.compile(r"^[ \t*]*Action\s*\d*\s*:", re.MULTILINE)
 
 
 class SquadAgentParser(ReActSingleInputOutputParser):
@@ -33,31 +36,25 @@ class SquadAgentParser(ReActSingleInputOutputParser):
 
     Thought: agent thought here
     Final Answer: The temperature is 100 degrees
+
+    Several actions given one after the other, each with its own Action and
+    Action Input, result in a list of AgentActions, one per action.
     """
 
     _i18n: I18N = I18N()
     agent: Any = None
 
-    def parse(self, text: str) -> Union[AgentAction, AgentFinish]:
+    def parse(self, text: str) -> Union[AgentAction, List[AgentAction], AgentFinish]:
         includes_answer = FINAL_ANSWER_ACTION in text
-        regex = (
-            r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
-        )
-        action_match = re.search(regex, text, re.DOTALL)
+        action_match = re.search(ACTION_REGEX, text, re.DOTALL)
         if action_match:
             if includes_answer:
                 raise OutputParserException(
                     f"{FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE}: {text}"
                 )
-            action = action_match.group(1)
-            clean_action = self._clean_action(action)
-
-            action_input = action_match.group(2).strip()
-
-            tool_input = action_input.strip(" ").strip('"')
-            safe_tool_input = self._safe_repair_json(tool_input)
-
-            return AgentAction(clean_action, safe_tool_input, text)
+            if actions := self._parse_actions(text):
+                return actions
+            return self._action(action_match, text)
 
         elif includes_answer:
             return AgentFinish(
@@ -93,6 +90,37 @@ class SquadAgentParser(ReActSingleInputOutputParser):
                 send_to_llm=True,
             )
 
+    def _parse_actions(self, text: str) -> List[AgentAction]:
+        """Split text holding several actions, an empty list when it holds one.
+
+        Each action gets its own block of the text as log, the first one
+        keeping the thought before it.
+        """
+        starts = [match.start() for match in ACTION_START_REGEX.finditer(text)]
+        if len(starts) < 2:
+            return []
+
+        bounds = [0] + starts[1:] + [len(text)]
+        actions = []
+        for start, end in zip(bounds, bounds[1:]):
+            block = text[start:end].rstrip()
+            action_match = re.search(ACTION_REGEX, block, re.DOTALL)
+            if not action_match:
+                # Not a list of actions, the input of the first one mentions an action
+                return []
+            actions.append(self._action(action_match, block))
+        return actions
+
+    def _action(self, action_match: re.Match, log: str) -> AgentAction:
+        clean_action = self._clean_action(action_match.group(1))
+
+        action_input = action_match.group(2).strip()
+
+        tool_input = action_input.strip(" ").strip('"')
+        safe_tool_input = self._safe_repair_json(tool_input)
+
+        return AgentAction(clean_action, safe_tool_input, log)
+
     def _clean_action(self, text: str) -> str:
         """Clean action string by removing non-essential formatting characters."""
         return re.sub(r"^\s*\*+\s*|\s*\*+\s*$", "", text).strip()
@@ -0,0 +1,278 @@
+import asyncio
+import os
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Callable, Iterator, Mapping, Optional
+
+from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import BaseModel, Field
+
+from squadai.utilities.logger import Logger
+from squadai.utilities.rpm_controller import RPMController
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse '30', '7.66s', '2m59.56s' or '120ms' into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimitInfo(BaseModel):
+    """Rate limit state reported by the provider in the headers of a response."""
+
+    retry_after: Optional[float] = Field(
+        description="Seconds the provider asks to wait before retrying", default=None
+    )
+    remaining_requests: Optional[int] = Field(
+        description="Requests left in the current window", default=None
+    )
+    remaining_tokens: Optional[int] = Field(
+        description="Tokens left in the current window", default=None
+    )
+    reset_requests: Optional[float] = Field(
+        description="Seconds until the requests window resets", default=None
+    )
+    reset_tokens: Optional[float] = Field(
+        description="Seconds until the tokens window resets", default=None
+    )
+
+    @classmethod
+    def from_headers(cls, headers: Optional[Mapping[str, str]]) -> "RateLimitInfo":
+        if not headers:
+            return cls()
+
+        retry_after = None
+        if retry_after_ms := headers.get("retry-after-ms"):
+            retry_after = _parse_duration(retry_after_ms)
+            retry_after = retry_after / 1000 if retry_after is not None else None
+        elif value := headers.get("retry-after"):
+            retry_after = _parse_duration(value)
+            if retry_after is None:
+                try:
+                    retry_after = parsedate_to_datetime(value).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    retry_after = None
+
+        return cls(
+            retry_after=max(retry_after, 0.0) if retry_after is not None else None,
+            remaining_requests=_parse_int(headers.get("x-ratelimit-remaining-requests")),
+            remaining_tokens=_parse_int(headers.get("x-ratelimit-remaining-tokens")),
+            reset_requests=_parse_duration(headers.get("x-ratelimit-reset-requests")),
+            reset_tokens=_parse_duration(headers.get("x-ratelimit-reset-tokens")),
+        )
+
+    @classmethod
+    def from_response(cls, response: Any) -> "RateLimitInfo":
+        """Read the limits from the headers a client put in the response metadata.
+
+        ChatOpenAI does so with include_response_headers=True.
+        """
+        metadata = getattr(response, "response_metadata", None) or {}
+        return cls.from_headers(metadata.get("headers"))
+
+    def wait_time(self) -> Optional[float]:
+        """Seconds to wait before the next request, None when the headers do not say."""
+        if self.retry_after is not None:
+            return self.retry_after
+        resets = [
+            reset
+            for remaining, reset in (
+                (self.remaining_requests, self.reset_requests),
+                (self.remaining_tokens, self.reset_tokens),
+            )
+            if remaining == 0 and reset is not None
+        ]
+        return max(resets) if resets else None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an LLM client error is a 429 response."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429 or type(error).__name__ == "RateLimitError"
+
+
+class RateLimitRetryLLM(Runnable):
+    """Runnable retrying the rate limited calls of the bound LLM.
+
+    A 429 is retried after the delay the provider asks for in its retry-after
+    or x-ratelimit-* headers, or after an exponential backoff when it gives
+    none, with jitter so agents limited together do not retry in lockstep. The
+    delay and the remaining quota are reported to the rate limiter, so every
+    agent sharing it holds back instead of only the one that was limited. The
+    quota reported with successful responses is reported as well, so the rate
+    limiter slows down before the provider starts refusing calls.
+
+    Attributes:
+        max_retries: Retries of one call, defaults to SQUADAI_LLM_MAX_RETRIES or 5.
+        on_throttled: Called with the seconds waited before each retry.
+    """
+
+    def __init__(
+        self,
+        bound: Runnable,
+        rate_limiter: Optional[RPMController] = None,
+        max_retries: Optional[int] = None,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        logger: Optional[Logger] = None,
+        on_throttled: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        if max_retries is None:
+            max_retries = int(os.environ.get("SQUADAI_LLM_MAX_RETRIES", 5))
+
+        self.bound = bound
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.logger = logger or Logger(verbose=False)
+        self.on_throttled = on_throttled
+
+    def invoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        attempt = 0
+        while True:
+            try:
+                output = self.bound.invoke(input, config, **kwargs)
+            except Exception as e:
+                self._wait(self._retry_delay(e, attempt))
+                attempt += 1
+                continue
+            self._observe(output)
+            return output
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        attempt = 0
+        while True:
+            try:
+                output = await self.bound.ainvoke(input, config, **kwargs)
+            except Exception as e:
+                await self._await(self._retry_delay(e, attempt))
+                attempt += 1
+                continue
+            self._observe(output)
+            return output
+
+    def stream(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Iterator[Any]:
+        attempt = 0
+        while True:
+            streamed = False
+            try:
+                for chunk in self.bound.stream(input, config, **kwargs):
+                    if not streamed:
+                        streamed = True
+                        self._observe(chunk)
+                    yield chunk
+                return
+            except Exception as e:
+                # Chunks already handed out cannot be taken back
+                if streamed:
+                    raise
+                self._wait(self._retry_delay(e, attempt))
+                attempt += 1
+
+    async def astream(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        attempt = 0
+        while True:
+            streamed = False
+            try:
+                async for chunk in self.bound.astream(input, config, **kwargs):
+                    if not streamed:
+                        streamed = True
+                        self._observe(chunk)
+                    yield chunk
+                return
+            except Exception as e:
+                if streamed:
+                    raise
+                await self._await(self._retry_delay(e, attempt))
+                attempt += 1
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Seconds to wait before retrying, re-raising errors that are not retried."""
+        if not is_rate_limit_error(error) or attempt >= self.max_retries:
+            raise error
+
+        rate_limits = RateLimitInfo.from_headers(
+            getattr(getattr(error, "response", None), "headers", None)
+        )
+        delay = rate_limits.wait_time()
+        if delay is None:
+            delay = min(self.max_delay, self.base_delay * 2**attempt)
+        delay += random.uniform(0, delay * 0.25)
+
+        self.logger.log(
+            "info",
+            f"Rate limited by the LLM provider, retrying in {delay:.1f}s "
+            f"(attempt {attempt + 1} of {self.max_retries}).",
+        )
+        if self.rate_limiter:
+            self.rate_limiter.apply_rate_limits(
+                pause=delay,
+                remaining_requests=rate_limits.remaining_requests,
+                remaining_tokens=rate_limits.remaining_tokens,
+            )
+        return delay
+
+    def _observe(self, response: Any) -> None:
+        """Report the quota left, as told by a successful response, to the rate limiter."""
+        if not self.rate_limiter:
+            return
+        rate_limits = RateLimitInfo.from_response(response)
+        self.rate_limiter.apply_rate_limits(
+            pause=rate_limits.wait_time(),
+            remaining_requests=rate_limits.remaining_requests,
+            remaining_tokens=rate_limits.remaining_tokens,
+        )
+
+    # The rate limiter, paused for the delay, lines the retry up with the other
+    # callers, the delay itself is still waited in full if it lets the retry through sooner
+    def _wait(self, delay: float) -> None:
+        started = time.monotonic()
+        if self.rate_limiter:
+            self.rate_limiter.check_or_wait()
+        remaining = delay - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+        if self.on_throttled:
+            self.on_throttled(time.monotonic() - started)
+
+    async def _await(self, delay: float) -> None:
+        started = time.monotonic()
+        if self.rate_limiter:
+            await self.rate_limiter.acheck_or_wait()
+        remaining = delay - (time.monotonic() - started)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        if self.on_throttled:
+            self.on_throttled(time.monotonic() - started)
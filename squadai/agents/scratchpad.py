@@ -0,0 +1,42 @@
+from typing import List, Sequence, Tuple
+
+from langchain_core.agents import AgentAction
+
+
+class AgentScratchpad:
+    """Scratchpad of one agent run, extended one step at a time.
+
+    The text of the steps already rendered is kept and only the new steps are
+    formatted and appended, so each LLM call of the run starts with the exact
+    bytes of the previous prompt. When the steps no longer extend the rendered
+    ones, because they were trimmed or summarized, the text is rebuilt.
+    """
+
+    def __init__(
+        self, observation_prefix: str = "Observation: ", llm_prefix: str = ""
+    ) -> None:
+        self.observation_prefix = observation_prefix
+        self.llm_prefix = llm_prefix
+        self._steps: List[Tuple[AgentAction, str]] = []
+        self._text = ""
+
+    def render(self, intermediate_steps: Sequence[Tuple[AgentAction, str]]) -> str:
+        """Return the scratchpad of the given steps, formatting only the new ones."""
+        if not self._extends(intermediate_steps):
+            self._steps = []
+            self._text = ""
+
+        new_steps = intermediate_steps[len(self._steps) :]
+        if new_steps:
+            self._text += "".join(
+                f"{action.log}\n{self.observation_prefix}{observation}\n{self.llm_prefix}"
+                for action, observation in new_steps
+            )
+            self._steps.extend(new_steps)
+        return self._text
+
+    def _extends(self, intermediate_steps: Sequence[Tuple[AgentAction, str]]) -> bool:
+        # Steps are compared by identity, the executor appends the same tuples to its list
+        return len(intermediate_steps) >= len(self._steps) and all(
+            step is rendered for step, rendered in zip(intermediate_steps, self._steps)
+        )
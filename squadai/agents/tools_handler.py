@@ -21,6 +21,7 @@ class ToolsHandler:
         calling: Union[ToolCalling, InstructorToolCalling],
         output: str,
         should_cache: bool = True,
+        ttl: Optional[float] = None,
     ) -> Any:
         """Run when tool ends running."""
         self.last_used_tool = calling  # type: ignore # BUG?: Incompatible types in assignment (expression has type "Union[ToolCalling, InstructorToolCalling]", variable has type "ToolCalling")
@@ -29,4 +30,5 @@ class ToolsHandler:
                 tool=calling.tool_name,
                 input=calling.arguments,
                 output=output,
+                ttl=ttl,
             )
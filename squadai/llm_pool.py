@@ -0,0 +1,355 @@
+import os
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from squadai.agents.context_window import llm_context_window_size
+from squadai.agents.rate_limit_retry import RateLimitInfo, is_rate_limit_error
+from squadai.utilities.rpm_controller import RPMController
+
+
+class LLMPoolEntry(BaseModel):
+    """Class that represents one model endpoint of an LLMPool and its observed health."""
+
+    llm: Any = Field(description="Chat model serving this entry")
+    name: Optional[str] = Field(
+        description="Name of the entry, defaults to the model name", default=None
+    )
+    roles: List[str] = Field(
+        description="Roles this entry is reserved for, such as planner or evaluator",
+        default_factory=list,
+    )
+    max_rpm: Optional[int] = Field(
+        description="Requests per minute allowed on this endpoint", default=None
+    )
+    max_tpm: Optional[int] = Field(
+        description="Tokens per minute allowed on this endpoint", default=None
+    )
+    _rate_limiter: RPMController = PrivateAttr()
+    _latency: Optional[float] = PrivateAttr(default=None)
+    _failures: int = PrivateAttr(default=0)
+    _cooldown_until: float = PrivateAttr(default=0.0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @model_validator(mode="after")
+    def set_private_attrs(self):
+        if self.name is None:
+            self.name = getattr(self.llm, "model_name", None) or type(self.llm).__name__
+        self._rate_limiter = RPMController(max_rpm=self.max_rpm, max_tpm=self.max_tpm)
+        return self
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Smoothed latency of the calls served, in seconds."""
+        return self._latency
+
+    @property
+    def available(self) -> bool:
+        return self._cooldown_until <= time.monotonic()
+
+    def score(self) -> float:
+        """Expected cost of routing a call here, lower is better.
+
+        Entries not called yet score 0 so each one gets measured.
+        """
+        capacity = self._rate_limiter.capacity()
+        if capacity <= 0:
+            return float("inf")
+        latency = self._latency if self._latency is not None else 0.0
+        return latency / capacity
+
+    def record_success(self, latency: float, smoothing: float) -> None:
+        with self._lock:
+            self._failures = 0
+            self._latency = (
+                latency
+                if self._latency is None
+                else smoothing * latency + (1 - smoothing) * self._latency
+            )
+
+    def record_failure(self, error: Exception, cooldown: float) -> bool:
+        """Take the entry out of rotation when the error is the endpoint's fault.
+
+        A 429 pauses the entry for as long as the provider asks, connection
+        errors, timeouts and 5xx responses cool it down. Other errors, such as
+        a 400 or a prompt over the context length, would fail on every entry,
+        they leave the entry alone.
+
+        Returns:
+            Whether the call should fail over to the next entry.
+        """
+        if is_rate_limit_error(error):
+            rate_limits = RateLimitInfo.from_headers(
+                getattr(getattr(error, "response", None), "headers", None)
+            )
+            self._rate_limiter.apply_rate_limits(
+                pause=rate_limits.wait_time() or cooldown,
+                remaining_requests=rate_limits.remaining_requests,
+                remaining_tokens=rate_limits.remaining_tokens,
+            )
+            return True
+        if not is_endpoint_error(error):
+            return False
+
+        with self._lock:
+            self._failures += 1
+            backoff = min(cooldown * 2 ** (self._failures - 1), 600.0)
+            self._cooldown_until = time.monotonic() + backoff
+        return True
+
+
+def is_endpoint_error(error: BaseException) -> bool:
+    """Whether an LLM client error comes from the endpoint rather than the request.
+
+    Those are connection errors, timeouts and 5xx responses.
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status >= 500 or status == 408
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    # Client libraries name them APIConnectionError, APITimeoutError, ConnectTimeout...
+    name = type(error).__name__
+    return "Connect" in name or "Timeout" in name
+
+
+class LLMPool(BaseChatModel):
+    """Chat model routing each call to one of several model endpoints.
+
+    Each call goes to the available entry with the lowest smoothed latency
+    weighed by its remaining rate-limit budget. Entries without observations
+    yet are tried first. An entry failing on its side, through a connection
+    error, a timeout or a 5xx, is cooled down and the call fails over to the
+    next one, and entries limited by the provider are paused for as long as
+    its rate-limit headers ask. Errors of the request itself are raised right
+    away. Entries are shared by the pools
+    returned by for_role, so every pool routes on the same observations.
+    """
+
+    entries: List[LLMPoolEntry]
+    smoothing: float = 0.3
+    cooldown: float = 30.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "squadai-llm-pool"
+
+    @property
+    def model_name(self) -> str:
+        return self.entries[0].name if self.entries else ""
+
+    @property
+    def context_window(self) -> Optional[int]:
+        """Smallest context window of the entries, a prompt must fit whichever one serves it."""
+        sizes = [
+            llm_context_window_size(
+                entry.llm, getattr(entry.llm, "model_name", None) or entry.name
+            )
+            for entry in self.entries
+        ]
+        known = [size for size in sizes if size]
+        return min(known) if known else None
+
+    def for_role(self, role: str) -> "LLMPool":
+        """Pool of the entries reserved for a role, this pool when none are."""
+        entries = [entry for entry in self.entries if role in entry.roles]
+        if not entries:
+            return self
+        return LLMPool(
+            entries=entries,
+            smoothing=self.smoothing,
+            cooldown=self.cooldown,
+            callbacks=self.callbacks,
+        )
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        errors: List[Exception] = []
+        for entry in self._ranked_entries():
+            entry._rate_limiter.check_or_wait()
+            started = time.perf_counter()
+            try:
+                result = entry.llm._generate(
+                    messages, stop=stop, run_manager=run_manager, **kwargs
+                )
+            except Exception as e:
+                if not entry.record_failure(e, self.cooldown):
+                    raise
+                errors.append(e)
+                continue
+            entry.record_success(time.perf_counter() - started, self.smoothing)
+            return result
+        raise errors[-1]
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        errors: List[Exception] = []
+        for entry in self._ranked_entries():
+            await entry._rate_limiter.acheck_or_wait()
+            started = time.perf_counter()
+            try:
+                result = await entry.llm._agenerate(
+                    messages, stop=stop, run_manager=run_manager, **kwargs
+                )
+            except Exception as e:
+                if not entry.record_failure(e, self.cooldown):
+                    raise
+                errors.append(e)
+                continue
+            entry.record_success(time.perf_counter() - started, self.smoothing)
+            return result
+        raise errors[-1]
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        errors: List[Exception] = []
+        for entry in self._ranked_entries():
+            entry._rate_limiter.check_or_wait()
+            started = time.perf_counter()
+            streamed = False
+            try:
+                # Tokens are reported by BaseChatModel.stream, not by the entry
+                for chunk in self._entry_stream(entry.llm, messages, stop, **kwargs):
+                    if not streamed:
+                        streamed = True
+                        entry.record_success(
+                            time.perf_counter() - started, self.smoothing
+                        )
+                    yield chunk
+                return
+            except Exception as e:
+                # Chunks already handed out cannot be taken back
+                if not entry.record_failure(e, self.cooldown) or streamed:
+                    raise
+                errors.append(e)
+        raise errors[-1]
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        errors: List[Exception] = []
+        for entry in self._ranked_entries():
+            await entry._rate_limiter.acheck_or_wait()
+            started = time.perf_counter()
+            streamed = False
+            try:
+                async for chunk in self._entry_astream(
+                    entry.llm, messages, stop, **kwargs
+                ):
+                    if not streamed:
+                        streamed = True
+                        entry.record_success(
+                            time.perf_counter() - started, self.smoothing
+                        )
+                    yield chunk
+                return
+            except Exception as e:
+                if not entry.record_failure(e, self.cooldown) or streamed:
+                    raise
+                errors.append(e)
+        raise errors[-1]
+
+    def _ranked_entries(self) -> List[LLMPoolEntry]:
+        """Entries in the order they are tried, cooling down ones last."""
+        if not self.entries:
+            raise ValueError("LLMPool has no entries")
+        return sorted(
+            self.entries, key=lambda entry: (not entry.available, entry.score())
+        )
+
+    @staticmethod
+    def _entry_stream(
+        llm: BaseChatModel, messages: List[BaseMessage], stop, **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        if type(llm)._stream is BaseChatModel._stream:
+            result = llm._generate(messages, stop=stop, **kwargs)
+            yield _as_chunk(result)
+        else:
+            yield from llm._stream(messages, stop=stop, **kwargs)
+
+    @staticmethod
+    async def _entry_astream(
+        llm: BaseChatModel, messages: List[BaseMessage], stop, **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        if type(llm)._astream is BaseChatModel._astream:
+            result = await llm._agenerate(messages, stop=stop, **kwargs)
+            yield _as_chunk(result)
+        else:
+            async for chunk in llm._astream(messages, stop=stop, **kwargs):
+                yield chunk
+
+
+def _as_chunk(result: ChatResult) -> ChatGenerationChunk:
+    message = result.generations[0].message
+    return ChatGenerationChunk(
+        message=AIMessageChunk(
+            content=message.content,
+            usage_metadata=getattr(message, "usage_metadata", None),
+        )
+    )
+
+
+# Model names -> entries of the default pools over these models
+_default_pool_entries: Dict[Tuple[str, ...], List[LLMPoolEntry]] = {}
+_default_pool_entries_lock = threading.Lock()
+
+
+def default_llm(role: Optional[str] = None) -> Any:
+    """Build the LLM used when none is given, for an agent or for a squad role.
+
+    GROQ_<ROLE>_MODEL_NAME, for example GROQ_PLANNER_MODEL_NAME, picks a model
+    for a role such as planner or evaluator. GROQ_MODEL_NAMES, a comma
+    separated list, spreads the calls over a pool of models. Otherwise the
+    model is GROQ_MODEL_NAME.
+    """
+    from langchain_groq import ChatGroq
+
+    if role and (model := os.environ.get(f"GROQ_{role.upper()}_MODEL_NAME")):
+        return ChatGroq(model=model)
+
+    model_names = [
+        name.strip()
+        for name in os.environ.get("GROQ_MODEL_NAMES", "").split(",")
+        if name.strip()
+    ]
+    if not model_names:
+        return ChatGroq(model=os.environ.get("GROQ_MODEL_NAME"))
+
+    # Entries are shared so every default pool routes on the same observations,
+    # the pool itself is per caller since agents attach their own callbacks to it
+    with _default_pool_entries_lock:
+        entries = _default_pool_entries.get(tuple(model_names))
+        if entries is None:
+            entries = [LLMPoolEntry(llm=ChatGroq(model=name)) for name in model_names]
+            _default_pool_entries[tuple(model_names)] = entries
+    return LLMPool(entries=entries)
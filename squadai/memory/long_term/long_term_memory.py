@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from squadai.memory.long_term.long_term_memory_item import LongTermMemoryItem
 from squadai.memory.memory import Memory
@@ -19,14 +19,22 @@ class LongTermMemory(Memory):
         super().__init__(storage)
 
     def save(self, item: LongTermMemoryItem) -> None:  # type: ignore # BUG?: Signature of "save" incompatible with supertype "Memory"
+        self.storage.save(**self._row(item))  # type: ignore # BUG?: Unexpected keyword argument "task_description","score","datetime" for "save" of "Storage"
+
+    def save_many(self, items: List[LongTermMemoryItem]) -> None:
+        """Save several items in one storage transaction."""
+        self.storage.save_many([self._row(item) for item in items])  # type: ignore # "Storage" has no attribute "save_many"
+
+    @staticmethod
+    def _row(item: LongTermMemoryItem) -> Dict[str, Any]:
         metadata = item.metadata
         metadata.update({"agent": item.agent, "expected_output": item.expected_output})
-        self.storage.save(  # type: ignore # BUG?: Unexpected keyword argument "task_description","score","datetime" for "save" of "Storage"
-            task_description=item.task,
-            score=metadata["quality"],
-            metadata=metadata,
-            datetime=item.datetime,
-        )
+        return {
+            "task_description": item.task,
+            "score": metadata["quality"],
+            "metadata": metadata,
+            "datetime": item.datetime,
+        }
 
     def search(self, task: str, latest_n: int = 3) -> Dict[str, Any]:
         return self.storage.load(task, latest_n)  # type: ignore # BUG?: "Storage" has no attribute "load"
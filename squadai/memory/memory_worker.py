@@ -0,0 +1,164 @@
+import atexit
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# (future, function, arguments, whether the function takes a batch of items)
+_Job = Tuple[Future, Callable[..., Any], Tuple[Any, ...], bool]
+
+
+class MemoryWorker:
+    """Bounded background worker saving memories off the agent loop.
+
+    Jobs wait in a bounded queue, so a burst of finished tasks blocks the
+    producers instead of piling up evaluator threads. A fixed number of worker
+    threads drain the queue in batches: the batched jobs of a same function are
+    handed to it together, so it can evaluate and store them in one go. Pending
+    jobs are flushed, for at most exit_timeout seconds, when the process exits.
+
+    Attributes:
+        max_workers: Number of worker threads, defaults to SQUADAI_MEMORY_WORKERS or 2.
+        max_queue_size: Number of jobs allowed to wait, defaults to SQUADAI_MEMORY_QUEUE or 100.
+        batch_size: Maximum number of jobs a worker takes from the queue at once,
+            defaults to SQUADAI_MEMORY_BATCH_SIZE or 8.
+        exit_timeout: Seconds the exit flush waits for pending jobs, defaults to
+            SQUADAI_MEMORY_EXIT_TIMEOUT or 30.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        exit_timeout: Optional[float] = None,
+    ) -> None:
+        if max_workers is None:
+            max_workers = int(os.environ.get("SQUADAI_MEMORY_WORKERS", 2))
+        if max_queue_size is None:
+            max_queue_size = int(os.environ.get("SQUADAI_MEMORY_QUEUE", 100))
+        if batch_size is None:
+            batch_size = int(os.environ.get("SQUADAI_MEMORY_BATCH_SIZE", 8))
+        if exit_timeout is None:
+            exit_timeout = float(os.environ.get("SQUADAI_MEMORY_EXIT_TIMEOUT", 30))
+
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.batch_size = max(batch_size, 1)
+        self.exit_timeout = exit_timeout
+        self._queue: "queue.Queue[_Job]" = queue.Queue(maxsize=max_queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Queue a job, blocking while the queue is full.
+
+        Returns:
+            Future holding the result of the job.
+        """
+        return self._put(fn, args, batched=False)
+
+    def submit_batched(self, fn: Callable[[List[Any]], List[Any]], item: Any) -> Future:
+        """Queue an item for a function handling batches, blocking while the queue is full.
+
+        The items of the same function drained together are passed to it in one
+        call, which returns one result per item.
+
+        Returns:
+            Future holding the result of the item.
+        """
+        return self._put(fn, (item,), batched=True)
+
+    def _put(self, fn: Callable[..., Any], args: Tuple[Any, ...], batched: bool) -> Future:
+        self._start()
+        future: Future = Future()
+        with self._lock:
+            self._pending += 1
+        self._queue.put((future, fn, args, batched))
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every queued job to finish.
+
+        Returns:
+            Whether all jobs finished before the timeout.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running."""
+        return self._pending
+
+    def _start(self) -> None:
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.max_workers):
+                thread = threading.Thread(
+                    target=self._work, name=f"squadai-memory-{index}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        atexit.register(self.flush, self.exit_timeout)
+
+    def _work(self) -> None:
+        while True:
+            jobs = [self._queue.get()]
+            while len(jobs) < self.batch_size:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            batches: Dict[Callable[..., Any], List[_Job]] = {}
+            for job in jobs:
+                future, fn, args, batched = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if batched:
+                    batches.setdefault(fn, []).append(job)
+                    continue
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            for fn, batch in batches.items():
+                try:
+                    results = list(fn([args[0] for _, _, args, _ in batch]))
+                    if len(results) != len(batch):
+                        raise ValueError(
+                            f"{fn!r} returned {len(results)} results for {len(batch)} items."
+                        )
+                    for (future, _, _, _), result in zip(batch, results):
+                        future.set_result(result)
+                except BaseException as e:
+                    for future, _, _, _ in batch:
+                        future.set_exception(e)
+
+            for _ in jobs:
+                self._queue.task_done()
+            with self._idle:
+                self._pending -= len(jobs)
+                if self._pending == 0:
+                    self._idle.notify_all()
+
+
+_default_memory_worker: Optional[MemoryWorker] = None
+_default_memory_worker_lock = threading.Lock()
+
+
+def default_memory_worker() -> MemoryWorker:
+    """Return the process-wide memory worker, creating it on first use."""
+    global _default_memory_worker
+    with _default_memory_worker_lock:
+        if _default_memory_worker is None:
+            _default_memory_worker = MemoryWorker()
+        return _default_memory_worker
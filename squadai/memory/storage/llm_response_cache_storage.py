@@ -0,0 +1,130 @@
+import sqlite3
+import time
+from typing import Optional
+
+from squadai.utilities import Printer
+from squadai.utilities.paths import db_storage_path
+
+
+class LLMResponseCacheSQLiteStorage:
+    """
+    SQLite storage class for cached LLM responses.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self.db_path = db_path or f"{db_storage_path()}/llm_response_cache.db"
+        self._printer: Printer = Printer()
+        self._initialize_db()
+
+    def _initialize_db(self):
+        """
+        Initializes the SQLite database and creates the llm_response_cache table
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_response_cache (
+                        key TEXT PRIMARY KEY,
+                        model TEXT,
+                        response TEXT,
+                        created_at REAL,
+                        accessed_at REAL
+                    )
+                """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS llm_response_cache_accessed_at ON llm_response_cache (accessed_at)"
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM RESPONSE CACHE ERROR: An error occurred during database initialization: {e}",
+                color="red",
+            )
+
+    def load(self, key: str, ttl: Optional[float] = None) -> Optional[str]:
+        """Return the cached response of a key, None when missing or older than ttl seconds."""
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT response, created_at FROM llm_response_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                if ttl is not None and now - row[1] > ttl:
+                    conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                    return None
+                conn.execute(
+                    "UPDATE llm_response_cache SET accessed_at = ? WHERE key = ?",
+                    (now, key),
+                )
+                return row[0]
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM RESPONSE CACHE ERROR: An error occurred while querying the cache: {e}",
+                color="red",
+            )
+            return None
+
+    def save(self, key: str, model: str, response: str) -> None:
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                INSERT OR REPLACE INTO llm_response_cache
+                (key, model, response, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                    (key, model, response, now, now),
+                )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM RESPONSE CACHE ERROR: An error occurred while saving to the cache: {e}",
+                color="red",
+            )
+
+    def evict(
+        self, max_entries: Optional[int] = None, ttl: Optional[float] = None
+    ) -> None:
+        """Delete the entries older than ttl seconds, then the least recently used ones over max_entries."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                if ttl is not None:
+                    conn.execute(
+                        "DELETE FROM llm_response_cache WHERE created_at < ?",
+                        (time.time() - ttl,),
+                    )
+                if max_entries is not None:
+                    conn.execute(
+                        """
+                    DELETE FROM llm_response_cache WHERE key IN (
+                        SELECT key FROM llm_response_cache
+                        ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                """,
+                        (max_entries,),
+                    )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM RESPONSE CACHE ERROR: An error occurred during eviction: {e}",
+                color="red",
+            )
+
+    def delete_all(self) -> None:
+        """
+        Deletes all rows from the llm_response_cache table.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM llm_response_cache")
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"ERROR: Failed to delete the LLM response cache: {e}",
+                color="red",
+            )
@@ -69,6 +69,36 @@ class LTMSQLiteStorage:
                 color="red",
             )
 
+    def save_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Saves several rows to the LTM table in one transaction.
+
+        Each row holds the arguments of `save`.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                INSERT INTO long_term_memories (task_description, metadata, datetime, score)
+                VALUES (?, ?, ?, ?)
+            """,
+                    [
+                        (
+                            row["task_description"],
+                            json.dumps(row["metadata"]),
+                            row["datetime"],
+                            row["score"],
+                        )
+                        for row in rows
+                    ],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"MEMORY ERROR: An error occurred while saving to LTM: {e}",
+                color="red",
+            )
+
     def load(
         self, task_description: str, latest_n: int
     ) -> Optional[List[Dict[str, Any]]]:
@@ -1,15 +1,11 @@
 import contextlib
+import functools
 import io
 import logging
 import os
 import shutil
 from typing import Any, Dict, List, Optional
 
-from embedchain import App
-from embedchain.llm.base import BaseLlm
-from embedchain.models.data_type import DataType
-from embedchain.vectordb.chroma import InvalidDimensionException
-
 from squadai.memory.storage.interface import Storage
 from squadai.utilities.paths import db_storage_path
 
@@ -29,8 +25,22 @@ def suppress_logging(
     logger.setLevel(original_level)
 
 
-class FakeLLM(BaseLlm):
-    pass
+@functools.lru_cache(maxsize=None)
+def _fake_llm_class() -> type:
+    """The LLM class given to embedchain, which only embeds. Built once, on first use."""
+    from embedchain.llm.base import BaseLlm
+
+    class FakeLLM(BaseLlm):
+        pass
+
+    return FakeLLM
+
+
+def __getattr__(name: str) -> Any:
+    # FakeLLM stays importable from this module without importing embedchain with it
+    if name == "FakeLLM":
+        return _fake_llm_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class RAGStorage(Storage):
@@ -73,9 +83,12 @@ class RAGStorage(Storage):
 
         if embedder_config:
             config["embedder"] = embedder_config
+        # embedchain and its vector store backends are only imported once memory is used
+        from embedchain import App
+
         self.type = type
         self.app = App.from_config(config=config)
-        self.app.llm = FakeLLM()
+        self.app.llm = _fake_llm_class()()
         if allow_reset:
             self.app.reset()
 
@@ -95,6 +108,8 @@ class RAGStorage(Storage):
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
     ) -> List[Any]:
+        from embedchain.vectordb.chroma import InvalidDimensionException
+
         with suppress_logging():
             try:
                 results = (
@@ -108,6 +123,8 @@ class RAGStorage(Storage):
         return [r for r in results if r["metadata"]["score"] >= score_threshold]
 
     def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> Any:
+        from embedchain.models.data_type import DataType
+
         self.app.add(text, data_type=DataType.TEXT, metadata=metadata)
 
     def reset(self) -> None:
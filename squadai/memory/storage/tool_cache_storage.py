@@ -0,0 +1,129 @@
+import sqlite3
+import time
+from typing import Optional, Tuple
+
+from squadai.utilities import Printer
+from squadai.utilities.paths import db_storage_path
+
+
+class ToolCacheSQLiteStorage:
+    """
+    SQLite storage class for cached tool results, shared by runs and processes.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self.db_path = db_path or f"{db_storage_path()}/tool_cache.db"
+        self._printer: Printer = Printer()
+        self._initialize_db()
+
+    def _initialize_db(self):
+        """
+        Initializes the SQLite database and creates the tool_cache table
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                # WAL lets processes read while another one writes
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tool_cache (
+                        key TEXT PRIMARY KEY,
+                        tool TEXT,
+                        output TEXT,
+                        created_at REAL,
+                        expires_at REAL,
+                        accessed_at REAL
+                    )
+                """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS tool_cache_accessed_at ON tool_cache (accessed_at)"
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred during database initialization: {e}",
+                color="red",
+            )
+
+    def load(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """Return the output and expiry time of a key, None when missing or expired."""
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT output, expires_at FROM tool_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[1] is not None and row[1] <= now:
+                    conn.execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+                    return None
+                conn.execute(
+                    "UPDATE tool_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                return row[0], row[1]
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred while querying the cache: {e}",
+                color="red",
+            )
+            return None
+
+    def save(
+        self, key: str, tool: str, output: str, expires_at: Optional[float]
+    ) -> None:
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                INSERT OR REPLACE INTO tool_cache
+                (key, tool, output, created_at, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                    (key, tool, output, now, expires_at, now),
+                )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred while saving to the cache: {e}",
+                color="red",
+            )
+
+    def evict(self, max_entries: Optional[int] = None) -> None:
+        """Delete the expired entries, then the least recently used ones over max_entries."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "DELETE FROM tool_cache WHERE expires_at <= ?", (time.time(),)
+                )
+                if max_entries is not None:
+                    conn.execute(
+                        """
+                    DELETE FROM tool_cache WHERE key IN (
+                        SELECT key FROM tool_cache
+                        ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                """,
+                        (max_entries,),
+                    )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred during eviction: {e}",
+                color="red",
+            )
+
+    def delete_all(self) -> None:
+        """
+        Deletes all rows from the tool_cache table.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM tool_cache")
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"ERROR: Failed to delete the tool cache: {e}",
+                color="red",
+            )
@@ -1,11 +1,12 @@
 import asyncio
 import copy
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field, model_validator
 
 from squadai.squad import Squad
 from squadai.squads.squad_output import SquadOutput
+from squadai.squads.squad_process_pool import SquadProcessPool
 from squadai.pipeline.pipeline_kickoff_result import PipelineKickoffResult
 from squadai.routers.router import Router
 from squadai.types.usage_metrics import UsageMetrics
@@ -103,13 +104,17 @@ class Pipeline(BaseModel):
         return values
 
     async def kickoff(
-        self, inputs: List[Dict[str, Any]]
+        self,
+        inputs: List[Dict[str, Any]],
+        process_pool: Optional[SquadProcessPool] = None,
     ) -> List[PipelineKickoffResult]:
         """
         Processes multiple runs in parallel, each going through all pipeline stages.
 
         Args:
             inputs (List[Dict[str, Any]]): List of inputs for each run.
+            process_pool (Optional[SquadProcessPool]): Pool whose factory builds this pipeline,
+                runs are spread over its worker processes instead of this process.
 
         Returns:
             List[PipelineKickoffResult]: List of results from each run.
@@ -117,8 +122,13 @@ class Pipeline(BaseModel):
         pipeline_results: List[PipelineKickoffResult] = []
 
         # Process all runs in parallel
+        process_single_kickoff = (
+            process_pool.akickoff_pipeline
+            if process_pool
+            else self.process_single_kickoff
+        )
         all_run_results = await asyncio.gather(
-            *(self.process_single_kickoff(input_data) for input_data in inputs)
+            *(process_single_kickoff(input_data) for input_data in inputs)
         )
 
         # Flatten the list of lists into a single list of results
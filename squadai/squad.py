@@ -1,10 +1,23 @@
 import asyncio
 import json
 import os
+import queue
+import threading
 import uuid
-from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from hashlib import md5
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from langchain_core.callbacks import BaseCallbackHandler
 from pydantic import (
@@ -21,8 +34,15 @@ from pydantic_core import PydanticCustomError
 
 from squadai.agent import Agent
 from squadai.agents.agent_builder.base_agent import BaseAgent
-from squadai.agents.cache import CacheHandler
+from squadai.agents.cache import CacheHandler, LLMResponseCache
+from squadai.squads.squad_batch_output import SquadBatchOutput, SquadBatchResult
 from squadai.squads.squad_output import SquadOutput
+from squadai.squads.squad_process_pool import SquadProcessPool
+from squadai.squads.squad_stream import (
+    SquadStreamEmitter,
+    SquadStreamEvent,
+    SquadStreamEventType,
+)
 from squadai.memory.entity.entity_memory import EntityMemory
 from squadai.memory.long_term.long_term_memory import LongTermMemory
 from squadai.memory.short_term.short_term_memory import ShortTermMemory
@@ -32,7 +52,7 @@ from squadai.tasks.conditional_task import ConditionalTask
 from squadai.tasks.task_output import TaskOutput
 from squadai.tools.agent_tools import AgentTools
 from squadai.types.usage_metrics import UsageMetrics
-from squadai.utilities import I18N, FileHandler, Logger, RPMController
+from squadai.utilities import FileHandler, Logger, RPMController
 from squadai.utilities.constants import (
     TRAINING_DATA_FILE,
 )
@@ -42,7 +62,9 @@ from squadai.utilities.formatter import (
     aggregate_raw_outputs_from_task_outputs,
     aggregate_raw_outputs_from_tasks,
 )
+from squadai.utilities.i18n import shared_i18n
 from squadai.utilities.planning_handler import SquadPlanner
+from squadai.utilities.task_executor import TaskExecutor
 from squadai.utilities.task_output_storage_handler import TaskOutputStorageHandler
 from squadai.utilities.training_handler import SquadTrainingHandler
 
@@ -63,16 +85,23 @@ class Squad(BaseModel):
         memory: Whether the squad should use memory to store memories of it's execution.
         manager_callbacks: The callback handlers to be executed by the manager agent when hierarchical process is used
         cache: Whether the squad should use a cache to store the results of the tools execution.
+        persistent_cache: Whether the tool results are also cached on disk, to be reused by later runs and other processes.
         function_calling_llm: The language model that will run the tool calling for all the agents.
         process: The process flow that the squad will follow (e.g., sequential, hierarchical).
         verbose: Indicates the verbosity level for logging during execution.
         config: Configuration settings for the squad.
         max_rpm: Maximum number of requests per minute for the squad execution to be respected.
+        max_tpm: Maximum number of LLM tokens per minute for the squad execution to be respected.
         prompt_file: Path to the prompt json file to be used for the squad.
         id: A unique identifier for the squad instance.
         task_callback: Callback to be executed after each task for every agents execution.
         step_callback: Callback to be executed after each step for every agents execution.
         planning: Plan the squad execution and add the plan to the squad.
+        parallel_tasks: Run tasks as a dependency graph built from their context instead of strictly in list order.
+        max_parallel_tasks: Maximum number of tasks running at the same time when parallel_tasks is enabled.
+        task_executor: Worker pool asynchronous tasks are submitted to, defaults to the process-wide one.
+        wait_for_memory: Whether kickoff waits for the long-term memories of its tasks to be saved.
+        llm_cache: Persistent LLM response cache used by the agents, True uses the process-wide one.
     """
 
     __hash__ = object.__hash__  # type: ignore
@@ -80,7 +109,7 @@ class Squad(BaseModel):
     _rpm_controller: RPMController = PrivateAttr()
     _logger: Logger = PrivateAttr()
     _file_handler: FileHandler = PrivateAttr()
-    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default=CacheHandler())
+    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default_factory=CacheHandler)
     _short_term_memory: Optional[InstanceOf[ShortTermMemory]] = PrivateAttr()
     _long_term_memory: Optional[InstanceOf[LongTermMemory]] = PrivateAttr()
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
@@ -93,6 +122,8 @@ class Squad(BaseModel):
     _task_output_handler: TaskOutputStorageHandler = PrivateAttr(
         default_factory=TaskOutputStorageHandler
     )
+    _stream_emitter: Optional[SquadStreamEmitter] = PrivateAttr(default=None)
+    _memory_jobs: List[Future] = PrivateAttr(default_factory=list)
 
     name: Optional[str] = Field(default=None)
     cache: bool = Field(default=True)
@@ -140,6 +171,10 @@ class Squad(BaseModel):
         default=None,
         description="Maximum number of requests per minute for the squad execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of LLM tokens per minute for the squad execution to be respected.",
+    )
     prompt_file: str = Field(
         default=None,
         description="Path to the prompt json file to be used for the squad.",
@@ -164,6 +199,30 @@ class Squad(BaseModel):
         default=[],
         description="List of execution logs for tasks",
     )
+    parallel_tasks: bool = Field(
+        default=False,
+        description="Run tasks as a dependency graph built from their context, executing every task whose dependencies are finished at the same time.",
+    )
+    max_parallel_tasks: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tasks running at the same time when parallel_tasks is enabled.",
+    )
+    task_executor: Optional[InstanceOf[TaskExecutor]] = Field(
+        default=None,
+        description="Worker pool asynchronous tasks are submitted to, defaults to the process-wide one.",
+    )
+    wait_for_memory: bool = Field(
+        default=False,
+        description="Wait at the end of kickoff until the long-term memories of its tasks are saved.",
+    )
+    llm_cache: Union[bool, InstanceOf[LLMResponseCache]] = Field(
+        default=False,
+        description="Answer identical agent prompts from a persistent LLM response cache, True uses the process-wide cache stored under db_storage_path().",
+    )
+    persistent_cache: Optional[bool] = Field(
+        default=None,
+        description="Also keep the tool results in SQLite under db_storage_path(), shared by runs and processes. Defaults to SQUADAI_TOOL_CACHE_PERSISTENT, ignored when cache is off.",
+    )
 
     @field_validator("id", mode="before")
     @classmethod
@@ -192,11 +251,13 @@ class Squad(BaseModel):
     @model_validator(mode="after")
     def set_private_attrs(self) -> "Squad":
         """Set private attributes."""
-        self._cache_handler = CacheHandler()
+        self._cache_handler = self._create_cache_handler()
         self._logger = Logger(verbose=self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+        self._rpm_controller = RPMController(
+            max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
+        )
         return self
 
     @model_validator(mode="after")
@@ -249,8 +310,8 @@ class Squad(BaseModel):
             for agent in self.agents:
                 if self.cache:
                     agent.set_cache_handler(self._cache_handler)
-                if self.max_rpm:
-                    agent.set_rpm_controller(self._rpm_controller)
+                # Shared even without limits, so 429s seen by one agent pause the others
+                agent.set_rpm_controller(self._rpm_controller)
         return self
 
     @model_validator(mode="after")
@@ -353,6 +414,13 @@ class Squad(BaseModel):
         ]
         return md5("|".join(source).encode(), usedforsecurity=False).hexdigest()
 
+    def _create_cache_handler(self) -> CacheHandler:
+        if not self.cache:
+            return CacheHandler(persistent=False)
+        if self.persistent_cache is None:
+            return CacheHandler()
+        return CacheHandler(persistent=self.persistent_cache)
+
     def _setup_from_config(self):
         assert self.config is not None, "Config should not be None."
 
@@ -378,7 +446,8 @@ class Squad(BaseModel):
         task_agent = next(
             agt for agt in self.agents if agt.role == task_config["agent"]
         )
-        del task_config["agent"]
+        # Keep the config intact so the squad can be rebuilt from it (copies, worker processes)
+        task_config = {k: v for k, v in task_config.items() if k != "agent"}
         return Task(**task_config, agent=task_agent)
 
     def _setup_for_training(self, filename: str) -> None:
@@ -420,6 +489,27 @@ class Squad(BaseModel):
         inputs: Optional[Dict[str, Any]] = None,
     ) -> SquadOutput:
         """Starts the squad to work on its assigned tasks."""
+        self._prepare_kickoff(inputs)
+
+        if self.planning:
+            self._handle_squad_planning()
+
+        if self.process == Process.sequential:
+            result = self._run_sequential_process()
+        elif self.process == Process.hierarchical:
+            result = self._run_hierarchical_process()
+        else:
+            raise NotImplementedError(
+                f"The process '{self.process}' is not implemented yet."
+            )
+
+        self._set_usage_metrics()
+        if self.wait_for_memory:
+            self.flush_memory()
+        return result
+
+    def _prepare_kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> None:
+        """Interpolates the inputs and sets up the agents for a new kickoff."""
         self._task_output_handler.reset()
         self._logging_color = "bold_purple"
 
@@ -428,7 +518,7 @@ class Squad(BaseModel):
             self._interpolate_inputs(inputs)
         self._set_tasks_callbacks()
 
-        i18n = I18N(prompt_file=self.prompt_file)
+        i18n = shared_i18n(self.prompt_file)
 
         for agent in self.agents:
             agent.i18n = i18n
@@ -446,30 +536,40 @@ class Squad(BaseModel):
 
             agent.create_agent_executor()
 
-        if self.planning:
-            self._handle_squad_planning()
+    def flush_memory(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the long-term memories queued by this squad's kickoffs to be saved.
 
-        metrics: List[UsageMetrics] = []
+        Args:
+            timeout: Maximum time to wait in seconds.
 
-        if self.process == Process.sequential:
-            result = self._run_sequential_process()
-        elif self.process == Process.hierarchical:
-            result = self._run_hierarchical_process()
-        else:
-            raise NotImplementedError(
-                f"The process '{self.process}' is not implemented yet."
-            )
+        Returns:
+            Whether every memory was saved before the timeout.
+        """
+        _, not_done = wait(list(self._memory_jobs), timeout=timeout)
+        return not not_done
 
-        metrics += [agent._token_process.get_summary() for agent in self.agents]
+    def _set_usage_metrics(self) -> None:
+        metrics: List[UsageMetrics] = [
+            agent._token_process.get_summary() for agent in self.agents
+        ]
 
         self.usage_metrics = UsageMetrics()
         for metric in metrics:
             self.usage_metrics.add_usage_metrics(metric)
 
-        return result
+    def kickoff_for_each(
+        self, inputs: List[Dict[str, Any]], processes: Optional[int] = None
+    ) -> List[SquadOutput]:
+        """Executes the Squad's workflow for each input in the list and aggregates results.
+
+        Args:
+            inputs: Inputs to kick off a squad copy with.
+            processes: Number of worker processes to spread the inputs over, runs in this process when unset.
+                Workers rebuild the squad from its `config`, use SquadProcessPool with a squad factory for squads built in code.
+        """
+        if processes:
+            return self._kickoff_for_each_in_processes(inputs, processes)
 
-    def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[SquadOutput]:
-        """Executes the Squad's workflow for each input in the list and aggregates results."""
         results: List[SquadOutput] = []
 
         # Initialize the parent squad's usage metrics
@@ -489,35 +589,256 @@ class Squad(BaseModel):
         self._task_output_handler.reset()
         return results
 
+    def _kickoff_for_each_in_processes(
+        self, inputs: List[Dict[str, Any]], processes: int
+    ) -> List[SquadOutput]:
+        if not self.config:
+            raise ValueError(
+                "kickoff_for_each with processes requires a squad created from 'config'. "
+                "Use SquadProcessPool with a squad factory for other squads."
+            )
+
+        with SquadProcessPool(self.config, max_processes=processes) as pool:
+            batch = pool.kickoff_batch(inputs)
+
+        batch.raise_for_failures()
+        self.usage_metrics = batch.token_usage
+        self._task_output_handler.reset()
+        return batch.outputs  # type: ignore # Failed inputs raised above, every output is set
+
+    def kickoff_stream(
+        self, inputs: Optional[Dict[str, Any]] = None
+    ) -> Iterator[SquadStreamEvent]:
+        """Kick off the squad and stream its progress as it happens.
+
+        The kickoff runs on a background thread while LLM tokens, agent actions,
+        tool observations, final answers and task outputs are yielded. The last
+        event holds the SquadOutput, errors of the kickoff are raised to the caller.
+
+        Stopping the iteration early (break or close()) stops the events, the
+        kickoff itself keeps running to its end on the background thread.
+
+        Args:
+            inputs: Inputs of the kickoff.
+
+        Returns:
+            Iterator of SquadStreamEvent.
+        """
+        events: "queue.Queue[Union[SquadStreamEvent, BaseException, None]]" = (
+            queue.Queue()
+        )
+
+        def run() -> None:
+            try:
+                output = self.kickoff(inputs=inputs)
+                events.put(
+                    SquadStreamEvent(
+                        type=SquadStreamEventType.squad_output,
+                        content=output.raw,
+                        output=output,
+                    )
+                )
+                events.put(None)
+            except BaseException as e:
+                events.put(e)
+            finally:
+                detach()
+
+        def detach() -> None:
+            if self._stream_emitter is emit:
+                self._stream_emitter = None
+
+        emit = events.put
+        self._stream_emitter = emit
+        threading.Thread(target=run, name="squad-stream", daemon=True).start()
+
+        try:
+            while (event := events.get()) is not None:
+                if isinstance(event, BaseException):
+                    raise event
+                yield event
+        finally:
+            # Nobody reads the queue anymore, drop the events of the remaining run
+            detach()
+
+    async def akickoff_stream(
+        self, inputs: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[SquadStreamEvent]:
+        """Asynchronously kick off the squad and stream its progress as it happens.
+
+        Same events as `kickoff_stream`, the kickoff runs as a task of the running
+        event loop.
+
+        Args:
+            inputs: Inputs of the kickoff.
+
+        Returns:
+            Async iterator of SquadStreamEvent.
+        """
+        loop = asyncio.get_running_loop()
+        events: "asyncio.Queue[SquadStreamEvent]" = asyncio.Queue()
+
+        # Events are also emitted from worker threads (tools, sync agents)
+        def emit(event: SquadStreamEvent) -> None:
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        self._stream_emitter = emit
+        kickoff = asyncio.create_task(self.kickoff_async(inputs=inputs))
+        try:
+            while not kickoff.done() or not events.empty():
+                next_event = asyncio.ensure_future(events.get())
+                await asyncio.wait(
+                    {next_event, kickoff}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_event.done():
+                    yield next_event.result()
+                else:
+                    next_event.cancel()
+
+            output = kickoff.result()
+            yield SquadStreamEvent(
+                type=SquadStreamEventType.squad_output,
+                content=output.raw,
+                output=output,
+            )
+        finally:
+            # A later stream of the squad may have attached its own emitter since
+            if self._stream_emitter is emit:
+                self._stream_emitter = None
+            if not kickoff.done():
+                kickoff.cancel()
+
     async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = {}) -> SquadOutput:
-        """Asynchronous kickoff method to start the squad execution."""
-        return await asyncio.to_thread(self.kickoff, inputs)
+        """Asynchronous kickoff method to start the squad execution.
 
-    async def kickoff_for_each_async(self, inputs: List[Dict]) -> List[SquadOutput]:
-        squad_copies = [self.copy() for _ in inputs]
+        Agents await the LLM and their tools on the running event loop instead of
+        holding a thread each, so many kickoffs can share one loop.
+        """
+        self._prepare_kickoff(inputs)
 
-        async def run_squad(squad, input_data):
-            return await squad.kickoff_async(inputs=input_data)
+        if self.planning:
+            await asyncio.to_thread(self._handle_squad_planning)
 
-        tasks = [
-            asyncio.create_task(run_squad(squad_copies[i], inputs[i]))
-            for i in range(len(inputs))
-        ]
-        tasks = [
-            asyncio.create_task(run_squad(squad_copies[i], inputs[i]))
-            for i in range(len(inputs))
-        ]
+        if self.process == Process.sequential:
+            result = await self._arun_sequential_process()
+        elif self.process == Process.hierarchical:
+            result = await self._arun_hierarchical_process()
+        else:
+            raise NotImplementedError(
+                f"The process '{self.process}' is not implemented yet."
+            )
 
-        results = await asyncio.gather(*tasks)
+        self._set_usage_metrics()
+        if self.wait_for_memory:
+            await asyncio.to_thread(self.flush_memory)
+        return result
+
+    async def kickoff_for_each_async(
+        self, inputs: List[Dict], max_concurrency: Optional[int] = None
+    ) -> List[SquadOutput]:
+        """Asynchronously executes the Squad's workflow for each input, at most max_concurrency at a time."""
+        batch = await self.kickoff_batch_async(inputs, max_concurrency=max_concurrency)
+        batch.raise_for_failures()
+        return batch.outputs  # type: ignore # Failed inputs raised above, every output is set
+
+    def kickoff_batch(
+        self, inputs: List[Dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> SquadBatchOutput:
+        """Executes the Squad's workflow for each input on parallel copies of the squad.
+
+        Args:
+            inputs: Inputs to kick off a squad copy with.
+            max_concurrency: Maximum number of copies running at the same time, defaults to the thread pool default.
+
+        Returns:
+            SquadBatchOutput: Result of each input in input order, failed inputs hold their error instead of aborting the batch.
+        """
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="squad-batch"
+        ) as executor:
+            results = list(
+                executor.map(self._kickoff_batch_item, range(len(inputs)), inputs)
+            )
+        return self._finish_batch(results)
+
+    async def kickoff_batch_async(
+        self, inputs: List[Dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> SquadBatchOutput:
+        """Asynchronously executes the Squad's workflow for each input on copies of the squad.
+
+        Args:
+            inputs: Inputs to kick off a squad copy with.
+            max_concurrency: Maximum number of copies running at the same time, unbounded by default.
+
+        Returns:
+            SquadBatchOutput: Result of each input in input order, failed inputs hold their error instead of aborting the batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run_squad(index: int, input_data: Dict[str, Any]) -> SquadBatchResult:
+            if semaphore is None:
+                return await self._akickoff_batch_item(index, input_data)
+            async with semaphore:
+                return await self._akickoff_batch_item(index, input_data)
+
+        results = await asyncio.gather(
+            *(run_squad(index, input_data) for index, input_data in enumerate(inputs))
+        )
+        return self._finish_batch(list(results))
+
+    def _kickoff_batch_item(
+        self, index: int, input_data: Dict[str, Any]
+    ) -> SquadBatchResult:
+        squad: Optional[Squad] = None
+        try:
+            squad = self.copy()
+            output = squad.kickoff(inputs=input_data)
+        except Exception as e:
+            if squad is None:
+                # The copy failed, nothing ran and no tokens were spent
+                return SquadBatchResult(index=index, inputs=input_data or {}, error=e)
+            return squad._batch_result(index, input_data, error=e)
+        return squad._batch_result(index, input_data, output=output)
+
+    async def _akickoff_batch_item(
+        self, index: int, input_data: Dict[str, Any]
+    ) -> SquadBatchResult:
+        squad: Optional[Squad] = None
+        try:
+            squad = self.copy()
+            output = await squad.kickoff_async(inputs=input_data)
+        except Exception as e:
+            if squad is None:
+                # The copy failed, nothing ran and no tokens were spent
+                return SquadBatchResult(index=index, inputs=input_data or {}, error=e)
+            return squad._batch_result(index, input_data, error=e)
+        return squad._batch_result(index, input_data, output=output)
+
+    def _batch_result(
+        self,
+        index: int,
+        input_data: Dict[str, Any],
+        output: Optional[SquadOutput] = None,
+        error: Optional[Exception] = None,
+    ) -> SquadBatchResult:
+        # A failed kickoff never sets usage_metrics, but its agents still spent tokens
+        token_usage = self.usage_metrics if output else self.calculate_usage_metrics()
+        return SquadBatchResult(
+            index=index,
+            inputs=input_data or {},
+            output=output,
+            error=error,
+            token_usage=token_usage or UsageMetrics(),
+        )
 
+    def _finish_batch(self, results: List[SquadBatchResult]) -> SquadBatchOutput:
         total_usage_metrics = UsageMetrics()
-        for squad in squad_copies:
-            if squad.usage_metrics:
-                total_usage_metrics.add_usage_metrics(squad.usage_metrics)
+        for result in results:
+            total_usage_metrics.add_usage_metrics(result.token_usage)
 
         self.usage_metrics = total_usage_metrics
         self._task_output_handler.reset()
-        return results
+        return SquadBatchOutput(results=results, token_usage=total_usage_metrics)
 
     def _handle_squad_planning(self):
         """Handles the Squad planning."""
@@ -560,6 +881,8 @@ class Squad(BaseModel):
 
     def _run_sequential_process(self) -> SquadOutput:
         """Executes tasks sequentially and returns the final output."""
+        if self.parallel_tasks:
+            return self._execute_task_graph(self.tasks)
         return self._execute_tasks(self.tasks)
 
     def _run_hierarchical_process(self) -> SquadOutput:
@@ -567,8 +890,19 @@ class Squad(BaseModel):
         self._create_manager_agent()
         return self._execute_tasks(self.tasks)
 
+    async def _arun_sequential_process(self) -> SquadOutput:
+        """Executes tasks sequentially on the running event loop."""
+        if self.parallel_tasks:
+            return await self._aexecute_task_graph(self.tasks)
+        return await self._aexecute_tasks(self.tasks)
+
+    async def _arun_hierarchical_process(self) -> SquadOutput:
+        """Creates the manager agent and executes the tasks on the running event loop."""
+        self._create_manager_agent()
+        return await self._aexecute_tasks(self.tasks)
+
     def _create_manager_agent(self):
-        i18n = I18N(prompt_file=self.prompt_file)
+        i18n = shared_i18n(self.prompt_file)
         if self.manager_agent is not None:
             self.manager_agent.allow_delegation = True
             manager = self.manager_agent
@@ -640,6 +974,7 @@ class Squad(BaseModel):
                     agent=agent_to_use,
                     context=context,
                     tools=agent_to_use.tools,
+                    executor=self.task_executor,
                 )
                 futures.append((task, future, task_index))
             else:
@@ -662,6 +997,303 @@ class Squad(BaseModel):
 
         return self._create_squad_output(task_outputs)
 
+    async def _aexecute_tasks(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> SquadOutput:
+        """Executes tasks on the running event loop and returns the final output.
+
+        Mirrors `_execute_tasks`, asynchronous tasks are scheduled as asyncio
+        tasks instead of being submitted to the task executor.
+
+        Args:
+            tasks (List[Task]): List of tasks to execute
+            start_index (Optional[int]): Index of the first task to execute, earlier tasks reuse their output.
+            was_replayed (bool): Whether the execution is a replay.
+
+        Returns:
+            SquadOutput: Final output of the squad
+        """
+        task_outputs: List[TaskOutput] = []
+        pending: List[Tuple[Task, asyncio.Task[TaskOutput], int]] = []
+        last_sync_output: Optional[TaskOutput] = None
+
+        for task_index, task in enumerate(tasks):
+            if start_index is not None and task_index < start_index:
+                if task.output:
+                    if task.async_execution:
+                        task_outputs.append(task.output)
+                    else:
+                        task_outputs = [task.output]
+                        last_sync_output = task.output
+                continue
+
+            agent_to_use = self._get_agent_to_use(task)
+            if agent_to_use is None:
+                raise ValueError(
+                    f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                )
+
+            self._prepare_agent_tools(task)
+            self._log_task_start(task, agent_to_use.role)
+
+            if isinstance(task, ConditionalTask):
+                if pending:
+                    task_outputs = await self._aprocess_async_tasks(
+                        pending, was_replayed
+                    )
+                    pending.clear()
+                skipped_task_output = self._handle_conditional_task(
+                    task, task_outputs, [], task_index, was_replayed
+                )
+                if skipped_task_output:
+                    continue
+
+            if task.async_execution:
+                context = self._get_context(
+                    task, [last_sync_output] if last_sync_output else []
+                )
+                pending.append(
+                    (
+                        task,
+                        asyncio.create_task(
+                            task.aexecute(
+                                agent=agent_to_use,
+                                context=context,
+                                tools=agent_to_use.tools,
+                            )
+                        ),
+                        task_index,
+                    )
+                )
+            else:
+                if pending:
+                    task_outputs = await self._aprocess_async_tasks(
+                        pending, was_replayed
+                    )
+                    pending.clear()
+
+                context = self._get_context(task, task_outputs)
+                task_output = await task.aexecute(
+                    agent=agent_to_use,
+                    context=context,
+                    tools=agent_to_use.tools,
+                )
+                task_outputs = [task_output]
+                self._process_task_result(task, task_output)
+                self._store_execution_log(task, task_output, task_index, was_replayed)
+
+        if pending:
+            task_outputs = await self._aprocess_async_tasks(pending, was_replayed)
+
+        return self._create_squad_output(task_outputs)
+
+    def _build_task_dependencies(self, tasks: List[Task]) -> List[Set[int]]:
+        """Builds the dependency graph of the tasks from their context.
+
+        Tasks with an explicit context depend on the context tasks that are part
+        of the squad. Tasks without one depend on what they would receive in the
+        sequential process: the last synchronous task before them and, for a
+        synchronous task, the asynchronous tasks started since then. Conditional
+        tasks always depend on the task right before them.
+
+        Args:
+            tasks (List[Task]): List of tasks to build the graph for.
+
+        Returns:
+            List[Set[int]]: Indices each task depends on, by task index.
+        """
+        task_indices = {id(task): i for i, task in enumerate(tasks)}
+        dependencies: List[Set[int]] = []
+        last_sync_index: Optional[int] = None
+        pending_async: List[int] = []
+
+        for task_index, task in enumerate(tasks):
+            if task.context is not None:
+                task_dependencies = {
+                    task_indices[id(context_task)]
+                    for context_task in task.context
+                    if id(context_task) in task_indices
+                }
+            else:
+                task_dependencies = (
+                    {last_sync_index} if last_sync_index is not None else set()
+                )
+                if not task.async_execution:
+                    task_dependencies.update(pending_async)
+
+            if isinstance(task, ConditionalTask) and task_index > 0:
+                task_dependencies.add(task_index - 1)
+
+            dependencies.append(task_dependencies)
+
+            if task.async_execution:
+                pending_async.append(task_index)
+            else:
+                last_sync_index = task_index
+                pending_async = []
+
+        return dependencies
+
+    def _execute_task_graph(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> SquadOutput:
+        """Executes tasks as a dependency graph and returns the final output.
+
+        Every task whose dependencies are finished is started right away, up to
+        `max_parallel_tasks` at a time. Tasks sharing an agent never run at the
+        same time, since the agent executor holds the state of the running task.
+
+        Args:
+            tasks (List[Task]): List of tasks to execute
+            start_index (Optional[int]): Index of the first task to execute, earlier tasks reuse their output.
+            was_replayed (bool): Whether the execution is a replay.
+
+        Returns:
+            SquadOutput: Final output of the squad
+        """
+        graph = _TaskGraphRun(tasks, self._build_task_dependencies(tasks), start_index)
+        running: Dict[Future[TaskOutput], int] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_parallel_tasks or max(len(tasks), 1),
+            thread_name_prefix="squad-task",
+        ) as executor:
+            while graph.pending or running:
+                for task_index, agent_to_use, context in self._start_ready_graph_tasks(
+                    graph, was_replayed
+                ):
+                    future = executor.submit(
+                        tasks[task_index].execute_sync,
+                        agent=agent_to_use,
+                        context=context,
+                        tools=agent_to_use.tools,
+                    )
+                    running[future] = task_index
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_index = running.pop(future)
+                    self._complete_graph_task(
+                        graph, task_index, future.result(), was_replayed
+                    )
+
+        return self._create_squad_output(graph.final_outputs())
+
+    async def _aexecute_task_graph(
+        self,
+        tasks: List[Task],
+        start_index: Optional[int] = 0,
+        was_replayed: bool = False,
+    ) -> SquadOutput:
+        """Executes tasks as a dependency graph on the running event loop."""
+        graph = _TaskGraphRun(tasks, self._build_task_dependencies(tasks), start_index)
+        running: Dict[asyncio.Task[TaskOutput], int] = {}
+        limit = self.max_parallel_tasks or max(len(tasks), 1)
+
+        while graph.pending or running:
+            for task_index, agent_to_use, context in self._start_ready_graph_tasks(
+                graph, was_replayed, limit - len(running)
+            ):
+                running[
+                    asyncio.create_task(
+                        tasks[task_index].aexecute(
+                            agent=agent_to_use,
+                            context=context,
+                            tools=agent_to_use.tools,
+                        )
+                    )
+                ] = task_index
+
+            if not running:
+                continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                task_index = running.pop(finished)
+                self._complete_graph_task(
+                    graph, task_index, finished.result(), was_replayed
+                )
+
+        return self._create_squad_output(graph.final_outputs())
+
+    def _start_ready_graph_tasks(
+        self,
+        graph: "_TaskGraphRun",
+        was_replayed: bool,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[int, BaseAgent, str]]:
+        """Picks the tasks of the graph that can start now.
+
+        Conditional tasks whose condition is not met are skipped right away.
+
+        Returns:
+            List[Tuple[int, BaseAgent, str]]: Index, agent and context of each task to start.
+        """
+        ready: List[Tuple[int, BaseAgent, str]] = []
+        for task_index in list(graph.pending):
+            if limit is not None and len(ready) >= limit:
+                break
+
+            task = graph.tasks[task_index]
+            if not graph.dependencies[task_index].issubset(graph.completed):
+                continue
+
+            agent_to_use = self._get_agent_to_use(task)
+            if agent_to_use is None:
+                raise ValueError(
+                    f"No agent available for task: {task.description}. Ensure that either the task has an assigned agent or a manager agent is provided."
+                )
+            if id(agent_to_use) in graph.busy_agents.values():
+                continue
+
+            graph.pending.remove(task_index)
+            self._prepare_agent_tools(task)
+            self._log_task_start(task, agent_to_use.role)
+
+            if isinstance(task, ConditionalTask) and task_index > 0:
+                previous_output = graph.completed[task_index - 1]
+                if not task.should_execute(previous_output):
+                    self._logger.log(
+                        "debug",
+                        f"Skipping conditional task: {task.description}",
+                        color="yellow",
+                    )
+                    graph.completed[task_index] = task.get_skipped_task_output()
+                    graph.skipped.add(task_index)
+                    if not was_replayed:
+                        self._store_execution_log(
+                            task, graph.completed[task_index], task_index
+                        )
+                    continue
+
+            graph.busy_agents[task_index] = id(agent_to_use)
+            context = self._get_context(task, graph.visible_outputs(task_index))
+            ready.append((task_index, agent_to_use, context))
+        return ready
+
+    def _complete_graph_task(
+        self,
+        graph: "_TaskGraphRun",
+        task_index: int,
+        task_output: TaskOutput,
+        was_replayed: bool,
+    ) -> None:
+        graph.busy_agents.pop(task_index, None)
+        graph.completed[task_index] = task_output
+        self._process_task_result(graph.tasks[task_index], task_output)
+        self._store_execution_log(
+            graph.tasks[task_index], task_output, task_index, was_replayed
+        )
+
     def _handle_conditional_task(
         self,
         task: ConditionalTask,
@@ -757,6 +1389,16 @@ class Squad(BaseModel):
         self._logger.log("debug", f"== [{role}] Task output: {output}\n\n")
         if self.output_log_file:
             self._file_handler.log(agent=role, task=output, status="completed")
+        if self._stream_emitter:
+            self._stream_emitter(
+                SquadStreamEvent(
+                    type=SquadStreamEventType.task_output,
+                    content=output.raw,
+                    agent=role,
+                    task=task.description,
+                    output=output,
+                )
+            )
 
     def _create_squad_output(self, task_outputs: List[TaskOutput]) -> SquadOutput:
         if len(task_outputs) != 1:
@@ -791,6 +1433,21 @@ class Squad(BaseModel):
             )
         return task_outputs
 
+    async def _aprocess_async_tasks(
+        self,
+        pending: List[Tuple[Task, "asyncio.Task[TaskOutput]", int]],
+        was_replayed: bool = False,
+    ) -> List[TaskOutput]:
+        task_outputs: List[TaskOutput] = []
+        for pending_task, running_task, task_index in pending:
+            task_output = await running_task
+            task_outputs.append(task_output)
+            self._process_task_result(pending_task, task_output)
+            self._store_execution_log(
+                pending_task, task_output, task_index, was_replayed
+            )
+        return task_outputs
+
     def _find_task_index(
         self, task_id: str, stored_outputs: List[Any]
     ) -> Optional[int]:
@@ -841,36 +1498,49 @@ class Squad(BaseModel):
             self.tasks[i].output = task_output
 
         self._logging_color = "bold_blue"
+        if self.parallel_tasks and self.process == Process.sequential:
+            return self._execute_task_graph(self.tasks, start_index, True)
         result = self._execute_tasks(self.tasks, start_index, True)
         return result
 
     def copy(self):
-        """Create a deep copy of the Squad."""
-
-        exclude = {
-            "id",
-            "_rpm_controller",
-            "_logger",
-            "_execution_span",
-            "_file_handler",
-            "_cache_handler",
-            "_short_term_memory",
-            "_long_term_memory",
-            "_entity_memory",
-            "agents",
-            "tasks",
-        }
+        """Create a copy of the Squad for a new run.
 
+        Agents and tasks are copied structurally instead of being validated again,
+        and the expensive squad resources (memory stack, task output storage,
+        logger) are shared with the original. Only the state a run mutates is
+        recreated: outputs, counters, token usage, the rpm controller and the
+        tool cache.
+        """
         cloned_agents = [agent.copy() for agent in self.agents]
-        cloned_tasks = [task.copy(cloned_agents) for task in self.tasks]
-
-        copied_data = self.model_dump(exclude=exclude)
-        copied_data = {k: v for k, v in copied_data.items() if v is not None}
-
-        copied_data.pop("agents", None)
-        copied_data.pop("tasks", None)
-
-        copied_squad = Squad(**copied_data, agents=cloned_agents, tasks=cloned_tasks)
+        task_mapping: Dict[UUID4, Task] = {}
+        cloned_tasks = [task.copy(cloned_agents, task_mapping) for task in self.tasks]
+        cloned_manager_agent = self.manager_agent.copy() if self.manager_agent else None
+
+        copied_squad = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agents": cloned_agents,
+                "tasks": cloned_tasks,
+                "manager_agent": cloned_manager_agent,
+                "usage_metrics": None,
+                "execution_logs": [],
+            }
+        )
+        copied_squad._rpm_controller = RPMController(
+            max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
+        )
+        copied_squad._cache_handler = self._create_cache_handler()
+        # Validators do not run on model_copy, hand the copied agents the
+        # squad-wide cache and rate limiter the way check_config does
+        for agent in [*cloned_agents, *filter(None, [cloned_manager_agent])]:
+            if self.cache:
+                agent.set_cache_handler(copied_squad._cache_handler)
+            agent.set_rpm_controller(copied_squad._rpm_controller)
+        copied_squad._inputs = None
+        copied_squad._stream_emitter = None
+        copied_squad._memory_jobs = []
+        copied_squad._logging_color = "bold_purple"
 
         return copied_squad
 
@@ -894,7 +1564,7 @@ class Squad(BaseModel):
             agent.interpolate_inputs(inputs)
 
     def _finish_execution(self, final_string_output: str) -> None:
-        if self.max_rpm:
+        if self.max_rpm or self.max_tpm:
             self._rpm_controller.stop_rpm_counter()
 
     def calculate_usage_metrics(self) -> UsageMetrics:
@@ -941,3 +1611,51 @@ class Squad(BaseModel):
 
     def __repr__(self):
         return f"Squad(id={self.id}, process={self.process}, number_of_agents={len(self.agents)}, number_of_tasks={len(self.tasks)})"
+
+
+class _TaskGraphRun:
+    """Execution state of a squad running its tasks as a dependency graph."""
+
+    def __init__(
+        self,
+        tasks: List[Task],
+        dependencies: List[Set[int]],
+        start_index: Optional[int] = 0,
+    ) -> None:
+        self.tasks = tasks
+        self.dependencies = dependencies
+        self.completed: Dict[int, TaskOutput] = {}
+        self.skipped: Set[int] = set()
+        self.busy_agents: Dict[int, int] = {}
+
+        for task_index, task in enumerate(tasks):
+            if start_index is not None and task_index < start_index and task.output:
+                self.completed[task_index] = task.output
+
+        self.pending = [i for i in range(len(tasks)) if i not in self.completed]
+
+    def visible_outputs(self, task_index: int) -> List[TaskOutput]:
+        """Outputs of the task dependencies, looking through skipped tasks."""
+        outputs: List[TaskOutput] = []
+        for dependency in sorted(self.dependencies[task_index]):
+            if dependency in self.skipped:
+                outputs.extend(self.visible_outputs(dependency))
+            else:
+                outputs.append(self.completed[dependency])
+        return outputs
+
+    def final_outputs(self) -> List[TaskOutput]:
+        """Output of the last task, or what it saw when it was skipped.
+
+        A skipped last task with no output to look through falls back to the
+        last completed task in task order.
+        """
+        final_index = len(self.tasks) - 1
+        if final_index not in self.skipped:
+            return [self.completed[final_index]]
+        visible = self.visible_outputs(final_index)
+        if visible:
+            return visible[-1:]
+        if not self.completed:
+            raise ValueError("Every task of the squad was skipped, there is no output to return.")
+        return [self.completed[max(self.completed)]]
@@ -1,44 +1,111 @@
-from .tools import (
-    BrowserbaseLoadTool,
-    CodeDocsSearchTool,
-    CodeInterpreterTool,
-    ComposioTool,
-    CSVSearchTool,
-    DallETool,
-    DirectoryReadTool,
-    DirectorySearchTool,
-    DOCXSearchTool,
-    EXASearchTool,
-    FileReadTool,
-    FileWriterTool,
-    FirecrawlCrawlWebsiteTool,
-    FirecrawlScrapeWebsiteTool,
-    FirecrawlSearchTool,
-    GithubSearchTool,
-    JSONSearchTool,
-    LlamaIndexTool,
-    MDXSearchTool,
-    MultiOnTool,
-    NL2SQLTool,
-    PDFSearchTool,
-    PGSearchTool,
-    RagTool,
-    ScrapeElementFromWebsiteTool,
-    ScrapeWebsiteTool,
-    ScrapflyScrapeWebsiteTool,
-    SeleniumScrapingTool,
-    SerperDevTool,
-    SerplyJobSearchTool,
-    SerplyNewsSearchTool,
-    SerplyScholarSearchTool,
-    SerplyWebpageToMarkdownTool,
-    SerplyWebSearchTool,
-    TXTSearchTool,
-    VisionTool,
-    WebsiteSearchTool,
-    XMLSearchTool,
-    YoutubeChannelSearchTool,
-    YoutubeVideoSearchTool,
-    MySQLSearchTool
-)
-from .tools.base_tool import BaseTool, Tool, tool
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .tools import (
+        BrowserbaseLoadTool,
+        CodeDocsSearchTool,
+        CodeInterpreterTool,
+        ComposioTool,
+        CSVSearchTool,
+        DallETool,
+        DirectoryReadTool,
+        DirectorySearchTool,
+        DOCXSearchTool,
+        EXASearchTool,
+        FileReadTool,
+        FileWriterTool,
+        FirecrawlCrawlWebsiteTool,
+        FirecrawlScrapeWebsiteTool,
+        FirecrawlSearchTool,
+        GithubSearchTool,
+        JSONSearchTool,
+        LlamaIndexTool,
+        MDXSearchTool,
+        MultiOnTool,
+        NL2SQLTool,
+        PDFSearchTool,
+        PGSearchTool,
+        RagTool,
+        ScrapeElementFromWebsiteTool,
+        ScrapeWebsiteTool,
+        ScrapflyScrapeWebsiteTool,
+        SeleniumScrapingTool,
+        SerperDevTool,
+        SerplyJobSearchTool,
+        SerplyNewsSearchTool,
+        SerplyScholarSearchTool,
+        SerplyWebpageToMarkdownTool,
+        SerplyWebSearchTool,
+        TXTSearchTool,
+        VisionTool,
+        WebsiteSearchTool,
+        XMLSearchTool,
+        YoutubeChannelSearchTool,
+        YoutubeVideoSearchTool,
+        MySQLSearchTool,
+    )
+    from .tools.base_tool import BaseTool, Tool, tool
+
+# Tools are imported on first access (PEP 562), see squadai_tools.tools.
+_LAZY_IMPORTS = {
+    "BrowserbaseLoadTool": ".tools",
+    "CodeDocsSearchTool": ".tools",
+    "CodeInterpreterTool": ".tools",
+    "ComposioTool": ".tools",
+    "CSVSearchTool": ".tools",
+    "DallETool": ".tools",
+    "DirectoryReadTool": ".tools",
+    "DirectorySearchTool": ".tools",
+    "DOCXSearchTool": ".tools",
+    "EXASearchTool": ".tools",
+    "FileReadTool": ".tools",
+    "FileWriterTool": ".tools",
+    "FirecrawlCrawlWebsiteTool": ".tools",
+    "FirecrawlScrapeWebsiteTool": ".tools",
+    "FirecrawlSearchTool": ".tools",
+    "GithubSearchTool": ".tools",
+    "JSONSearchTool": ".tools",
+    "LlamaIndexTool": ".tools",
+    "MDXSearchTool": ".tools",
+    "MultiOnTool": ".tools",
+    "NL2SQLTool": ".tools",
+    "PDFSearchTool": ".tools",
+    "PGSearchTool": ".tools",
+    "RagTool": ".tools",
+    "ScrapeElementFromWebsiteTool": ".tools",
+    "ScrapeWebsiteTool": ".tools",
+    "ScrapflyScrapeWebsiteTool": ".tools",
+    "SeleniumScrapingTool": ".tools",
+    "SerperDevTool": ".tools",
+    "SerplyJobSearchTool": ".tools",
+    "SerplyNewsSearchTool": ".tools",
+    "SerplyScholarSearchTool": ".tools",
+    "SerplyWebpageToMarkdownTool": ".tools",
+    "SerplyWebSearchTool": ".tools",
+    "TXTSearchTool": ".tools",
+    "VisionTool": ".tools",
+    "WebsiteSearchTool": ".tools",
+    "XMLSearchTool": ".tools",
+    "YoutubeChannelSearchTool": ".tools",
+    "YoutubeVideoSearchTool": ".tools",
+    "MySQLSearchTool": ".tools",
+    "BaseTool": ".tools.base_tool",
+    "Tool": ".tools.base_tool",
+    "tool": ".tools.base_tool",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
+
+__all__ = list(_LAZY_IMPORTS)
@@ -1,52 +1,122 @@
-from .browserbase_load_tool.browserbase_load_tool import BrowserbaseLoadTool
-from .code_docs_search_tool.code_docs_search_tool import CodeDocsSearchTool
-from .code_interpreter_tool.code_interpreter_tool import CodeInterpreterTool
-from .composio_tool.composio_tool import ComposioTool
-from .csv_search_tool.csv_search_tool import CSVSearchTool
-from .dalle_tool.dalle_tool import DallETool
-from .directory_read_tool.directory_read_tool import DirectoryReadTool
-from .directory_search_tool.directory_search_tool import DirectorySearchTool
-from .docx_search_tool.docx_search_tool import DOCXSearchTool
-from .exa_tools.exa_search_tool import EXASearchTool
-from .file_read_tool.file_read_tool import FileReadTool
-from .file_writer_tool.file_writer_tool import FileWriterTool
-from .firecrawl_crawl_website_tool.firecrawl_crawl_website_tool import (
-    FirecrawlCrawlWebsiteTool
-)
-from .firecrawl_scrape_website_tool.firecrawl_scrape_website_tool import (
-    FirecrawlScrapeWebsiteTool
-)
-from .firecrawl_search_tool.firecrawl_search_tool import FirecrawlSearchTool
-from .github_search_tool.github_search_tool import GithubSearchTool
-from .json_search_tool.json_search_tool import JSONSearchTool
-from .llamaindex_tool.llamaindex_tool import LlamaIndexTool
-from .mdx_seach_tool.mdx_search_tool import MDXSearchTool
-from .multion_tool.multion_tool import MultiOnTool
-from .nl2sql.nl2sql_tool import NL2SQLTool
-from .pdf_search_tool.pdf_search_tool import PDFSearchTool
-from .pg_seach_tool.pg_search_tool import PGSearchTool
-from .rag.rag_tool import RagTool
-from .scrape_element_from_website.scrape_element_from_website import (
-    ScrapeElementFromWebsiteTool
-)
-from .scrape_website_tool.scrape_website_tool import ScrapeWebsiteTool
-from .scrapfly_scrape_website_tool.scrapfly_scrape_website_tool import (
-    ScrapflyScrapeWebsiteTool
-)
-from .selenium_scraping_tool.selenium_scraping_tool import SeleniumScrapingTool
-from .serper_dev_tool.serper_dev_tool import SerperDevTool
-from .serply_api_tool.serply_job_search_tool import SerplyJobSearchTool
-from .serply_api_tool.serply_news_search_tool import SerplyNewsSearchTool
-from .serply_api_tool.serply_scholar_search_tool import SerplyScholarSearchTool
-from .serply_api_tool.serply_web_search_tool import SerplyWebSearchTool
-from .serply_api_tool.serply_webpage_to_markdown_tool import SerplyWebpageToMarkdownTool
-from .spider_tool.spider_tool import SpiderTool
-from .txt_search_tool.txt_search_tool import TXTSearchTool
-from .vision_tool.vision_tool import VisionTool
-from .website_search.website_search_tool import WebsiteSearchTool
-from .xml_search_tool.xml_search_tool import XMLSearchTool
-from .youtube_channel_search_tool.youtube_channel_search_tool import (
-    YoutubeChannelSearchTool
-)
-from .youtube_video_search_tool.youtube_video_search_tool import YoutubeVideoSearchTool
-from .mysql_search_tool.mysql_search_tool import MySQLSearchTool
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .browserbase_load_tool.browserbase_load_tool import BrowserbaseLoadTool
+    from .code_docs_search_tool.code_docs_search_tool import CodeDocsSearchTool
+    from .code_interpreter_tool.code_interpreter_tool import CodeInterpreterTool
+    from .composio_tool.composio_tool import ComposioTool
+    from .csv_search_tool.csv_search_tool import CSVSearchTool
+    from .dalle_tool.dalle_tool import DallETool
+    from .directory_read_tool.directory_read_tool import DirectoryReadTool
+    from .directory_search_tool.directory_search_tool import DirectorySearchTool
+    from .docx_search_tool.docx_search_tool import DOCXSearchTool
+    from .exa_tools.exa_search_tool import EXASearchTool
+    from .file_read_tool.file_read_tool import FileReadTool
+    from .file_writer_tool.file_writer_tool import FileWriterTool
+    from .firecrawl_crawl_website_tool.firecrawl_crawl_website_tool import (
+        FirecrawlCrawlWebsiteTool,
+    )
+    from .firecrawl_scrape_website_tool.firecrawl_scrape_website_tool import (
+        FirecrawlScrapeWebsiteTool,
+    )
+    from .firecrawl_search_tool.firecrawl_search_tool import FirecrawlSearchTool
+    from .github_search_tool.github_search_tool import GithubSearchTool
+    from .json_search_tool.json_search_tool import JSONSearchTool
+    from .llamaindex_tool.llamaindex_tool import LlamaIndexTool
+    from .mdx_seach_tool.mdx_search_tool import MDXSearchTool
+    from .multion_tool.multion_tool import MultiOnTool
+    from .nl2sql.nl2sql_tool import NL2SQLTool
+    from .pdf_search_tool.pdf_search_tool import PDFSearchTool
+    from .pg_seach_tool.pg_search_tool import PGSearchTool
+    from .rag.rag_tool import RagTool
+    from .scrape_element_from_website.scrape_element_from_website import (
+        ScrapeElementFromWebsiteTool,
+    )
+    from .scrape_website_tool.scrape_website_tool import ScrapeWebsiteTool
+    from .scrapfly_scrape_website_tool.scrapfly_scrape_website_tool import (
+        ScrapflyScrapeWebsiteTool,
+    )
+    from .selenium_scraping_tool.selenium_scraping_tool import SeleniumScrapingTool
+    from .serper_dev_tool.serper_dev_tool import SerperDevTool
+    from .serply_api_tool.serply_job_search_tool import SerplyJobSearchTool
+    from .serply_api_tool.serply_news_search_tool import SerplyNewsSearchTool
+    from .serply_api_tool.serply_scholar_search_tool import SerplyScholarSearchTool
+    from .serply_api_tool.serply_web_search_tool import SerplyWebSearchTool
+    from .serply_api_tool.serply_webpage_to_markdown_tool import (
+        SerplyWebpageToMarkdownTool,
+    )
+    from .spider_tool.spider_tool import SpiderTool
+    from .txt_search_tool.txt_search_tool import TXTSearchTool
+    from .vision_tool.vision_tool import VisionTool
+    from .website_search.website_search_tool import WebsiteSearchTool
+    from .xml_search_tool.xml_search_tool import XMLSearchTool
+    from .youtube_channel_search_tool.youtube_channel_search_tool import (
+        YoutubeChannelSearchTool,
+    )
+    from .youtube_video_search_tool.youtube_video_search_tool import (
+        YoutubeVideoSearchTool,
+    )
+    from .mysql_search_tool.mysql_search_tool import MySQLSearchTool
+
+# Tools are imported on first access (PEP 562) so that importing one tool does not
+# pull in the optional backends (docker, selenium, lancedb, ...) of every other one.
+_LAZY_IMPORTS = {
+    "BrowserbaseLoadTool": ".browserbase_load_tool.browserbase_load_tool",
+    "CodeDocsSearchTool": ".code_docs_search_tool.code_docs_search_tool",
+    "CodeInterpreterTool": ".code_interpreter_tool.code_interpreter_tool",
+    "ComposioTool": ".composio_tool.composio_tool",
+    "CSVSearchTool": ".csv_search_tool.csv_search_tool",
+    "DallETool": ".dalle_tool.dalle_tool",
+    "DirectoryReadTool": ".directory_read_tool.directory_read_tool",
+    "DirectorySearchTool": ".directory_search_tool.directory_search_tool",
+    "DOCXSearchTool": ".docx_search_tool.docx_search_tool",
+    "EXASearchTool": ".exa_tools.exa_search_tool",
+    "FileReadTool": ".file_read_tool.file_read_tool",
+    "FileWriterTool": ".file_writer_tool.file_writer_tool",
+    "FirecrawlCrawlWebsiteTool": ".firecrawl_crawl_website_tool.firecrawl_crawl_website_tool",
+    "FirecrawlScrapeWebsiteTool": ".firecrawl_scrape_website_tool.firecrawl_scrape_website_tool",
+    "FirecrawlSearchTool": ".firecrawl_search_tool.firecrawl_search_tool",
+    "GithubSearchTool": ".github_search_tool.github_search_tool",
+    "JSONSearchTool": ".json_search_tool.json_search_tool",
+    "LlamaIndexTool": ".llamaindex_tool.llamaindex_tool",
+    "MDXSearchTool": ".mdx_seach_tool.mdx_search_tool",
+    "MultiOnTool": ".multion_tool.multion_tool",
+    "NL2SQLTool": ".nl2sql.nl2sql_tool",
+    "PDFSearchTool": ".pdf_search_tool.pdf_search_tool",
+    "PGSearchTool": ".pg_seach_tool.pg_search_tool",
+    "RagTool": ".rag.rag_tool",
+    "ScrapeElementFromWebsiteTool": ".scrape_element_from_website.scrape_element_from_website",
+    "ScrapeWebsiteTool": ".scrape_website_tool.scrape_website_tool",
+    "ScrapflyScrapeWebsiteTool": ".scrapfly_scrape_website_tool.scrapfly_scrape_website_tool",
+    "SeleniumScrapingTool": ".selenium_scraping_tool.selenium_scraping_tool",
+    "SerperDevTool": ".serper_dev_tool.serper_dev_tool",
+    "SerplyJobSearchTool": ".serply_api_tool.serply_job_search_tool",
+    "SerplyNewsSearchTool": ".serply_api_tool.serply_news_search_tool",
+    "SerplyScholarSearchTool": ".serply_api_tool.serply_scholar_search_tool",
+    "SerplyWebSearchTool": ".serply_api_tool.serply_web_search_tool",
+    "SerplyWebpageToMarkdownTool": ".serply_api_tool.serply_webpage_to_markdown_tool",
+    "SpiderTool": ".spider_tool.spider_tool",
+    "TXTSearchTool": ".txt_search_tool.txt_search_tool",
+    "VisionTool": ".vision_tool.vision_tool",
+    "WebsiteSearchTool": ".website_search.website_search_tool",
+    "XMLSearchTool": ".xml_search_tool.xml_search_tool",
+    "YoutubeChannelSearchTool": ".youtube_channel_search_tool.youtube_channel_search_tool",
+    "YoutubeVideoSearchTool": ".youtube_video_search_tool.youtube_video_search_tool",
+    "MySQLSearchTool": ".mysql_search_tool.mysql_search_tool",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
+
+__all__ = list(_LAZY_IMPORTS)
@@ -1,10 +1,20 @@
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional, Type
+from contextvars import copy_context
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from langchain_core.tools import StructuredTool
-from pydantic import BaseModel, ConfigDict, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, validator
 from pydantic.v1 import BaseModel as V1BaseModel
 
+from squadai.utilities.task_executor import (
+    TaskExecutorSaturatedError,
+    current_tool_call,
+    default_tool_executor,
+)
+
 
 class BaseTool(BaseModel, ABC):
     class _ArgsSchemaPlaceholder(V1BaseModel):
@@ -22,8 +32,17 @@ class BaseTool(BaseModel, ABC):
     """Flag to check if the description has been updated."""
     cache_function: Optional[Callable] = lambda _args, _result: True
     """Function that will be used to determine if the tool should be cached, should return a boolean. If None, the tool will be cached."""
+    cache_ttl: Optional[float] = None
+    """Seconds a cached result of the tool stays valid. If None, the cache default applies."""
     result_as_answer: bool = False
     """Flag to check if the tool should be the final agent answer."""
+    timeout: Optional[float] = None
+    """Seconds the tool has to answer, overriding the agent tool timeout. If None, the agent tool timeout applies."""
+    _langchain_tool: Optional[StructuredTool] = PrivateAttr(default=None)
+    # call -> releases of the resources the call holds
+    _releases: Dict[Optional[str], Dict[object, Callable[[], None]]] = PrivateAttr(
+        default_factory=dict
+    )
 
     @validator("args_schema", always=True, pre=True)
     def _default_args_schema(cls, v: Type[V1BaseModel]) -> Type[V1BaseModel]:
@@ -53,6 +72,49 @@ class BaseTool(BaseModel, ABC):
         print(f"Using Tool: {self.name}")
         return self._run(*args, **kwargs)
 
+    async def arun(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        print(f"Using Tool: {self.name}")
+        return await self._arun(*args, **kwargs)
+
+    def cleanup(self, call: Optional[str] = None) -> None:
+        """Release what a running call of the tool holds, such as sessions, drivers or containers.
+
+        Called when the call timed out, from another thread than the one running
+        it. Only the resources registered by that call with `_track` are released,
+        the other calls of the tool go on. Without a call, all of them are.
+        """
+        calls = [call] if call is not None else list(self._releases)
+        for running_call in calls:
+            releases = self._releases.pop(running_call, {})
+            for key in list(releases):
+                # Popping each release makes sure it runs once, cleanup racing the call
+                release = releases.pop(key, None)
+                if release is not None:
+                    release()
+
+    def _track(self, release: Callable[[], None]) -> Callable[[], None]:
+        """Register how to release a resource of the running call.
+
+        Returns the function releasing it once the call is done with it, which
+        does nothing when cleanup() released it first.
+        """
+        call = current_tool_call.get()
+        key = object()
+        releases = self._releases.setdefault(call, {})
+        releases[key] = release
+
+        def done() -> None:
+            if releases.pop(key, None) is not None:
+                release()
+            if not releases and self._releases.get(call) is releases:
+                self._releases.pop(call, None)
+
+        return done
+
     @abstractmethod
     def _run(
         self,
@@ -61,14 +123,50 @@ class BaseTool(BaseModel, ABC):
     ) -> Any:
         """Here goes the actual implementation of the tool."""
 
+    async def _arun(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Asynchronous implementation of the tool.
+
+        Tools waiting on the network override it to do so on the event loop.
+        Otherwise `_run` is offloaded to the tool pool, so the loop is never
+        blocked and the threads in use stay bounded. When the tool pool is full
+        the call waits on the default executor of the loop instead.
+        """
+        # The context goes along so the resources are tracked under the running call
+        try:
+            future = default_tool_executor().submit(
+                partial(copy_context().run, self._run, *args, **kwargs), block=False
+            )
+        except TaskExecutorSaturatedError:
+            return await asyncio.to_thread(self._run, *args, **kwargs)
+        return await asyncio.wrap_future(future)
+
     def to_langchain(self) -> StructuredTool:
+        """Return the tool as a langchain tool, the same one until the tool changes.
+
+        Reusing it lets the agents reuse what they computed for it, such as its
+        rendered description.
+        """
         self._set_args_schema()
-        return StructuredTool(
-            name=self.name,
-            description=self.description,
-            args_schema=self.args_schema,
-            func=self._run,
-        )
+        langchain_tool = self._langchain_tool
+        if (
+            langchain_tool is None
+            or langchain_tool.name != self.name
+            or langchain_tool.description != self.description
+            or langchain_tool.args_schema is not self.args_schema
+        ):
+            langchain_tool = StructuredTool(
+                name=self.name,
+                description=self.description,
+                args_schema=self.args_schema,
+                func=self._run,
+                coroutine=self._arun,
+            )
+            self._langchain_tool = langchain_tool
+        return langchain_tool
 
     def _set_args_schema(self):
         if self.args_schema is None:
@@ -86,16 +184,22 @@ class BaseTool(BaseModel, ABC):
             )
 
     def _generate_description(self):
-        args = []
-        args_description = []
-        for arg, attribute in self.args_schema.schema()["properties"].items():
-            if "type" in attribute:
-                args.append(f"{arg}: '{attribute['type']}'")
-            if "description" in attribute:
-                args_description.append(f"{arg}: '{attribute['description']}'")
-
+        args, args_description = _describe_args(self.args_schema)
         description = self.description.replace("\n", " ")
-        self.description = f"{self.name}({', '.join(args)}) - {description} {', '.join(args_description)}"
+        self.description = f"{self.name}({args}) - {description} {args_description}"
+
+
+@lru_cache(maxsize=None)
+def _describe_args(args_schema: Type[V1BaseModel]) -> Tuple[str, str]:
+    """Render the types and descriptions of the arguments of a schema, once per schema class."""
+    args = []
+    args_description = []
+    for arg, attribute in args_schema.schema()["properties"].items():
+        if "type" in attribute:
+            args.append(f"{arg}: '{attribute['type']}'")
+        if "description" in attribute:
+            args_description.append(f"{arg}: '{attribute['description']}'")
+    return ", ".join(args), ", ".join(args_description)
 
 
 class Tool(BaseTool):
@@ -105,6 +209,11 @@ class Tool(BaseTool):
     def _run(self, *args: Any, **kwargs: Any) -> Any:
         return self.func(*args, **kwargs)
 
+    async def _arun(self, *args: Any, **kwargs: Any) -> Any:
+        if inspect.iscoroutinefunction(self.func):
+            return await self.func(*args, **kwargs)
+        return await super()._arun(*args, **kwargs)
+
 
 def to_langchain(
     tools: list[BaseTool | StructuredTool],
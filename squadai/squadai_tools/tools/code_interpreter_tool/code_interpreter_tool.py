@@ -81,14 +81,19 @@ class CodeInterpreterTool(BaseTool):
     def run_code_in_docker(self, code: str, libraries_used: List[str]) -> str:
         self._verify_docker_image()
         container = self._init_docker_container()
-        self._install_libraries(container, libraries_used)
-
-        cmd_to_run = f'python3 -c "{code}"'
-        exec_result = container.exec_run(cmd_to_run)
+        remove_container = self._track(lambda: self._remove_container(container))
+        try:
+            self._install_libraries(container, libraries_used)
 
-        container.stop()
-        container.remove()
+            cmd_to_run = f'python3 -c "{code}"'
+            exec_result = container.exec_run(cmd_to_run)
+        finally:
+            remove_container()
 
         if exec_result.exit_code != 0:
             return f"Something went wrong while running the code: \n{exec_result.output.decode('utf-8')}"
         return exec_result.output.decode("utf-8")
+
+    def _remove_container(self, container: docker.models.containers.Container) -> None:
+        container.stop()
+        container.remove()
@@ -1,4 +1,5 @@
 import os
+import httpx
 import requests
 from bs4 import BeautifulSoup
 from typing import Optional, Type, Any
@@ -51,7 +52,26 @@ class ScrapeWebsiteTool(BaseTool):
 		)
 
 		page.encoding = page.apparent_encoding
-		parsed = BeautifulSoup(page.text, "html.parser")
+		return self._parse(page.text)
+
+	async def _arun(
+			self,
+			**kwargs: Any,
+	) -> Any:
+		website_url = kwargs.get('website_url', self.website_url)
+		async with httpx.AsyncClient(
+			timeout=15,
+			headers=self.headers,
+			cookies=self.cookies if self.cookies else {},
+			follow_redirects=True
+		) as client:
+			page = await client.get(website_url)
+
+		# The raw bytes let BeautifulSoup detect the encoding, like apparent_encoding does
+		return self._parse(page.content)
+
+	def _parse(self, html: Any) -> str:
+		parsed = BeautifulSoup(html, "html.parser")
 
 		text = parsed.get_text()
 		text = '\n'.join([i for i in text.split('\n') if i.strip() != ''])
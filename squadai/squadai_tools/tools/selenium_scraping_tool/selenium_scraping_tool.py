@@ -48,30 +48,37 @@ class SeleniumScrapingTool(BaseTool):
 	) -> Any:
 		website_url = kwargs.get('website_url', self.website_url)
 		css_element = kwargs.get('css_element', self.css_element)
-		driver = self._create_driver(website_url, self.cookie, self.wait_time)
-
-		content = []
-		if css_element is None or css_element.strip() == "":
-			body_text = driver.find_element(By.TAG_NAME, "body").text
-			content.append(body_text)
-		else:
-			for element in driver.find_elements(By.CSS_SELECTOR, css_element):
-				content.append(element.text)
-		driver.close()
-		return "\n".join(content)
+		driver, quit_driver = self._create_driver(website_url, self.cookie, self.wait_time)
+		try:
+			content = []
+			if css_element is None or css_element.strip() == "":
+				body_text = driver.find_element(By.TAG_NAME, "body").text
+				content.append(body_text)
+			else:
+				for element in driver.find_elements(By.CSS_SELECTOR, css_element):
+					content.append(element.text)
+			return "\n".join(content)
+		finally:
+			quit_driver()
 
 	def _create_driver(self, url, cookie, wait_time):
 			options = Options()
 			options.add_argument("--headless")
 			driver = self.driver(options=options)
-			driver.get(url)
-			time.sleep(wait_time)
-			if cookie:
-				driver.add_cookie(cookie)
-				time.sleep(wait_time)
+			# Tracked before loading the page, a page that hangs can still be quit
+			quit_driver = self._track(driver.quit)
+			try:
 				driver.get(url)
 				time.sleep(wait_time)
-			return driver
+				if cookie:
+					driver.add_cookie(cookie)
+					time.sleep(wait_time)
+					driver.get(url)
+					time.sleep(wait_time)
+			except Exception:
+				quit_driver()
+				raise
+			return driver, quit_driver
 
 	def close(self):
-		self.driver.close()
\ No newline at end of file
+		self.cleanup()
\ No newline at end of file
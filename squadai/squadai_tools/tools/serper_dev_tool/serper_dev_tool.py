@@ -1,6 +1,7 @@
 import datetime
 import os
 import json
+import httpx
 import requests
 
 from typing import Optional, Type, Any
@@ -34,7 +35,20 @@ class SerperDevTool(BaseTool):
 		self,
 		**kwargs: Any,
 	) -> Any:
+		payload, headers, save_file = self._request(**kwargs)
+		response = requests.request("POST", self.search_url, headers=headers, data=payload)
+		return self._format_results(response.json(), save_file)
 
+	async def _arun(
+		self,
+		**kwargs: Any,
+	) -> Any:
+		payload, headers, save_file = self._request(**kwargs)
+		async with httpx.AsyncClient(timeout=None) as client:
+			response = await client.post(self.search_url, headers=headers, content=payload)
+		return self._format_results(response.json(), save_file)
+
+	def _request(self, **kwargs: Any):
 		search_query = kwargs.get('search_query') or kwargs.get('query')
 		save_file = kwargs.get('save_file', self.save_file)
 		n_results = kwargs.get('n_results', self.n_results)
@@ -54,10 +68,9 @@ class SerperDevTool(BaseTool):
 			'X-API-KEY': os.environ['SERPER_API_KEY'],
 			'content-type': 'application/json'
 		}
+		return payload, headers, save_file
 
-		response = requests.request("POST", self.search_url, headers=headers, data=payload)
-		results = response.json()
-
+	def _format_results(self, results: Any, save_file: bool) -> Any:
 		if 'organic' in results:
 			results = results['organic'][:self.n_results]
 			string = []
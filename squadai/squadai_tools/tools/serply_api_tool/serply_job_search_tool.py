@@ -1,4 +1,5 @@
 import os
+import httpx
 import requests
 from urllib.parse import urlencode
 from typing import Type, Any, Optional
@@ -38,6 +39,18 @@ class SerplyJobSearchTool(RagTool):
             self,
             **kwargs: Any,
     ) -> Any:
+        response = requests.request("GET", self._url(**kwargs), headers=self.headers)
+        return self._format_results(response.json())
+
+    async def _arun(
+            self,
+            **kwargs: Any,
+    ) -> Any:
+        async with httpx.AsyncClient(timeout=None) as client:
+            response = await client.get(self._url(**kwargs), headers=self.headers)
+        return self._format_results(response.json())
+
+    def _url(self, **kwargs: Any) -> str:
         query_payload = {}
 
         if "query" in kwargs:
@@ -46,11 +59,10 @@ class SerplyJobSearchTool(RagTool):
             query_payload["q"] = kwargs["search_query"]
 
         # build the url
-        url = f"{self.request_url}{urlencode(query_payload)}"
-
-        response = requests.request("GET", url, headers=self.headers)
+        return f"{self.request_url}{urlencode(query_payload)}"
 
-        jobs = response.json().get("jobs", "")
+    def _format_results(self, results: Any) -> Any:
+        jobs = results.get("jobs", "")
 
         if not jobs:
             return ""
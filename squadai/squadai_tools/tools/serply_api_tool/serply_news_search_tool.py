@@ -1,4 +1,6 @@
+import asyncio
 import os
+import httpx
 import requests
 from urllib.parse import urlencode
 from typing import Type, Any, Optional
@@ -44,18 +46,7 @@ class SerplyNewsSearchTool(BaseTool):
             self,
             **kwargs: Any,
     ) -> Any:
-        # build query parameters
-        query_payload = {}
-
-        if "query" in kwargs:
-            query_payload["q"] = kwargs["query"]
-        elif "search_query" in kwargs:
-            query_payload["q"] = kwargs["search_query"]
-
-        # build the url
-        url = f"{self.search_url}{urlencode(query_payload)}"
-
-        response = requests.request("GET", url, headers=self.headers)
+        response = requests.request("GET", self._url(**kwargs), headers=self.headers)
         results = response.json()
         if "entries" in results:
             results = results['entries']
@@ -64,14 +55,7 @@ class SerplyNewsSearchTool(BaseTool):
                 try:
                     # follow url
                     r = requests.get(result['link'])
-                    final_link = r.history[-1].headers['Location']
-                    string.append('\n'.join([
-                        f"Title: {result['title']}",
-                        f"Link: {final_link}",
-                        f"Source: {result['source']['title']}",
-                        f"Published: {result['published']}",
-                        "---"
-                    ]))
+                    string.append(self._format_entry(result, r.history[-1].headers['Location']))
                 except KeyError:
                     continue
 
@@ -79,3 +63,49 @@ class SerplyNewsSearchTool(BaseTool):
             return f"\nSearch results: {content}\n"
         else:
             return results
+
+    async def _arun(
+            self,
+            **kwargs: Any,
+    ) -> Any:
+        async with httpx.AsyncClient(timeout=None) as client:
+            response = await client.get(self._url(**kwargs), headers=self.headers)
+            results = response.json()
+            if "entries" not in results:
+                return results
+
+            async def follow(result):
+                try:
+                    r = await client.get(result['link'], follow_redirects=True)
+                    return self._format_entry(result, r.history[-1].headers['Location'])
+                except KeyError:
+                    return None
+
+            # The links are followed concurrently instead of one after the other
+            entries = await asyncio.gather(
+                *(follow(result) for result in results['entries'][:self.limit])
+            )
+
+        content = '\n'.join(entry for entry in entries if entry is not None)
+        return f"\nSearch results: {content}\n"
+
+    def _url(self, **kwargs: Any) -> str:
+        # build query parameters
+        query_payload = {}
+
+        if "query" in kwargs:
+            query_payload["q"] = kwargs["query"]
+        elif "search_query" in kwargs:
+            query_payload["q"] = kwargs["search_query"]
+
+        # build the url
+        return f"{self.search_url}{urlencode(query_payload)}"
+
+    def _format_entry(self, result: dict, final_link: str) -> str:
+        return '\n'.join([
+            f"Title: {result['title']}",
+            f"Link: {final_link}",
+            f"Source: {result['source']['title']}",
+            f"Published: {result['published']}",
+            "---"
+        ])
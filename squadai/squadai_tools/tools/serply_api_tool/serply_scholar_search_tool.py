@@ -1,4 +1,5 @@
 import os
+import httpx
 import requests
 from urllib.parse import urlencode
 from typing import Type, Any, Optional
@@ -45,6 +46,18 @@ class SerplyScholarSearchTool(BaseTool):
             self,
             **kwargs: Any,
     ) -> Any:
+        response = requests.request("GET", self._url(**kwargs), headers=self.headers)
+        return self._format_results(response.json())
+
+    async def _arun(
+            self,
+            **kwargs: Any,
+    ) -> Any:
+        async with httpx.AsyncClient(timeout=None) as client:
+            response = await client.get(self._url(**kwargs), headers=self.headers)
+        return self._format_results(response.json())
+
+    def _url(self, **kwargs: Any) -> str:
         query_payload = {
             "hl": self.hl
         }
@@ -55,10 +68,10 @@ class SerplyScholarSearchTool(BaseTool):
             query_payload["q"] = kwargs["search_query"]
 
         # build the url
-        url = f"{self.search_url}{urlencode(query_payload)}"
+        return f"{self.search_url}{urlencode(query_payload)}"
 
-        response = requests.request("GET", url, headers=self.headers)
-        articles = response.json().get("articles", "")
+    def _format_results(self, results: Any) -> Any:
+        articles = results.get("articles", "")
 
         if not articles:
             return ""
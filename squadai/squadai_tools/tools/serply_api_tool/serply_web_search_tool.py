@@ -1,4 +1,5 @@
 import os
+import httpx
 import requests
 from urllib.parse import urlencode
 from typing import Type, Any, Optional
@@ -63,16 +64,29 @@ class SerplyWebSearchTool(BaseTool):
             self,
             **kwargs: Any,
     ) -> Any:
+        response = requests.request("GET", self._url(**kwargs), headers=self.headers)
+        return self._format_results(response.json())
+
+    async def _arun(
+            self,
+            **kwargs: Any,
+    ) -> Any:
+        async with httpx.AsyncClient(timeout=None) as client:
+            response = await client.get(self._url(**kwargs), headers=self.headers)
+        return self._format_results(response.json())
+
+    def _url(self, **kwargs: Any) -> str:
+        # The query goes in a copy, concurrent searches must not share it
+        query_payload = dict(self.query_payload)
         if "query" in kwargs:
-            self.query_payload["q"] = kwargs["query"]
+            query_payload["q"] = kwargs["query"]
         elif "search_query" in kwargs:
-            self.query_payload["q"] = kwargs["search_query"]
+            query_payload["q"] = kwargs["search_query"]
 
         # build the url
-        url = f"{self.search_url}{urlencode(self.query_payload)}"
+        return f"{self.search_url}{urlencode(query_payload)}"
 
-        response = requests.request("GET", url, headers=self.headers)
-        results = response.json()
+    def _format_results(self, results: Any) -> Any:
         if "results" in results:
             results = results['results']
             string = []
@@ -1,4 +1,5 @@
 import os
+import httpx
 import requests
 from typing import Type, Any, Optional
 from pydantic.v1 import BaseModel, Field
@@ -46,3 +47,16 @@ class SerplyWebpageToMarkdownTool(RagTool):
         }
         response = requests.request("POST", self.request_url, headers=self.headers, json=data)
         return response.text
+
+    async def _arun(
+            self,
+            **kwargs: Any,
+    ) -> Any:
+        data = {
+            "url": kwargs["url"],
+            "method": "GET",
+            "response_type": "markdown"
+        }
+        async with httpx.AsyncClient(timeout=None) as client:
+            response = await client.post(self.request_url, headers=self.headers, json=data)
+        return response.text
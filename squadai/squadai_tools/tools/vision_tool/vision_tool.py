@@ -1,9 +1,10 @@
 import base64
 from typing import Type
 
+import httpx
 import requests
 from squadai.squadai_tools.tools.base_tool import BaseTool
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from pydantic.v1 import BaseModel
 
 
@@ -23,18 +24,7 @@ class VisionTool(BaseTool):
     def _run_web_hosted_images(self, client, image_path_url: str) -> str:
         response = client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": "What's in this image?"},
-                        {
-                            "type": "image_url",
-                            "image_url": {"url": image_path_url},
-                        },
-                    ],
-                }
-            ],
+            messages=self._messages(image_path_url),
             max_tokens=300,
         )
 
@@ -43,36 +33,41 @@ class VisionTool(BaseTool):
     def _run_local_images(self, client, image_path_url: str) -> str:
         base64_image = self._encode_image(image_path_url)
 
-        headers = {
+        response = requests.post(
+            "https://api.openai.com/v1/chat/completions",
+            headers=self._headers(client.api_key),
+            json=self._local_image_payload(base64_image),
+        )
+
+        return response.json()["choices"][0]["message"]["content"]
+
+    def _messages(self, image_url: str) -> list:
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "What's in this image?"},
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": image_url},
+                    },
+                ],
+            }
+        ]
+
+    def _headers(self, api_key: str) -> dict:
+        return {
             "Content-Type": "application/json",
-            "Authorization": f"Bearer {client.api_key}",
+            "Authorization": f"Bearer {api_key}",
         }
 
-        payload = {
+    def _local_image_payload(self, base64_image: str) -> dict:
+        return {
             "model": "gpt-4o-mini",
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": "What's in this image?"},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
-                            },
-                        },
-                    ],
-                }
-            ],
+            "messages": self._messages(f"data:image/jpeg;base64,{base64_image}"),
             "max_tokens": 300,
         }
 
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions", headers=headers, json=payload
-        )
-
-        return response.json()["choices"][0]["message"]["content"]
-
     def _run(self, **kwargs) -> str:
         client = OpenAI()
 
@@ -88,6 +83,31 @@ class VisionTool(BaseTool):
 
         return image_description
 
+    async def _arun(self, **kwargs) -> str:
+        client = AsyncOpenAI()
+
+        image_path_url = kwargs.get("image_path_url")
+
+        if not image_path_url:
+            return "Image Path or URL is required."
+
+        if "http" in image_path_url:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=self._messages(image_path_url),
+                max_tokens=300,
+            )
+            return response.choices[0].message.content
+
+        base64_image = self._encode_image(image_path_url)
+        async with httpx.AsyncClient(timeout=None) as http_client:
+            response = await http_client.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers=self._headers(client.api_key),
+                json=self._local_image_payload(base64_image),
+            )
+        return response.json()["choices"][0]["message"]["content"]
+
     def _encode_image(self, image_path: str):
         with open(image_path, "rb") as image_file:
             return base64.b64encode(image_file.read()).decode("utf-8")
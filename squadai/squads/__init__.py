@@ -1,3 +1,13 @@
+from .squad_batch_output import SquadBatchOutput, SquadBatchResult
 from .squad_output import SquadOutput
+from .squad_process_pool import SquadProcessPool
+from .squad_stream import SquadStreamEvent, SquadStreamEventType
 
-__all__ = ["SquadOutput"]
+__all__ = [
+    "SquadBatchOutput",
+    "SquadBatchResult",
+    "SquadOutput",
+    "SquadProcessPool",
+    "SquadStreamEvent",
+    "SquadStreamEventType",
+]
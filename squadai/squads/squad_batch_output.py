@@ -0,0 +1,54 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, InstanceOf
+
+from squadai.squads.squad_output import SquadOutput
+from squadai.types.usage_metrics import UsageMetrics
+
+
+class SquadBatchResult(BaseModel):
+    """Class that represents the result of one input of a batch kickoff."""
+
+    index: int = Field(description="Position of the input in the batch")
+    inputs: Dict[str, Any] = Field(
+        description="Inputs the squad was kicked off with", default={}
+    )
+    output: Optional[SquadOutput] = Field(
+        description="Output of the squad, None if the kickoff failed", default=None
+    )
+    error: Optional[InstanceOf[BaseException]] = Field(
+        description="Exception raised by the kickoff, None if it succeeded",
+        default=None,
+    )
+    token_usage: UsageMetrics = Field(
+        description="Token usage of this kickoff", default_factory=UsageMetrics
+    )
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class SquadBatchOutput(BaseModel):
+    """Class that represents the results of a batch kickoff, in input order."""
+
+    results: List[SquadBatchResult] = Field(
+        description="Result of each input, in input order", default=[]
+    )
+    token_usage: UsageMetrics = Field(
+        description="Token usage of the whole batch", default_factory=UsageMetrics
+    )
+
+    @property
+    def outputs(self) -> List[Optional[SquadOutput]]:
+        """Output of each input, None for the inputs that failed."""
+        return [result.output for result in self.results]
+
+    @property
+    def failures(self) -> List[SquadBatchResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    def raise_for_failures(self) -> None:
+        """Raise the error of the first failed input, if any."""
+        if failures := self.failures:
+            raise failures[0].error  # type: ignore # Exception must be derived from BaseException
@@ -0,0 +1,110 @@
+import asyncio
+import copy
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from squadai.squads.squad_batch_output import SquadBatchOutput, SquadBatchResult
+from squadai.types.usage_metrics import UsageMetrics
+
+SquadSource = Union[Dict[str, Any], Callable[[], Any]]
+
+# Squad or Pipeline rebuilt once by each worker process
+_worker_target: Any = None
+
+
+def _init_worker(source: SquadSource) -> None:
+    global _worker_target
+    if callable(source):
+        _worker_target = source()
+    else:
+        from squadai.squad import Squad
+
+        _worker_target = Squad(config=copy.deepcopy(source))
+
+
+def _kickoff_in_worker(index: int, inputs: Dict[str, Any]) -> Any:
+    from squadai.pipeline.pipeline import Pipeline
+
+    if isinstance(_worker_target, Pipeline):
+        return asyncio.run(_worker_target.process_single_kickoff(inputs))
+    return _worker_target._kickoff_batch_item(index, inputs)
+
+
+class SquadProcessPool:
+    """Runs squad or pipeline kickoffs on worker processes to use every CPU core.
+
+    Squads hold LLM clients, tools and callbacks that cannot be sent to another
+    process, so each worker rebuilds its own squad once from a serializable
+    description and reuses it for all the kickoffs it receives. Only inputs,
+    outputs and usage metrics cross the process boundary.
+
+    Attributes:
+        source: Squad `config` dict, or a picklable callable (e.g. a module level function) returning a Squad or a Pipeline.
+        max_processes: Number of worker processes, defaults to SQUADAI_MAX_PROCESSES or the CPU count.
+        start_method: Multiprocessing start method, "spawn" by default so workers never inherit threads or open connections.
+    """
+
+    def __init__(
+        self,
+        source: SquadSource,
+        max_processes: Optional[int] = None,
+        start_method: str = "spawn",
+    ) -> None:
+        if max_processes is None and os.environ.get("SQUADAI_MAX_PROCESSES"):
+            max_processes = int(os.environ["SQUADAI_MAX_PROCESSES"])
+
+        self.source = source
+        self.max_processes = max_processes or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_processes,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(source,),
+        )
+
+    def submit(self, index: int, inputs: Dict[str, Any]) -> Future:
+        """Submit one kickoff to the workers.
+
+        Returns:
+            Future holding a SquadBatchResult for squads, or the List[PipelineKickoffResult] of the run for pipelines.
+        """
+        return self._executor.submit(_kickoff_in_worker, index, inputs)
+
+    def iter_kickoffs(
+        self, inputs: List[Dict[str, Any]]
+    ) -> Iterator[SquadBatchResult]:
+        """Kick off the squad for each input, yielding each result as soon as its worker finishes it."""
+        futures = [
+            self.submit(index, input_data) for index, input_data in enumerate(inputs)
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def kickoff_batch(self, inputs: List[Dict[str, Any]]) -> SquadBatchOutput:
+        """Kick off the squad for each input and collect the results in input order."""
+        results = sorted(self.iter_kickoffs(inputs), key=lambda result: result.index)
+
+        total_usage_metrics = UsageMetrics()
+        for result in results:
+            total_usage_metrics.add_usage_metrics(result.token_usage)
+        return SquadBatchOutput(results=results, token_usage=total_usage_metrics)
+
+    async def akickoff_pipeline(self, inputs: Dict[str, Any]) -> List[Any]:
+        """Run one pipeline kickoff on a worker without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(0, inputs))
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __enter__(self) -> "SquadProcessPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown(cancel_futures=True)
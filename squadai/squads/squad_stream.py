@@ -0,0 +1,62 @@
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from pydantic import BaseModel, Field
+
+
+class SquadStreamEventType(str, Enum):
+    """Kinds of events emitted while streaming a squad kickoff."""
+
+    token = "token"
+    action = "action"
+    observation = "observation"
+    final_answer = "final_answer"
+    task_output = "task_output"
+    squad_output = "squad_output"
+
+
+class SquadStreamEvent(BaseModel):
+    """Class that represents one event of a streamed squad kickoff."""
+
+    type: SquadStreamEventType = Field(description="Kind of the event")
+    content: str = Field(
+        description="Token, action log, tool observation or answer text", default=""
+    )
+    agent: Optional[str] = Field(
+        description="Role of the agent the event comes from", default=None
+    )
+    task: Optional[str] = Field(
+        description="Description of the task the event belongs to", default=None
+    )
+    tool: Optional[str] = Field(
+        description="Tool name of action and observation events", default=None
+    )
+    output: Optional[Any] = Field(
+        description="TaskOutput or SquadOutput of output events", default=None
+    )
+
+
+SquadStreamEmitter = Callable[[SquadStreamEvent], None]
+
+
+class SquadStreamTokenHandler(BaseCallbackHandler):
+    """Forwards the LLM tokens of an agent run to the squad stream."""
+
+    def __init__(
+        self, emit: SquadStreamEmitter, agent: Optional[str], task: Optional[str]
+    ) -> None:
+        self.emit = emit
+        self.agent = agent
+        self.task = task
+
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        if token:
+            self.emit(
+                SquadStreamEvent(
+                    type=SquadStreamEventType.token,
+                    content=token,
+                    agent=self.agent,
+                    task=self.task,
+                )
+            )
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import json
 import os
@@ -6,9 +7,8 @@ import uuid
 from concurrent.futures import Future
 from copy import copy
 from hashlib import md5
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union
 
-from opentelemetry.trace import Span
 from pydantic import (
     UUID4,
     BaseModel,
@@ -25,6 +25,7 @@ from squadai.tasks.task_output import TaskOutput
 from squadai.utilities.config import process_config
 from squadai.utilities.converter import Converter, convert_to_model
 from squadai.utilities.i18n import I18N
+from squadai.utilities.task_executor import TaskExecutor, default_task_executor
 
 
 class Task(BaseModel):
@@ -47,6 +48,8 @@ class Task(BaseModel):
     """
 
     __hash__ = object.__hash__  # type: ignore
+    # Tool actions of one agent step can run in parallel and update the counters together
+    _counters_lock: ClassVar[threading.Lock] = threading.Lock()
     used_tools: int = 0
     tools_errors: int = 0
     delegations: int = 0
@@ -110,7 +113,6 @@ class Task(BaseModel):
 
     _original_description: Optional[str] = PrivateAttr(default=None)
     _original_expected_output: Optional[str] = PrivateAttr(default=None)
-    _thread: Optional[threading.Thread] = PrivateAttr(default=None)
     _execution_time: Optional[float] = PrivateAttr(default=None)
 
     @model_validator(mode="before")
@@ -199,24 +201,30 @@ class Task(BaseModel):
         agent: BaseAgent | None = None,
         context: Optional[str] = None,
         tools: Optional[List[Any]] = None,
+        executor: Optional[TaskExecutor] = None,
     ) -> Future[TaskOutput]:
-        """Execute the task asynchronously."""
-        future: Future[TaskOutput] = Future()
-        threading.Thread(
-            target=self._execute_task_async, args=(agent, context, tools, future)
-        ).start()
-        return future
-
-    def _execute_task_async(
+        """Execute the task asynchronously on a bounded worker pool.
+
+        Args:
+            agent: Agent to execute the task with.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+            executor: Pool to run the task on, defaults to the process-wide one.
+
+        Returns:
+            Future holding the task output, it can be cancelled until a worker picks it up.
+        """
+        executor = executor or default_task_executor()
+        return executor.submit(self._execute_core, agent, context, tools)
+
+    async def aexecute(
         self,
-        agent: Optional[BaseAgent],
-        context: Optional[str],
-        tools: Optional[List[Any]],
-        future: Future[TaskOutput],
-    ) -> None:
-        """Execute the task asynchronously with context handling."""
-        result = self._execute_core(agent, context, tools)
-        future.set_result(result)
+        agent: Optional[BaseAgent] = None,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> TaskOutput:
+        """Execute the task on the running event loop."""
+        return await self._aexecute_core(agent, context, tools)
 
     def _execute_core(
         self,
@@ -225,13 +233,7 @@ class Task(BaseModel):
         tools: Optional[List[Any]],
     ) -> TaskOutput:
         """Run the core execution logic of the task."""
-        agent = agent or self.agent
-        self.agent = agent
-        if not agent:
-            raise Exception(
-                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Squad using a specific process that support that, like hierarchical."
-            )
-
+        agent = self._resolve_agent(agent)
         start_time = self._set_start_execution_time()
 
         self.prompt_context = context
@@ -244,7 +246,57 @@ class Task(BaseModel):
         )
 
         pydantic_output, json_output = self._export_output(result)
+        return self._complete_execution(
+            agent, result, pydantic_output, json_output, start_time
+        )
+
+    async def _aexecute_core(
+        self,
+        agent: Optional[BaseAgent],
+        context: Optional[str],
+        tools: Optional[List[Any]],
+    ) -> TaskOutput:
+        """Run the core execution logic of the task without blocking the event loop."""
+        agent = self._resolve_agent(agent)
+        start_time = self._set_start_execution_time()
 
+        self.prompt_context = context
+        tools = tools or self.tools or []
+
+        result = await agent.aexecute_task(
+            task=self,
+            context=context,
+            tools=tools,
+        )
+
+        if self.output_pydantic or self.output_json:
+            pydantic_output, json_output = await asyncio.to_thread(
+                self._export_output, result
+            )
+        else:
+            pydantic_output, json_output = None, None
+        return self._complete_execution(
+            agent, result, pydantic_output, json_output, start_time
+        )
+
+    def _resolve_agent(self, agent: Optional[BaseAgent]) -> BaseAgent:
+        agent = agent or self.agent
+        self.agent = agent
+        if not agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Squad using a specific process that support that, like hierarchical."
+            )
+        return agent
+
+    def _complete_execution(
+        self,
+        agent: BaseAgent,
+        result: str,
+        pydantic_output: Optional[BaseModel],
+        json_output: Optional[Dict[str, Any]],
+        start_time: float,
+    ) -> TaskOutput:
+        """Store the task output, run the callback and write the output file."""
         task_output = TaskOutput(
             name=self.name,
             description=self.description,
@@ -301,40 +353,66 @@ class Task(BaseModel):
 
     def increment_tools_errors(self) -> None:
         """Increment the tools errors counter."""
-        self.tools_errors += 1
+        with self._counters_lock:
+            self.tools_errors += 1
 
     def increment_delegations(self) -> None:
         """Increment the delegations counter."""
-        self.delegations += 1
+        with self._counters_lock:
+            self.delegations += 1
 
-    def copy(self, agents: List["BaseAgent"]) -> "Task":
-        """Create a deep copy of the Task."""
-        exclude = {
-            "id",
-            "agent",
-            "context",
-            "tools",
-        }
+    def increment_used_tools(self) -> int:
+        """Increment the used tools counter, returning its new value."""
+        with self._counters_lock:
+            self.used_tools += 1
+            return self.used_tools
 
-        copied_data = self.model_dump(exclude=exclude)
-        copied_data = {k: v for k, v in copied_data.items() if v is not None}
+    def copy(
+        self,
+        agents: List["BaseAgent"],
+        task_mapping: Optional[Dict[UUID4, "Task"]] = None,
+    ) -> "Task":
+        """Create a copy of the Task for a new run.
 
-        cloned_context = (
-            [task.copy(agents) for task in self.context] if self.context else None
-        )
+        The copy shares the task configuration with the original and only resets
+        the state a run mutates, without running the validators again.
+
+        Args:
+            agents: Copied agents, the task agent is matched by role.
+            task_mapping: Copies already made of other tasks, keyed by the id of their original, so context points at them.
+
+        Returns:
+            The copied task.
+        """
+        task_mapping = task_mapping if task_mapping is not None else {}
 
         def get_agent_by_role(role: str) -> Union["BaseAgent", None]:
             return next((agent for agent in agents if agent.role == role), None)
 
+        cloned_context = (
+            [
+                task_mapping.get(task.id) or task.copy(agents, task_mapping)
+                for task in self.context
+            ]
+            if self.context
+            else self.context
+        )
         cloned_agent = get_agent_by_role(self.agent.role) if self.agent else None
-        cloned_tools = copy(self.tools) if self.tools else []
 
-        copied_task = Task(
-            **copied_data,
-            context=cloned_context,
-            agent=cloned_agent,
-            tools=cloned_tools,
+        copied_task = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agent": cloned_agent,
+                "context": cloned_context,
+                "tools": copy(self.tools) if self.tools else [],
+                "output": None,
+                "used_tools": 0,
+                "tools_errors": 0,
+                "delegations": 0,
+            }
         )
+        copied_task._execution_time = None
+        task_mapping[self.id] = copied_task
 
         return copied_task
 
@@ -11,6 +11,7 @@ class AgentTools(BaseAgentTools):
         tools = [
             StructuredTool.from_function(
                 func=self.delegate_work,
+                coroutine=self.adelegate_work,
                 name="Delegate work to coworker",
                 description=self.i18n.tools("delegate_work").format(
                     coworkers=coworkers
@@ -18,6 +19,7 @@ class AgentTools(BaseAgentTools):
             ),
             StructuredTool.from_function(
                 func=self.ask_question,
+                coroutine=self.aask_question,
                 name="Ask question to coworker",
                 description=self.i18n.tools("ask_question").format(coworkers=coworkers),
             ),
@@ -0,0 +1,128 @@
+import threading
+import weakref
+from inspect import signature
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+
+class ToolDescriptor(BaseModel):
+    """What the agents need to know about a tool, computed once per tool.
+
+    Holds the argument schema, a validator bound to the tool arguments model
+    and the texts rendered into the agent prompt and the function calling
+    prompt, so none of them is rebuilt on every task or tool call.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(description="Name of the tool.")
+    description: str = Field(description="Description of the tool.")
+    args: Dict[str, Any] = Field(description="JSON schema of each argument of the tool.")
+    text: str = Field(description="Name, description and arguments for the agent prompt.")
+    function_calling_text: str = Field(
+        description="Name, description and arguments for the function calling prompt."
+    )
+
+    _validator: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = PrivateAttr(
+        default=None
+    )
+
+    @classmethod
+    def from_tool(cls, tool: BaseTool) -> "ToolDescriptor":
+        args = tool.args
+        if hasattr(tool, "func") and tool.func:
+            heading = f"Tool Name: {tool.name}{signature(tool.func)}"
+        else:
+            heading = f"Tool Name: {tool.name}"
+        text = f"{heading}\nTool Description: {tool.description}\nTool Arguments: {args}"
+
+        function_calling_args = {
+            k: {k2: v2 for k2, v2 in v.items() if k2 in ["description", "type"]}
+            for k, v in args.items()
+        }
+        function_calling_text = "\n".join(
+            [
+                f"Tool Name: {tool.name.lower()}",
+                f"Tool Description: {tool.description}",
+                f"Tool Arguments: {function_calling_args}",
+            ]
+        )
+
+        descriptor = cls(
+            name=tool.name,
+            description=tool.description,
+            args=args,
+            text=text,
+            function_calling_text=function_calling_text,
+        )
+        descriptor._validator = _arguments_validator(tool.args_schema)
+        return descriptor
+
+    def validate_arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate the arguments against the tool schema.
+
+        Returns:
+            The arguments that were given, coerced by the schema, without the
+            ones the tool does not accept. They are returned untouched when the
+            tool has no schema.
+
+        Raises:
+            ValidationError: The arguments do not match the schema.
+        """
+        if self._validator is None:
+            return arguments
+        return self._validator(arguments)
+
+
+def _arguments_validator(
+    args_schema: Any,
+) -> Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]:
+    """Bind the validation of an arguments model, be it a pydantic v1 or v2 one."""
+    if not isinstance(args_schema, type):
+        return None
+    if issubclass(args_schema, BaseModel):
+        model_validate = args_schema.model_validate
+        return lambda arguments: model_validate(arguments).model_dump(exclude_unset=True)
+    parse_obj = getattr(args_schema, "parse_obj", None)
+    if parse_obj is None:
+        return None
+    return lambda arguments: parse_obj(arguments).dict(exclude_unset=True)
+
+
+# Tools are keyed by identity and held weakly, an entry goes away with its tool
+_tool_descriptors: Dict[int, Tuple["weakref.ref[BaseTool]", Any, ToolDescriptor]] = {}
+_tool_descriptors_lock = threading.Lock()
+
+
+def _forget_tool(key: int, ref: "weakref.ref[BaseTool]") -> None:
+    with _tool_descriptors_lock:
+        cached = _tool_descriptors.get(key)
+        if cached is not None and cached[0] is ref:
+            del _tool_descriptors[key]
+
+
+def tool_descriptor(tool: BaseTool) -> ToolDescriptor:
+    """Return the descriptor of a tool, built on first use.
+
+    It is rebuilt when the name, description or argument schema of the tool
+    changed since.
+    """
+    key = id(tool)
+    with _tool_descriptors_lock:
+        cached = _tool_descriptors.get(key)
+        if (
+            cached is not None
+            and cached[0]() is tool
+            and cached[1] is tool.args_schema
+            and cached[2].name == tool.name
+            and cached[2].description == tool.description
+        ):
+            return cached[2]
+
+    descriptor = ToolDescriptor.from_tool(tool)
+    ref = weakref.ref(tool, lambda ref: _forget_tool(key, ref))
+    with _tool_descriptors_lock:
+        _tool_descriptors[key] = (ref, tool.args_schema, descriptor)
+    return descriptor
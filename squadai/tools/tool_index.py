@@ -0,0 +1,63 @@
+import re
+import threading
+from difflib import get_close_matches
+from typing import Dict, Optional, Sequence
+
+from langchain_core.tools import BaseTool
+
+
+class ToolIndex:
+    """Lookup of the tools of an agent by the name the LLM gave.
+
+    Names are resolved exactly first, then after normalizing case, spacing and
+    underscores, both through dictionaries built once for the tools. Only names
+    matching neither are compared by similarity, and the outcome is cached so
+    a misspelled name is only compared once.
+
+    Attributes:
+        tools: Tools indexed, in the order they were given.
+        cutoff: Minimum similarity for a misspelled name to resolve to a tool.
+    """
+
+    MAX_FUZZY_MATCHES = 256
+
+    def __init__(self, tools: Sequence[BaseTool], cutoff: float = 0.85) -> None:
+        self.tools = tools
+        self.cutoff = cutoff
+        self._by_name: Dict[str, BaseTool] = {}
+        self._by_normalized_name: Dict[str, BaseTool] = {}
+        # The first tool wins when names collide, like the linear scan it replaces
+        for tool in tools:
+            self._by_name.setdefault(tool.name.strip(), tool)
+            self._by_normalized_name.setdefault(self.normalize(tool.name), tool)
+        self._fuzzy_matches: Dict[str, Optional[BaseTool]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return re.sub(r"[\s_]+", " ", name.casefold()).strip()
+
+    def __contains__(self, name: str) -> bool:
+        """Whether the name is one of the tools, up to case, spacing and underscores."""
+        return self.normalize(name) in self._by_normalized_name
+
+    def get(self, name: str) -> Optional[BaseTool]:
+        """Return the tool of a name, the most similar one when it is misspelled."""
+        if tool := self._by_name.get(name.strip()):
+            return tool
+        normalized = self.normalize(name)
+        if tool := self._by_normalized_name.get(normalized):
+            return tool
+
+        with self._lock:
+            if normalized in self._fuzzy_matches:
+                return self._fuzzy_matches[normalized]
+        matches = get_close_matches(
+            normalized, list(self._by_normalized_name), n=1, cutoff=self.cutoff
+        )
+        tool = self._by_normalized_name[matches[0]] if matches else None
+        with self._lock:
+            if len(self._fuzzy_matches) >= self.MAX_FUZZY_MATCHES:
+                self._fuzzy_matches.clear()
+            self._fuzzy_matches[normalized] = tool
+        return tool
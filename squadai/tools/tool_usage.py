@@ -1,21 +1,33 @@
 import ast
+import asyncio
 import os
-from difflib import SequenceMatcher
+import threading
+import uuid
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from textwrap import dedent
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from langchain_core.tools import BaseTool
-from langchain_groq import ChatGroq
 from dotenv import load_dotenv
 
 from squadai.agents.tools_handler import ToolsHandler
 from squadai.tools.tool_calling import InstructorToolCalling, ToolCalling
+from squadai.tools.tool_descriptor import tool_descriptor
+from squadai.tools.tool_index import ToolIndex
 from squadai.utilities import I18N, Converter, ConverterError, Printer
+from squadai.utilities.converter import is_chat_groq, is_llama
+from squadai.utilities.task_executor import (
+    TaskExecutorSaturatedError,
+    current_tool_call,
+    default_tool_executor,
+)
 
 load_dotenv()
 
 GROQ_BIGGER_MODELS = [os.getenv("GROQ_MODEL_NAME")]
 
+DELEGATION_TOOL_NAMES = ("delegate work to coworker", "ask question to coworker")
+
 
 class ToolUsageErrorException(Exception):
     """Exception raised for errors in the tool usage."""
@@ -25,6 +37,20 @@ class ToolUsageErrorException(Exception):
         super().__init__(self.message)
 
 
+class ToolTimeoutError(Exception):
+    """Exception raised when a tool does not answer within its timeout.
+
+    The call is None when the call never started, the tool pool being full.
+    """
+
+    def __init__(self, tool: str, timeout: float, call: Optional[str] = None) -> None:
+        self.tool = tool
+        self.timeout = timeout
+        self.call = call
+        self.message = f"Tool {tool} did not answer within {timeout} seconds."
+        super().__init__(self.message)
+
+
 class ToolUsage:
     """
     Class that represents the usage of a tool by an agent.
@@ -37,6 +63,8 @@ class ToolUsage:
       tools_description: Description of the tools available for the agent.
       tools_names: Names of the tools available for the agent.
       function_calling_llm: Language model to be used for the tool usage.
+      tool_index: Lookup of the tools by name, built from tools when not given.
+      timeout: Seconds the tool has to answer, unless the tool sets its own timeout.
     """
 
     def __init__(
@@ -50,6 +78,8 @@ class ToolUsage:
         function_calling_llm: Any,
         agent: Any,
         action: Any,
+        tool_index: Optional[ToolIndex] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         self._i18n: I18N = I18N()
         self._printer: Printer = Printer()
@@ -65,18 +95,18 @@ class ToolUsage:
         self.task = task
         self.action = action
         self.function_calling_llm = function_calling_llm
+        self.tool_index = tool_index or ToolIndex(tools)
+        self.timeout = timeout
 
 
-        if isinstance(self.function_calling_llm, ChatGroq):
+        if is_chat_groq(self.function_calling_llm):
             if " " in self.tools_names:
                 raise Exception(
                     "Tools names should not have spaces for ChatGroq models."
                 )
 
         # Set the maximum parsing attempts for bigger models
-        if (isinstance(self.function_calling_llm, ChatGroq)) and (
-            self.function_calling_llm.groq_api_base is None
-        ):
+        if is_llama(self.function_calling_llm):
             if self.function_calling_llm.model_name in GROQ_BIGGER_MODELS:
                 self._max_parsing_attempts = 2
                 self._remember_format_after_usages = 4
@@ -89,30 +119,227 @@ class ToolUsage:
         self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
     ) -> str:
         if isinstance(calling, ToolUsageErrorException):
-            error = calling.message
-            if self.agent.verbose:
-                self._printer.print(content=f"\n\n{error}\n", color="red")
-            self.task.increment_tools_errors()
-            return error
+            return self._calling_error(calling)
 
         # BUG? The code below seems to be unreachable
         try:
             tool = self._select_tool(calling.tool_name)
         except Exception as e:
-            error = getattr(e, "message", str(e))
-            self.task.increment_tools_errors()
-            if self.agent.verbose:
-                self._printer.print(content=f"\n\n{error}\n", color="red")
-            return error
+            return self._selection_error(e)
         return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"  # type: ignore # BUG?: "_use" of "ToolUsage" does not return a value (it only ever returns None)
 
+    async def ause(
+        self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
+    ) -> str:
+        """Asynchronous counterpart of `use`, awaiting the tool instead of blocking on it."""
+        if isinstance(calling, ToolUsageErrorException):
+            return self._calling_error(calling)
+
+        try:
+            tool = self._select_tool(calling.tool_name)
+        except Exception as e:
+            return self._selection_error(e)
+        return f"{await self._ause(tool_string=tool_string, tool=tool, calling=calling)}"
+
     def _use(
         self,
         tool_string: str,
         tool: BaseTool,
         calling: Union[ToolCalling, InstructorToolCalling],
     ) -> str:  # TODO: Fix this return type
+        repeated_usage = self._repeated_usage_result(tool, calling)
+        if repeated_usage is not None:
+            return repeated_usage
+
+        result = self._read_cache(calling)
 
+        if result is None:  #! finecwg: if not result --> if result is None
+            try:
+                self._track_delegation(calling)
+                arguments = self._validate_arguments(tool, calling)
+                result = self._invoke(tool, calling, arguments)
+            except ToolTimeoutError as e:
+                return self._timeout_error(e, tool)
+            except Exception as e:
+                error = self._tool_error(e, tool)
+                if error is not None:
+                    return error  # type: ignore # No return value expected
+                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
+
+            self._cache_result(tool, calling, result)
+
+        return self._finish_usage(tool, calling, result)
+
+    async def _ause(
+        self,
+        tool_string: str,
+        tool: BaseTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> str:
+        repeated_usage = self._repeated_usage_result(tool, calling)
+        if repeated_usage is not None:
+            return repeated_usage
+
+        result = self._read_cache(calling)
+
+        if result is None:
+            try:
+                self._track_delegation(calling)
+                arguments = self._validate_arguments(tool, calling)
+                result = await self._ainvoke(tool, calling, arguments)
+            except ToolTimeoutError as e:
+                return self._timeout_error(e, tool)
+            except Exception as e:
+                error = self._tool_error(e, tool)
+                if error is not None:
+                    return error
+                return await self.ause(calling=calling, tool_string=tool_string)
+
+            self._cache_result(tool, calling, result)
+
+        return self._finish_usage(tool, calling, result)
+
+    def _invoke(
+        self,
+        tool: BaseTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        arguments: Dict[str, Any],
+    ) -> Any:
+        """Invoke the tool, on the tool pool when it has a timeout to respect."""
+        timeout = self._timeout(tool, calling)
+        if timeout is None:
+            return tool.invoke(input=arguments)
+
+        call = uuid.uuid4().hex
+        future = self._submit(tool, call, arguments, timeout)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # A call still waiting for a worker never ran, there is nothing to clean up
+            raise ToolTimeoutError(tool.name, timeout, None if future.cancel() else call)
+
+    async def _ainvoke(
+        self,
+        tool: BaseTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        arguments: Dict[str, Any],
+    ) -> Any:
+        timeout = self._timeout(tool, calling)
+        if timeout is None:
+            return await tool.ainvoke(input=arguments)
+
+        call = uuid.uuid4().hex
+        if self._is_sync_only(tool):
+            # Run on the tool pool rather than the loop default executor, which
+            # would keep the abandoned call and block the loop shutdown on it
+            future = self._submit(tool, call, arguments, timeout)
+            invocation = asyncio.wrap_future(future)
+        else:
+            # The task running the tool copies the context, and the call with it
+            token = current_tool_call.set(call)
+            try:
+                invocation = asyncio.ensure_future(tool.ainvoke(input=arguments))
+            finally:
+                current_tool_call.reset(token)
+        try:
+            return await asyncio.wait_for(invocation, timeout)
+        except asyncio.TimeoutError:
+            raise ToolTimeoutError(tool.name, timeout, call)
+        except TaskExecutorSaturatedError:
+            # Raised by tools offloading to the tool pool themselves
+            raise ToolTimeoutError(tool.name, timeout)
+
+    def _submit(
+        self, tool: BaseTool, call: str, arguments: Dict[str, Any], timeout: float
+    ) -> Any:
+        """Submit the call to the tool pool, without waiting for room on a full pool."""
+        try:
+            return default_tool_executor().submit(
+                self._run_call, call, tool.invoke, arguments, block=False
+            )
+        except TaskExecutorSaturatedError:
+            raise ToolTimeoutError(tool.name, timeout)
+
+    @staticmethod
+    def _run_call(call: str, invoke: Any, arguments: Dict[str, Any]) -> Any:
+        token = current_tool_call.set(call)
+        try:
+            return invoke(input=arguments)
+        finally:
+            current_tool_call.reset(token)
+
+    @staticmethod
+    def _is_sync_only(tool: BaseTool) -> bool:
+        """Whether awaiting the tool would only run its synchronous code on a thread."""
+        if hasattr(tool, "coroutine"):
+            return tool.coroutine is None
+        return type(tool)._arun is BaseTool._arun
+
+    def _timeout(
+        self, tool: BaseTool, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Optional[float]:
+        """Seconds the tool has to answer, None when it can take as long as it needs.
+
+        Delegations are not bounded, the coworker is bounded by its own limits.
+        """
+        if calling.tool_name.casefold().strip() in DELEGATION_TOOL_NAMES:
+            return None
+        timeout = getattr(self._original_tool(tool), "timeout", None)
+        if timeout is None:
+            timeout = self.timeout
+        return timeout if timeout and timeout > 0 else None
+
+    def _timeout_error(self, e: ToolTimeoutError, tool: BaseTool) -> str:
+        """Tell the agent the tool timed out and release what the call holds.
+
+        The call is not retried, it would most likely time out again. The thread
+        running it cannot be stopped, so the tool releases the resources of that
+        call instead, which makes it fail and return. This runs on its own
+        thread, the tool pool may be full of stuck calls.
+        """
+        self.task.increment_tools_errors()
+        cleanup = getattr(self._original_tool(tool), "cleanup", None)
+        if e.call is not None and callable(cleanup):
+            threading.Thread(
+                target=self._cleanup,
+                args=(cleanup, e.call, tool.name),
+                name="squadai-tool-cleanup",
+                daemon=True,
+            ).start()
+
+        error = self._i18n.errors("tool_timeout").format(
+            tool=tool.name, timeout=e.timeout
+        )
+        if self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        return f'{error}\n{self._i18n.slice("format").format(tool_names=self.tools_names)}'
+
+    def _cleanup(self, cleanup: Any, call: str, tool_name: str) -> None:
+        try:
+            cleanup(call)
+        except Exception as e:
+            self._printer.print(
+                content=f"Failed to clean up tool {tool_name} after its timeout: {e}",
+                color="red",
+            )
+
+    def _calling_error(self, calling: ToolUsageErrorException) -> str:
+        error = calling.message
+        if self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        self.task.increment_tools_errors()
+        return error
+
+    def _selection_error(self, e: Exception) -> str:
+        error = getattr(e, "message", str(e))
+        self.task.increment_tools_errors()
+        if self.agent.verbose:
+            self._printer.print(content=f"\n\n{error}\n", color="red")
+        return error
+
+    def _repeated_usage_result(
+        self, tool: BaseTool, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Optional[str]:
         if self._check_tool_repeated_usage(calling=calling):  # type: ignore # _check_tool_repeated_usage of "ToolUsage" does not return a value (it only ever returns None)
             try:
                 result = self._i18n.errors("task_repeated_usage").format(
@@ -130,73 +357,78 @@ class ToolUsage:
 
             except Exception:
                 self.task.increment_tools_errors()
+        return None
 
-        result = None  # type: ignore # Incompatible types in assignment (expression has type "None", variable has type "str")
-
+    def _read_cache(self, calling: Union[ToolCalling, InstructorToolCalling]) -> Any:
         if self.tools_handler.cache:
-            result = self.tools_handler.cache.read(  # type: ignore # Incompatible types in assignment (expression has type "str | None", variable has type "str")
+            return self.tools_handler.cache.read(
                 tool=calling.tool_name, input=calling.arguments
             )
+        return None
 
-        original_tool = next(
-            (ot for ot in self.original_tools if ot.name == tool.name), None
-        )
+    def _original_tool(self, tool: BaseTool) -> Any:
+        return next((ot for ot in self.original_tools if ot.name == tool.name), None)
 
-        if result is None:  #! finecwg: if not result --> if result is None
-            try:
-                if calling.tool_name in [
-                    "Delegate work to coworker",
-                    "Ask question to coworker",
-                ]:
-                    self.task.increment_delegations()
-
-                if calling.arguments:
-                    try:
-                        acceptable_args = tool.args_schema.schema()["properties"].keys()  # type: ignore # Item "None" of "type[BaseModel] | None" has no attribute "schema"
-                        arguments = {
-                            k: v
-                            for k, v in calling.arguments.items()
-                            if k in acceptable_args
-                        }
-                        result = tool.invoke(input=arguments)
-                    except Exception:
-                        arguments = calling.arguments
-                        result = tool.invoke(input=arguments)
-                else:
-                    result = tool.invoke(input={})
-            except Exception as e:
-                self._run_attempts += 1
-                if self._run_attempts > self._max_parsing_attempts:
-                    error_message = self._i18n.errors("tool_usage_exception").format(
-                        error=e, tool=tool.name, tool_inputs=tool.description
-                    )
-                    error = ToolUsageErrorException(
-                        f'\n{error_message}.\nMoving on then. {self._i18n.slice("format").format(tool_names=self.tools_names)}'
-                    ).message
-                    self.task.increment_tools_errors()
-                    if self.agent.verbose:
-                        self._printer.print(
-                            content=f"\n\n{error_message}\n", color="red"
-                        )
-                    return error  # type: ignore # No return value expected
-
-                self.task.increment_tools_errors()
-                return self.use(calling=calling, tool_string=tool_string)  # type: ignore # No return value expected
+    def _track_delegation(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> None:
+        if calling.tool_name.casefold().strip() in DELEGATION_TOOL_NAMES:
+            self.task.increment_delegations()
+
+    def _validate_arguments(
+        self, tool: BaseTool, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Dict[str, Any]:
+        """Validate the arguments with the validator prebuilt for the tool."""
+        return tool_descriptor(tool).validate_arguments(calling.arguments or {})
+
+    def _tool_error(self, e: Exception, tool: BaseTool) -> Optional[str]:
+        """Record a failed invocation, returning the error once attempts are exhausted."""
+        self._run_attempts += 1
+        if self._run_attempts > self._max_parsing_attempts:
+            error_message = self._i18n.errors("tool_usage_exception").format(
+                error=e, tool=tool.name, tool_inputs=tool.description
+            )
+            error = ToolUsageErrorException(
+                f'\n{error_message}.\nMoving on then. {self._i18n.slice("format").format(tool_names=self.tools_names)}'
+            ).message
+            self.task.increment_tools_errors()
+            if self.agent.verbose:
+                self._printer.print(content=f"\n\n{error_message}\n", color="red")
+            return error
 
-            if self.tools_handler:
-                should_cache = True
-                if (
-                    hasattr(original_tool, "cache_function")
-                    and original_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                ):
-                    should_cache = original_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
-                        calling.arguments, result
-                    )
+        self.task.increment_tools_errors()
+        return None
 
-                self.tools_handler.on_tool_use(
-                    calling=calling, output=result, should_cache=should_cache
+    def _cache_result(
+        self,
+        tool: BaseTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        result: Any,
+    ) -> None:
+        if self.tools_handler:
+            original_tool = self._original_tool(tool)
+            should_cache = True
+            if (
+                hasattr(original_tool, "cache_function")
+                and original_tool.cache_function  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+            ):
+                should_cache = original_tool.cache_function(  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
+                    calling.arguments, result
                 )
 
+            self.tools_handler.on_tool_use(
+                calling=calling,
+                output=result,
+                should_cache=should_cache,
+                ttl=getattr(original_tool, "cache_ttl", None),
+            )
+
+    def _finish_usage(
+        self,
+        tool: BaseTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        result: Any,
+    ) -> str:
         if self.agent.verbose:
             self._printer.print(content=f"\n\n{result}\n", color="purple")
         result = self._format_result(result=result)  # type: ignore # "_format_result" of "ToolUsage" does not return a value (it only ever returns None)
@@ -206,6 +438,7 @@ class ToolUsage:
             "tool_args": calling.arguments,
         }
 
+        original_tool = self._original_tool(tool)
         if (
             hasattr(original_tool, "result_as_answer")
             and original_tool.result_as_answer  # type: ignore # Item "None" of "Any | None" has no attribute "cache_function"
@@ -218,13 +451,13 @@ class ToolUsage:
         return result  # type: ignore # No return value expected
 
     def _format_result(self, result: Any) -> None:
-        self.task.used_tools += 1
-        if self._should_remember_format():  # type: ignore # "_should_remember_format" of "ToolUsage" does not return a value (it only ever returns None)
+        used_tools = self.task.increment_used_tools()
+        if self._should_remember_format(used_tools):
             result = self._remember_format(result=result)  # type: ignore # "_remember_format" of "ToolUsage" does not return a value (it only ever returns None)
         return result
 
-    def _should_remember_format(self) -> None:
-        return self.task.used_tools % self._remember_format_after_usages == 0
+    def _should_remember_format(self, used_tools: int) -> bool:
+        return used_tools % self._remember_format_after_usages == 0
 
     def _remember_format(self, result: str) -> None:
         result = str(result)
@@ -244,22 +477,8 @@ class ToolUsage:
             )
 
     def _select_tool(self, tool_name: str) -> BaseTool:
-        order_tools = sorted(
-            self.tools,
-            key=lambda tool: SequenceMatcher(
-                None, tool.name.lower().strip(), tool_name.lower().strip()
-            ).ratio(),
-            reverse=True,
-        )
-        for tool in order_tools:
-            if (
-                tool.name.lower().strip() == tool_name.lower().strip()
-                or SequenceMatcher(
-                    None, tool.name.lower().strip(), tool_name.lower().strip()
-                ).ratio()
-                > 0.85
-            ):
-                return tool
+        if tool := self.tool_index.get(tool_name):
+            return tool
         self.task.increment_tools_errors()
         if tool_name and tool_name != "":
             raise Exception(
@@ -272,25 +491,12 @@ class ToolUsage:
 
     def _render(self) -> str:
         """Render the tool name and description in plain text."""
-        descriptions = []
-        for tool in self.tools:
-            args = {
-                k: {k2: v2 for k2, v2 in v.items() if k2 in ["description", "type"]}
-                for k, v in tool.args.items()
-            }
-            descriptions.append(
-                "\n".join(
-                    [
-                        f"Tool Name: {tool.name.lower()}",
-                        f"Tool Description: {tool.description}",
-                        f"Tool Arguments: {args}",
-                    ]
-                )
-            )
-        return "\n--\n".join(descriptions)
+        return "\n--\n".join(
+            tool_descriptor(tool).function_calling_text for tool in self.tools
+        )
 
     def _is_llama(self, llm) -> bool:
-        return isinstance(llm, ChatGroq) and llm.groq_api_base is None
+        return is_llama(llm)
 
     def _tool_calling(
         self, tool_string: str
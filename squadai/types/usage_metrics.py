@@ -10,6 +10,13 @@ class UsageMetrics(BaseModel):
         prompt_tokens: Number of tokens used in prompts.
         completion_tokens: Number of tokens used in completions.
         successful_requests: Number of successful requests made.
+        cache_hits: Number of LLM calls answered by the LLM response cache.
+        cache_misses: Number of LLM calls the LLM response cache could not answer.
+        total_latency: Seconds spent waiting for LLM calls.
+        average_latency: Average seconds of one LLM call.
+        tokens_per_second: Completion tokens generated per second of LLM call time.
+        throttled_seconds: Seconds spent waiting for the rate limits.
+        throttled_requests: Number of LLM calls that had to wait for the rate limits.
     """
 
     total_tokens: int = Field(default=0, description="Total number of tokens used.")
@@ -22,6 +29,31 @@ class UsageMetrics(BaseModel):
     successful_requests: int = Field(
         default=0, description="Number of successful requests made."
     )
+    cache_hits: int = Field(
+        default=0, description="Number of LLM calls answered by the response cache."
+    )
+    cache_misses: int = Field(
+        default=0,
+        description="Number of LLM calls the response cache could not answer.",
+    )
+    total_latency: float = Field(
+        default=0.0, description="Seconds spent waiting for LLM calls."
+    )
+    average_latency: float = Field(
+        default=0.0, description="Average seconds of one LLM call."
+    )
+    tokens_per_second: float = Field(
+        default=0.0,
+        description="Completion tokens generated per second of LLM call time.",
+    )
+
+    throttled_seconds: float = Field(
+        default=0.0, description="Seconds spent waiting for the rate limits."
+    )
+    throttled_requests: int = Field(
+        default=0,
+        description="Number of LLM calls that had to wait for the rate limits.",
+    )
 
     def add_usage_metrics(self, usage_metrics: "UsageMetrics"):
         """
@@ -34,3 +66,20 @@ class UsageMetrics(BaseModel):
         self.prompt_tokens += usage_metrics.prompt_tokens
         self.completion_tokens += usage_metrics.completion_tokens
         self.successful_requests += usage_metrics.successful_requests
+        self.cache_hits += usage_metrics.cache_hits
+        self.cache_misses += usage_metrics.cache_misses
+        self.total_latency += usage_metrics.total_latency
+        self.throttled_seconds += usage_metrics.throttled_seconds
+        self.throttled_requests += usage_metrics.throttled_requests
+        self.compute_rates()
+
+    def compute_rates(self) -> None:
+        """Derive the average latency and throughput from the summed counters."""
+        self.average_latency = (
+            self.total_latency / self.successful_requests
+            if self.successful_requests
+            else 0.0
+        )
+        self.tokens_per_second = (
+            self.completion_tokens / self.total_latency if self.total_latency else 0.0
+        )
@@ -1,15 +1,51 @@
-from .converter import Converter, ConverterError
-from .file_handler import FileHandler
-from .i18n import I18N
-from .instructor import Instructor
-from .logger import Logger
-from .parser import YamlParser
-from .printer import Printer
-from .prompts import Prompts
-from .rpm_controller import RPMController
-from .exceptions.context_window_exceeding_exception import (
-    LLMContextLengthExceededException,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .converter import Converter, ConverterError
+    from .file_handler import FileHandler
+    from .i18n import I18N
+    from .instructor import Instructor
+    from .logger import Logger
+    from .parser import YamlParser
+    from .printer import Printer
+    from .prompts import Prompts
+    from .rpm_controller import RPMController
+    from .task_executor import TaskExecutor
+    from .exceptions.context_window_exceeding_exception import (
+        LLMContextLengthExceededException,
+    )
+
+# Helpers are imported on first access (PEP 562). The converter pulls in
+# squadai.agents, whose modules import the other helpers from this package, so
+# loading everything eagerly breaks when this package is the first one imported.
+_LAZY_IMPORTS = {
+    "Converter": ".converter",
+    "ConverterError": ".converter",
+    "FileHandler": ".file_handler",
+    "I18N": ".i18n",
+    "Instructor": ".instructor",
+    "Logger": ".logger",
+    "Printer": ".printer",
+    "Prompts": ".prompts",
+    "RPMController": ".rpm_controller",
+    "TaskExecutor": ".task_executor",
+    "YamlParser": ".parser",
+    "LLMContextLengthExceededException": ".exceptions.context_window_exceeding_exception",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     "Converter",
@@ -21,6 +57,7 @@ __all__ = [
     "Printer",
     "Prompts",
     "RPMController",
+    "TaskExecutor",
     "YamlParser",
     "LLMContextLengthExceededException",
 ]
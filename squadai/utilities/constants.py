@@ -1,2 +1,3 @@
 TRAINING_DATA_FILE = "training_data.pkl"
 TRAINED_AGENTS_DATA_FILE = "trained_agents_data.pkl"
+MAX_CACHED_AGENT_EXECUTORS = 8
@@ -1,9 +1,9 @@
 import json
 import re
+import sys
 from typing import Any, Optional, Type, Union
 
 from langchain.schema import HumanMessage, SystemMessage
-from langchain_groq import ChatGroq
 from pydantic import BaseModel, ValidationError
 
 from squadai.agents.agent_builder.utilities.base_output_converter import OutputConverter
@@ -76,7 +76,7 @@ class Converter(OutputConverter):
     @property
     def is_llama(self) -> bool:
         """Return if llm provided is of llama from groq."""
-        return isinstance(self.llm, ChatGroq) and self.llm.groq_api_base is None
+        return is_llama(self.llm)
 
 
 def convert_to_model(
@@ -201,10 +201,15 @@ def get_conversion_instructions(model: Type[BaseModel], llm: Any) -> str:
     return instructions
 
 
-def is_llama(llm: Any) -> bool:
-    from langchain_groq import ChatGroq
+def is_chat_groq(llm: Any) -> bool:
+    """Return if llm is a ChatGroq, without importing langchain_groq to find out."""
+    # No ChatGroq exists before langchain_groq is imported
+    langchain_groq = sys.modules.get("langchain_groq")
+    return langchain_groq is not None and isinstance(llm, langchain_groq.ChatGroq)
+
 
-    return isinstance(llm, ChatGroq) and llm.groq_api_base is None
+def is_llama(llm: Any) -> bool:
+    return is_chat_groq(llm) and llm.groq_api_base is None
 
 
 def create_converter(
@@ -1,11 +1,12 @@
 from collections import defaultdict
+from typing import Optional
 
-from langchain_groq import ChatGroq
 from pydantic import BaseModel, Field
 from rich.console import Console
 from rich.table import Table
 
 from squadai.agent import Agent
+from squadai.llm_pool import default_llm
 from squadai.task import Task
 from squadai.tasks.task_output import TaskOutput
 
@@ -22,7 +23,7 @@ class SquadEvaluator:
 
     Attributes:
         squad (Squad): The squad of agents to evaluate.
-        groq_model_name (str): The model to use for evaluating the performance of the agents (for now ONLY Groq accepted).
+        groq_model_name (str): The model to use for evaluating the performance of the agents (for now ONLY Groq accepted), defaults to GROQ_EVALUATOR_MODEL_NAME or the default LLM.
         tasks_scores (defaultdict): A dictionary to store the scores of the agents for each task.
         iteration (int): The current iteration of the evaluation.
     """
@@ -31,7 +32,7 @@ class SquadEvaluator:
     run_execution_times: defaultdict = defaultdict(list)
     iteration: int = 0
 
-    def __init__(self, squad, openai_model_name: str):
+    def __init__(self, squad, groq_model_name: Optional[str] = None):
         self.squad = squad
         self.groq_model_name = groq_model_name
         self._setup_for_evaluating()
@@ -42,6 +43,8 @@ class SquadEvaluator:
             task.callback = self.evaluate
 
     def _evaluator_agent(self):
+        from langchain_groq import ChatGroq
+
         return Agent(
             role="Task Execution Evaluator",
             goal=(
@@ -49,7 +52,11 @@ class SquadEvaluator:
             ),
             backstory="Evaluator agent for squad evaluation with precise capabilities to evaluate the performance of the agents in the squad based on the tasks they have performed",
             verbose=False,
-            llm=ChatGroq(model=self.groq_model_name),
+            llm=(
+                ChatGroq(model=self.groq_model_name)
+                if self.groq_model_name
+                else default_llm("evaluator")
+            ),
         )
 
     def _evaluation_task(
@@ -1,10 +1,10 @@
 import os
-from typing import List
+from typing import Any, List, Tuple, Union
 
-from langchain_groq import ChatGroq
 from pydantic import BaseModel, Field
 
-from squadai.utilities import Converter
+from squadai.utilities import Converter, ConverterError
+from squadai.utilities.converter import is_llama
 from squadai.utilities.pydantic_schema_parser import PydanticSchemaParser
 
 
@@ -39,6 +39,12 @@ class TaskEvaluation(BaseModel):
     )
 
 
+class TaskEvaluations(BaseModel):
+    evaluations: List[TaskEvaluation] = Field(
+        description="One evaluation per task, in the order the tasks are given."
+    )
+
+
 class TrainingTaskEvaluation(BaseModel):
     suggestions: List[str] = Field(
         description="Based on the Human Feedbacks and the comparison between Initial Outputs and Improved outputs provide action items based on human_feedback for future tasks."
@@ -54,7 +60,11 @@ class TrainingTaskEvaluation(BaseModel):
 @track_agent(name="Task Evaluator")
 class TaskEvaluator:
     def __init__(self, original_agent):
+        from squadai.llm_pool import LLMPool
+
         self.llm = original_agent.llm
+        if isinstance(self.llm, LLMPool):
+            self.llm = self.llm.for_role("evaluator")
 
     def evaluate(self, task, output) -> TaskEvaluation:
         evaluation_query = (
@@ -83,8 +93,56 @@ class TaskEvaluator:
 
         return converter.to_pydantic()
 
+    def evaluate_many(
+        self, tasks_outputs: List[Tuple[Any, str]]
+    ) -> List[Union[TaskEvaluation, ConverterError]]:
+        """Evaluate several tasks with one LLM call.
+
+        Falls back to evaluating the tasks one by one when the answer does not
+        hold one evaluation per task.
+        """
+        if len(tasks_outputs) == 1:
+            task, output = tasks_outputs[0]
+            return [self.evaluate(task, output)]
+
+        tasks = "\n\n".join(
+            f"Task {index}:\n"
+            f"Task Description:\n{task.description}\n\n"
+            f"Expected Output:\n{task.expected_output}\n\n"
+            f"Actual Output:\n{output}"
+            for index, (task, output) in enumerate(tasks_outputs, start=1)
+        )
+        evaluation_query = (
+            f"Assess the quality of each of the {len(tasks_outputs)} tasks completed below based on its description, expected output, and actual results.\n\n"
+            f"{tasks}\n\n"
+            "Please provide, for each task and in the same order:\n"
+            "- Bullet points suggestions to improve future similar tasks\n"
+            "- A score from 0 to 10 evaluating on completion, quality, and overall performance"
+            "- Entities extracted from the task output, if any, their type, description, and relationships"
+        )
+
+        instructions = "Convert all responses into valid JSON output."
+
+        if not self._is_llama(self.llm):
+            model_schema = PydanticSchemaParser(model=TaskEvaluations).get_schema()
+            instructions = f"{instructions}\n\nReturn only valid JSON with the following schema:\n```json\n{model_schema}\n```"
+
+        converter = Converter(
+            llm=self.llm,
+            text=evaluation_query,
+            model=TaskEvaluations,
+            instructions=instructions,
+        )
+
+        result = converter.to_pydantic()
+        if isinstance(result, TaskEvaluations) and len(result.evaluations) == len(
+            tasks_outputs
+        ):
+            return list(result.evaluations)
+        return [self.evaluate(task, output) for task, output in tasks_outputs]
+
     def _is_llama(self, llm) -> bool:
-        return isinstance(llm, ChatGroq) and llm.groq_api_base is None
+        return is_llama(llm)
 
     def evaluate_training_data(
         self, training_data: dict, agent_id: str
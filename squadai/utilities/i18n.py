@@ -1,12 +1,93 @@
 import json
 import os
-from typing import Dict, Optional
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
+from langchain.prompts import PromptTemplate
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
+DEFAULT_PROMPT_FILE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "../translations/en.json"
+)
+
+
+class PromptCatalog:
+    """Read-only prompts of a prompt file, shared by every I18N using that file.
+
+    Catalogs are interned per file path by `load_prompt_catalog`, so a prompt file
+    is read and parsed once per process. Prompt templates built from the catalog
+    are compiled once and reused as well.
+    """
+
+    def __init__(self, path: str, prompts: Mapping[str, Any]) -> None:
+        self.path = path
+        self.prompts: Mapping[str, Mapping[str, str]] = MappingProxyType(
+            {
+                kind: MappingProxyType(dict(entries))
+                for kind, entries in prompts.items()
+                if isinstance(entries, dict)
+            }
+        )
+        self._templates: Dict[str, PromptTemplate] = {}
+        self._lock = threading.Lock()
+
+    def retrieve(self, kind: str, key: str) -> str:
+        return self.prompts[kind][key]
+
+    def prompt_template(self, template: str) -> PromptTemplate:
+        """Return the compiled PromptTemplate of a template string."""
+        if (prompt := self._templates.get(template)) is None:
+            prompt = PromptTemplate.from_template(template)
+            with self._lock:
+                prompt = self._templates.setdefault(template, prompt)
+        return prompt
+
+    def __copy__(self) -> "PromptCatalog":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "PromptCatalog":
+        return self
+
+    def __reduce__(self) -> Any:
+        # Other processes intern the catalog of the same file on their side
+        return (load_prompt_catalog, (self.path,))
+
+
+_catalogs: Dict[str, PromptCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def load_prompt_catalog(prompt_file: Optional[str] = None) -> PromptCatalog:
+    """Return the catalog of a prompt file, loading it on first use.
+
+    Args:
+        prompt_file: Path to the prompt file, defaults to the bundled english prompts.
+
+    Returns:
+        The catalog shared by every caller using the same file.
+    """
+    path = os.path.realpath(prompt_file or DEFAULT_PROMPT_FILE)
+    if (catalog := _catalogs.get(path)) is not None:
+        return catalog
+
+    with _catalogs_lock:
+        if (catalog := _catalogs.get(path)) is None:
+            try:
+                with open(path, "r") as f:
+                    prompts = json.load(f)
+            except FileNotFoundError:
+                raise Exception(f"Prompt file '{prompt_file}' not found.")
+            except json.JSONDecodeError:
+                raise Exception("Error decoding JSON from the prompts file.")
+
+            catalog = PromptCatalog(path, prompts or {})
+            _catalogs[path] = catalog
+    return catalog
+
 
 class I18N(BaseModel):
-    _prompts: Dict[str, Dict[str, str]] = PrivateAttr()
+    _prompts: PromptCatalog = PrivateAttr()
     prompt_file: Optional[str] = Field(
         default=None,
         description="Path to the prompt_file file to load",
@@ -14,25 +95,8 @@ class I18N(BaseModel):
 
     @model_validator(mode="after")
     def load_prompts(self) -> "I18N":
-        """Load prompts from a JSON file."""
-        try:
-            if self.prompt_file:
-                with open(self.prompt_file, "r") as f:
-                    self._prompts = json.load(f)
-            else:
-                dir_path = os.path.dirname(os.path.realpath(__file__))
-                prompts_path = os.path.join(dir_path, "../translations/en.json")
-
-                with open(prompts_path, "r") as f:
-                    self._prompts = json.load(f)
-        except FileNotFoundError:
-            raise Exception(f"Prompt file '{self.prompt_file}' not found.")
-        except json.JSONDecodeError:
-            raise Exception("Error decoding JSON from the prompts file.")
-
-        if not self._prompts:
-            self._prompts = {}
-
+        """Load prompts from the shared catalog of the prompt file."""
+        self._prompts = load_prompt_catalog(self.prompt_file)
         return self
 
     def slice(self, slice: str) -> str:
@@ -46,6 +110,24 @@ class I18N(BaseModel):
 
     def retrieve(self, kind, key) -> str:
         try:
-            return self._prompts[kind][key]
+            return self._prompts.retrieve(kind, key)
         except Exception as _:
             raise Exception(f"Prompt for '{kind}':'{key}'  not found.")
+
+    def prompt_template(self, template: str) -> PromptTemplate:
+        """Return the precompiled PromptTemplate of a template string."""
+        return self._prompts.prompt_template(template)
+
+
+_shared_i18n: Dict[Optional[str], I18N] = {}
+
+
+def shared_i18n(prompt_file: Optional[str] = None) -> I18N:
+    """Return the process-wide I18N of a prompt file.
+
+    Reusing one instance keeps objects keyed by the I18N identity, like the
+    cached agent executors, warm across kickoffs.
+    """
+    if (i18n := _shared_i18n.get(prompt_file)) is None:
+        i18n = _shared_i18n.setdefault(prompt_file, I18N(prompt_file=prompt_file))
+    return i18n
@@ -0,0 +1,123 @@
+"""Import-time benchmark guarding the lazy imports of `squadai`.
+
+Each target is imported in a fresh interpreter, several times, and the median
+wall time is compared to its budget. A target is a module, or `module:name` for
+`from module import name`. The heavy backends that must stay lazy
+are checked as well, which catches regressions independently of the machine.
+
+Usage:
+    python -m squadai.utilities.import_benchmark [--runs N] [--budget SECONDS]
+
+The command exits with status 1 when a target goes over its budget or loads a
+heavy backend eagerly.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Imports that must stay cheap, with their budget in seconds
+IMPORT_BUDGETS: Dict[str, float] = {
+    "squadai": 0.5,
+    "squadai.squadai_tools": 0.5,
+    "squadai:Squad": 1.5,
+    "squadai:Agent": 1.5,
+}
+
+# Backends only loaded once the feature needing them is used
+LAZY_BACKENDS: List[str] = [
+    "chromadb",
+    "docker",
+    "embedchain",
+    "instructor",
+    "lancedb",
+    "langchain",
+    "langchain_groq",
+    "openai",
+    "opentelemetry",
+    "selenium",
+    "tiktoken",
+]
+
+# Lazy backends a target cannot do without
+REQUIRED_BACKENDS: Dict[str, List[str]] = {
+    "squadai:Squad": ["langchain"],
+    "squadai:Agent": ["langchain"],
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import(module: str, runs: int = 5) -> Tuple[float, List[str]]:
+    """Import a module, or a name from it, in fresh interpreters.
+
+    Args:
+        module: Dotted name of the module to import, or `module:name`.
+        runs: Number of interpreters to start.
+
+    Returns:
+        The median import time in seconds and the lazy backends it loaded
+        beyond the ones it requires.
+    """
+    if ":" in module:
+        package, name = module.split(":", 1)
+        statement = f"from {package} import {name}"
+    else:
+        statement = f"import {module}"
+    required = REQUIRED_BACKENDS.get(module, [])
+    timings = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(probe["elapsed"])
+        loaded = [
+            backend
+            for backend in LAZY_BACKENDS
+            if backend in probe["modules"] and backend not in required
+        ]
+    return statistics.median(timings), loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="Budget in seconds applied to every target instead of the defaults.",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for module, budget in IMPORT_BUDGETS.items():
+        budget = args.budget if args.budget is not None else budget
+        elapsed, loaded = measure_import(module, runs=args.runs)
+        status = "ok"
+        if elapsed > budget or loaded:
+            status = "FAIL"
+            failed = True
+        print(f"{status:4} {module}: {elapsed:.3f}s (budget {budget:.3f}s)")
+        if loaded:
+            print(f"     eagerly loaded: {', '.join(loaded)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
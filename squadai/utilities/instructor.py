@@ -1,6 +1,5 @@
 from typing import Any, Optional, Type
 
-import instructor
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
@@ -26,6 +25,8 @@ class Instructor(BaseModel):
     @model_validator(mode="after")
     def set_instructor(self):
         """Set instructor."""
+        import instructor
+
         if self.agent and not self.llm:
             self.llm = self.agent.function_calling_llm or self.agent.llm
 
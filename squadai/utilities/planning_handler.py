@@ -1,11 +1,10 @@
-import os
 from typing import Any, List, Optional
 
-from langchain_groq import ChatGroq
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
 from squadai.agent import Agent
+from squadai.llm_pool import default_llm
 from squadai.task import Task
 
 load_dotenv()
@@ -30,7 +29,7 @@ class SquadPlanner:
         self.tasks = tasks
 
         if planning_agent_llm is None:
-            self.planning_agent_llm = ChatGroq(model=os.getenv("GROQ_MODEL_NAME"))
+            self.planning_agent_llm = default_llm("planner")
         else:
             self.planning_agent_llm = planning_agent_llm
 
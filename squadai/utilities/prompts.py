@@ -1,6 +1,6 @@
 from typing import Any, ClassVar, Optional
 
-from langchain.prompts import BasePromptTemplate, PromptTemplate
+from langchain.prompts import BasePromptTemplate
 from pydantic import BaseModel, Field
 
 from squadai.utilities import I18N
@@ -47,7 +47,7 @@ class Prompts(BaseModel):
         if not system_template and not prompt_template:
             prompt_parts = [self.i18n.slice(component) for component in components]
             prompt_parts.append(self.SCRATCHPAD_SLICE)
-            prompt = PromptTemplate.from_template("".join(prompt_parts))
+            prompt = self.i18n.prompt_template("".join(prompt_parts))
         else:
             prompt_parts = [
                 self.i18n.slice(component)
@@ -60,5 +60,5 @@ class Prompts(BaseModel):
                 "".join([self.i18n.slice("task"), self.SCRATCHPAD_SLICE]),
             )
             response = response_template.split("{{ .Response }}")[0]
-            prompt = PromptTemplate.from_template(f"{system}\n{prompt}\n{response}")
+            prompt = self.i18n.prompt_template(f"{system}\n{prompt}\n{response}")
         return prompt
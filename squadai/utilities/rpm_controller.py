@@ -1,6 +1,8 @@
+import asyncio
 import threading
 import time
-from typing import Optional
+from collections import deque
+from typing import Callable, ClassVar, Deque, Optional
 
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
@@ -8,66 +10,217 @@ from squadai.utilities.logger import Logger
 
 
 class RPMController(BaseModel):
+    """Token-bucket limiter for the requests and tokens sent per minute.
+
+    Both buckets refill continuously, so capacity frees up as soon as the rate
+    allows instead of at the start of the next minute. Waiting callers are
+    served in arrival order, whether they block a thread or an event loop.
+    Token usage is only known once a response arrives, so it is recorded after
+    each call and a bucket in debt holds back the next requests. Limits
+    reported by the provider pause or shrink the buckets even when no limit
+    is configured.
+    """
+
+    POLL_INTERVAL: ClassVar[float] = 0.05
+
     max_rpm: Optional[int] = Field(default=None)
+    max_tpm: Optional[int] = Field(default=None)
     logger: Logger = Field(default_factory=lambda: Logger(verbose=False))
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: Optional[threading.Timer] = PrivateAttr(default=None)
-    _lock: Optional[threading.Lock] = PrivateAttr(default=None)
-    _shutdown_flag: bool = PrivateAttr(default=False)
+    _condition: threading.Condition = PrivateAttr(default_factory=threading.Condition)
+    _requests: float = PrivateAttr(default=0.0)
+    _tokens: float = PrivateAttr(default=0.0)
+    _updated: float = PrivateAttr(default_factory=time.monotonic)
+    _paused_until: float = PrivateAttr(default=0.0)
+    _waiters: Deque[object] = PrivateAttr(default_factory=deque)
+    _throttled_seconds: float = PrivateAttr(default=0.0)
+    _throttled_requests: int = PrivateAttr(default=0)
 
     @model_validator(mode="after")
     def reset_counter(self):
-        if self.max_rpm is not None:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
+        self._requests = float(self.max_rpm or 0)
+        self._tokens = float(self.max_tpm or 0)
+        self._updated = time.monotonic()
         return self
 
-    def check_or_wait(self):
-        if self.max_rpm is None:
+    @property
+    def throttled_seconds(self) -> float:
+        """Total time callers spent waiting for capacity."""
+        return self._throttled_seconds
+
+    @property
+    def throttled_requests(self) -> int:
+        """Number of requests that had to wait for capacity."""
+        return self._throttled_requests
+
+    def capacity(self) -> float:
+        """Share of the buckets available right now, 0 while paused and 1 when unlimited."""
+        with self._condition:
+            self._refill()
+            if self._paused_until > time.monotonic():
+                return 0.0
+            shares = [1.0]
+            if self.max_rpm:
+                shares.append(max(self._requests, 0.0) / self.max_rpm)
+            if self.max_tpm:
+                shares.append(max(self._tokens, 0.0) / self.max_tpm)
+            return min(shares)
+
+    def check_or_wait(
+        self,
+        tokens: int = 0,
+        on_throttled: Optional[Callable[[float], None]] = None,
+    ) -> bool:
+        """Block until a request, and the given number of tokens, can be sent.
+
+        Args:
+            tokens: Tokens the request is expected to use.
+            on_throttled: Called with the seconds waited when the request had to wait.
+        """
+        if not self._limited():
             return True
 
-        def _check_and_increment():
-            if self.max_rpm is not None and self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            elif self.max_rpm is not None:
-                self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
-                )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
+        ticket = object()
+        started: Optional[float] = None
+        with self._condition:
+            self._waiters.append(ticket)
+            try:
+                while (delay := self._try_acquire(ticket, tokens)) != 0:
+                    if started is None:
+                        started = self._throttle_started(delay)
+                    self._condition.wait(timeout=delay)
+            finally:
+                self._release(ticket, started, on_throttled)
+        return True
+
+    async def acheck_or_wait(
+        self,
+        tokens: int = 0,
+        on_throttled: Optional[Callable[[float], None]] = None,
+    ) -> bool:
+        """Wait for capacity like check_or_wait without blocking the event loop."""
+        if not self._limited():
             return True
 
-        if self._lock:
-            with self._lock:
-                return _check_and_increment()
-        else:
-            return _check_and_increment()
+        ticket = object()
+        started: Optional[float] = None
+        with self._condition:
+            self._waiters.append(ticket)
+        try:
+            while True:
+                with self._condition:
+                    delay = self._try_acquire(ticket, tokens)
+                if delay == 0:
+                    break
+                if started is None:
+                    started = self._throttle_started(delay)
+                await asyncio.sleep(self.POLL_INTERVAL if delay is None else delay)
+        finally:
+            with self._condition:
+                self._release(ticket, started, on_throttled)
+        return True
+
+    def record_tokens(self, tokens: int) -> None:
+        """Take the tokens used by a finished request out of the tokens bucket."""
+        if self.max_tpm is None or tokens <= 0:
+            return
+        with self._condition:
+            self._refill()
+            self._tokens -= tokens
+
+    def apply_rate_limits(
+        self,
+        pause: Optional[float] = None,
+        remaining_requests: Optional[int] = None,
+        remaining_tokens: Optional[int] = None,
+    ) -> None:
+        """Apply the limits reported by the provider.
+
+        Args:
+            pause: Seconds no request may be sent, for a 429 or an exhausted quota.
+            remaining_requests: Requests left at the provider, caps the requests bucket.
+            remaining_tokens: Tokens left at the provider, caps the tokens bucket.
+        """
+        with self._condition:
+            self._refill()
+            if pause:
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            if remaining_requests is not None and self.max_rpm is not None:
+                self._requests = min(self._requests, float(remaining_requests))
+            if remaining_tokens is not None and self.max_tpm is not None:
+                self._tokens = min(self._tokens, float(remaining_tokens))
 
     def stop_rpm_counter(self):
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _wait_for_next_minute(self):
-        time.sleep(60)
-        self._current_rpm = 0
-
-    def _reset_request_count(self):
-        def _reset():
-            self._current_rpm = 0
-            if not self._shutdown_flag:
-                self._timer = threading.Timer(60.0, self._reset_request_count)
-                self._timer.start()
-
-        if self._lock:
-            with self._lock:
-                _reset()
-        else:
-            _reset()
-
-        if self._timer:
-            self._shutdown_flag = True
-            self._timer.cancel()
+        """Wake every waiter so they recheck the buckets, no timer is left running."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def _limited(self) -> bool:
+        return (
+            self.max_rpm is not None
+            or self.max_tpm is not None
+            or self._paused_until > time.monotonic()
+        )
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.max_rpm is not None:
+            self._requests = min(
+                float(self.max_rpm), self._requests + elapsed * self.max_rpm / 60
+            )
+        if self.max_tpm is not None:
+            self._tokens = min(
+                float(self.max_tpm), self._tokens + elapsed * self.max_tpm / 60
+            )
+
+    def _try_acquire(self, ticket: object, tokens: int) -> Optional[float]:
+        """Take capacity for the ticket if it is first in line.
+
+        Returns:
+            0 once acquired, the seconds until capacity is available for the
+            first ticket in line, or None for the tickets behind it.
+        """
+        if self._waiters[0] is not ticket:
+            return None
+
+        self._refill()
+        delay = max(self._paused_until - time.monotonic(), 0.0)
+        if self.max_rpm is not None and self._requests < 1:
+            delay = max(delay, (1 - self._requests) * 60 / self.max_rpm)
+        if self.max_tpm is not None:
+            needed = max(min(tokens, self.max_tpm), 1)
+            if self._tokens < needed:
+                delay = max(delay, (needed - self._tokens) * 60 / self.max_tpm)
+        if delay > 0:
+            return delay
+
+        if self.max_rpm is not None:
+            self._requests -= 1
+        if self.max_tpm is not None:
+            self._tokens -= tokens
+        return 0
+
+    def _throttle_started(self, delay: Optional[float]) -> float:
+        if delay is not None:
+            self.logger.log(
+                "info", f"Rate limit reached, waiting {delay:.1f}s for capacity."
+            )
+        return time.monotonic()
+
+    def _release(
+        self,
+        ticket: object,
+        started: Optional[float],
+        on_throttled: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        """Leave the line and let the next waiter check the buckets."""
+        if ticket in self._waiters:
+            self._waiters.remove(ticket)
+        if started is not None:
+            waited = time.monotonic() - started
+            self._throttled_seconds += waited
+            self._throttled_requests += 1
+            if on_throttled:
+                on_throttled(waited)
+        self._condition.notify_all()
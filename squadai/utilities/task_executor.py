@@ -0,0 +1,237 @@
+import os
+import threading
+from contextvars import ContextVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, Field
+
+
+class TaskExecutorSaturatedError(Exception):
+    """Exception raised when the task executor queue is full."""
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+class TaskExecutorStats(BaseModel):
+    """
+    Snapshot of the task executor usage.
+
+    Attributes:
+        max_workers: Number of worker threads of the pool.
+        max_queue_size: Number of submissions allowed to wait for a worker, None means unbounded.
+        active: Number of submissions currently running.
+        queued: Number of submissions waiting for a worker.
+        peak_active: Highest number of submissions that ran at the same time.
+        submitted: Total number of accepted submissions.
+        completed: Number of submissions that finished successfully.
+        failed: Number of submissions that raised an exception.
+        cancelled: Number of submissions cancelled before running.
+        rejected: Number of submissions refused because the queue was full.
+    """
+
+    max_workers: int = Field(description="Number of worker threads of the pool.")
+    max_queue_size: Optional[int] = Field(
+        default=None,
+        description="Number of submissions allowed to wait for a worker, None means unbounded.",
+    )
+    active: int = Field(default=0, description="Submissions currently running.")
+    queued: int = Field(default=0, description="Submissions waiting for a worker.")
+    peak_active: int = Field(
+        default=0, description="Highest number of submissions running at once."
+    )
+    submitted: int = Field(default=0, description="Total accepted submissions.")
+    completed: int = Field(default=0, description="Submissions finished successfully.")
+    failed: int = Field(default=0, description="Submissions that raised an exception.")
+    cancelled: int = Field(default=0, description="Submissions cancelled before running.")
+    rejected: int = Field(default=0, description="Submissions refused on a full queue.")
+
+    @property
+    def saturation(self) -> float:
+        """Ratio of busy workers, 1.0 means every worker is running a submission."""
+        return self.active / self.max_workers if self.max_workers else 0.0
+
+
+class TaskExecutor:
+    """Bounded worker pool used to run asynchronous task executions.
+
+    Instead of starting a raw thread for every asynchronous task, submissions are
+    queued on a fixed number of reusable worker threads. The returned `Future`
+    can be cancelled while the submission is still waiting for a worker.
+
+    Attributes:
+        max_workers: Number of worker threads, defaults to SQUADAI_MAX_ASYNC_WORKERS or the thread pool default.
+        max_queue_size: Number of submissions allowed to wait for a worker, defaults to SQUADAI_MAX_ASYNC_QUEUE or unbounded.
+        thread_name_prefix: Prefix of the worker thread names.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        thread_name_prefix: str = "squadai-task",
+    ) -> None:
+        if max_workers is None and os.environ.get("SQUADAI_MAX_ASYNC_WORKERS"):
+            max_workers = int(os.environ["SQUADAI_MAX_ASYNC_WORKERS"])
+        if max_queue_size is None and os.environ.get("SQUADAI_MAX_ASYNC_QUEUE"):
+            max_queue_size = int(os.environ["SQUADAI_MAX_ASYNC_QUEUE"])
+
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_queue_size = max_queue_size
+        self.thread_name_prefix = thread_name_prefix
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._slots = (
+            threading.BoundedSemaphore(self.max_workers + max_queue_size)
+            if max_queue_size is not None
+            else None
+        )
+        self._lock = threading.Lock()
+        self._stats = TaskExecutorStats(
+            max_workers=self.max_workers, max_queue_size=self.max_queue_size
+        )
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """Submit a callable to the pool.
+
+        Args:
+            fn: Callable to run on a worker thread.
+            block: Whether to wait for a free queue slot when the queue is full.
+            timeout: Maximum time to wait for a free queue slot.
+
+        Returns:
+            Future holding the result of the callable.
+        """
+        if self._slots and not self._slots.acquire(blocking=block, timeout=timeout):
+            with self._lock:
+                self._stats.rejected += 1
+            raise TaskExecutorSaturatedError(
+                f"Task executor queue is full ({self.max_queue_size} waiting submissions)."
+            )
+
+        with self._lock:
+            self._stats.submitted += 1
+            self._stats.queued += 1
+
+        try:
+            future = self._executor.submit(self._run, fn, *args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._stats.submitted -= 1
+                self._stats.queued -= 1
+            if self._slots:
+                self._slots.release()
+            raise
+
+        future.add_done_callback(self._on_done)
+        return future
+
+    def stats(self) -> TaskExecutorStats:
+        """Return a snapshot of the pool usage."""
+        with self._lock:
+            return self._stats.model_copy()
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Stop accepting submissions and release the worker threads."""
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            self._stats.queued -= 1
+            self._stats.active += 1
+            self._stats.peak_active = max(
+                self._stats.peak_active, self._stats.active
+            )
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._stats.active -= 1
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            if future.cancelled():
+                self._stats.queued -= 1
+                self._stats.cancelled += 1
+            elif future.exception() is not None:
+                self._stats.failed += 1
+            else:
+                self._stats.completed += 1
+        if self._slots:
+            self._slots.release()
+
+
+_default_task_executor: Optional[TaskExecutor] = None
+_default_task_executor_lock = threading.Lock()
+
+
+def default_task_executor() -> TaskExecutor:
+    """Return the process-wide task executor, creating it on first use."""
+    global _default_task_executor
+    with _default_task_executor_lock:
+        if _default_task_executor is None:
+            _default_task_executor = TaskExecutor()
+        return _default_task_executor
+
+
+_default_tool_executor: Optional[TaskExecutor] = None
+_default_tool_executor_lock = threading.Lock()
+
+# Identifier of the tool call running in the current context, set for the calls
+# that have a timeout so a tool can release the resources of that call only
+current_tool_call: ContextVar[Optional[str]] = ContextVar(
+    "current_tool_call", default=None
+)
+
+
+def default_tool_executor() -> TaskExecutor:
+    """Return the process-wide pool running tool calls that have a timeout.
+
+    Its size defaults to SQUADAI_TOOL_WORKERS or 32 and its queue to
+    SQUADAI_TOOL_QUEUE or 64 waiting calls. It is separate from the task executor
+    so tools timing out cannot starve the asynchronous tasks. Calls stuck past
+    their timeout keep their worker, so callers submit without blocking and
+    treat a full pool as a timeout.
+    """
+    global _default_tool_executor
+    with _default_tool_executor_lock:
+        if _default_tool_executor is None:
+            _default_tool_executor = TaskExecutor(
+                max_workers=int(os.environ.get("SQUADAI_TOOL_WORKERS", 32)),
+                max_queue_size=int(os.environ.get("SQUADAI_TOOL_QUEUE", 64)),
+                thread_name_prefix="squadai-tool-call",
+            )
+        return _default_tool_executor
+
+
+_default_action_executor: Optional[TaskExecutor] = None
+_default_action_executor_lock = threading.Lock()
+
+
+def default_action_executor() -> TaskExecutor:
+    """Return the process-wide pool running the parallel tool actions of agent steps.
+
+    Its size defaults to SQUADAI_ACTION_WORKERS or 16 and it has no queue: when
+    every worker is busy, callers run the action on their own thread instead.
+    It is separate from the tool pool, which the actions submit their tool
+    calls to, so actions never wait on calls queued behind themselves.
+    """
+    global _default_action_executor
+    with _default_action_executor_lock:
+        if _default_action_executor is None:
+            _default_action_executor = TaskExecutor(
+                max_workers=int(os.environ.get("SQUADAI_ACTION_WORKERS", 16)),
+                max_queue_size=0,
+                thread_name_prefix="squadai-tool",
+            )
+        return _default_action_executor
@@ -1,36 +1,124 @@
-from typing import Any, Dict, List
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
 
-import tiktoken
 from langchain.callbacks.base import BaseCallbackHandler
 from langchain.schema import LLMResult
 
 from squadai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from squadai.agents.context_window import approximate_token_count
+
+
+class _LLMRun:
+    """State of one LLM call between its start and end callbacks."""
+
+    def __init__(self, prompts: List[str]) -> None:
+        self.prompts = prompts
+        self.started_at = time.perf_counter()
+        self.streamed_tokens = 0
 
 
 class TokenCalcHandler(BaseCallbackHandler):
+    """Accounts the tokens, requests and latency of LLM calls on a TokenProcess.
+
+    Token counts come from the usage the provider returns with the response.
+    Prompts are only tokenized locally, with tiktoken, for providers that do
+    not report usage, and the encoding is loaded on that first use.
+    """
+
     model_name: str = ""
     token_cost_process: TokenProcess
-    encoding: tiktoken.Encoding
+    # Cheap and thread-safe, so async runs call it directly instead of through an executor
+    run_inline = True
 
     def __init__(self, model_name, token_cost_process):
         self.model_name = model_name
         self.token_cost_process = token_cost_process
-        try:
-            self.encoding = tiktoken.encoding_for_model(self.model_name)
-        except KeyError:
-            self.encoding = tiktoken.get_encoding("cl100k_base")
+        self._encoding: Any = None
+        self._runs: Dict[Optional[UUID], _LLMRun] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def encoding(self):
+        if self._encoding is None:
+            import tiktoken
+
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.model_name)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+        return self._encoding
 
     def on_llm_start(
         self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any
     ) -> None:
+        with self._lock:
+            self._runs[kwargs.get("run_id")] = _LLMRun(prompts)
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        run = self._runs.get(kwargs.get("run_id"))
+        if run is not None:
+            run.streamed_tokens += 1
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        with self._lock:
+            run = self._runs.pop(kwargs.get("run_id"), None)
         if self.token_cost_process is None:
             return
 
-        for prompt in prompts:
-            self.token_cost_process.sum_prompt_tokens(len(self.encoding.encode(prompt)))
+        usage = self._provider_usage(response)
+        if usage is None and run is not None:
+            usage = self._local_usage(response, run)
+        if usage is not None:
+            self.token_cost_process.sum_prompt_tokens(usage[0])
+            self.token_cost_process.sum_completion_tokens(usage[1])
+        if run is not None:
+            self.token_cost_process.sum_latency(time.perf_counter() - run.started_at)
+        self.token_cost_process.sum_successful_requests(1)
 
-    async def on_llm_new_token(self, token: str, **kwargs) -> None:
-        self.token_cost_process.sum_completion_tokens(1)
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        with self._lock:
+            self._runs.pop(kwargs.get("run_id"), None)
 
-    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
-        self.token_cost_process.sum_successful_requests(1)
+    @staticmethod
+    def _provider_usage(response: LLMResult) -> Optional[Tuple[int, int]]:
+        """Prompt and completion tokens reported by the provider, if any."""
+        prompt_tokens = completion_tokens = 0
+        reported = False
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                if usage := getattr(message, "usage_metadata", None):
+                    prompt_tokens += usage.get("input_tokens", 0)
+                    completion_tokens += usage.get("output_tokens", 0)
+                    reported = True
+        if reported:
+            return prompt_tokens, completion_tokens
+
+        token_usage = (response.llm_output or {}).get("token_usage")
+        if token_usage:
+            return (
+                token_usage.get("prompt_tokens", 0),
+                token_usage.get("completion_tokens", 0),
+            )
+        return None
+
+    def _local_usage(self, response: LLMResult, run: _LLMRun) -> Tuple[int, int]:
+        prompt_tokens = sum(map(self._count_tokens, run.prompts))
+        completion_tokens = run.streamed_tokens or sum(
+            self._count_tokens(generation.text)
+            for generations in response.generations
+            for generation in generations
+        )
+        return prompt_tokens, completion_tokens
+
+    def _count_tokens(self, text: str) -> int:
+        if self._encoding is False:
+            return approximate_token_count(text)
+        try:
+            return len(self.encoding.encode(text))
+        except Exception:
+            # tiktoken downloads its encodings on first use, estimate when offline
+            self._encoding = False
+            return approximate_token_count(text)